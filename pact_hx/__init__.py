@@ -18,23 +18,46 @@ Provides two complementary aspects of human-AI interaction:
 Both are essential for human-centered AI systems.
 """
 
+from importlib import import_module
+
 from .version import __version__
 
-# Core primitives
-from .core.base_primitive import PACTPrimitive, PACTConfig
+# Public names mapped to the modules that define them. Layers are imported on
+# first attribute access, so importing one primitive does not pull in every
+# layer and its dependencies.
+_LAZY_IMPORTS = {
+    # Core primitives
+    "PACTPrimitive": ".core.base_primitive",
+    "PACTConfig": ".core.base_primitive",
+
+    # Personalization layer (existing work)
+    "AttentionManager": ".primitives.attention.manager",
+    "MemoryManager": ".primitives.memory.manager",
+    "ToneAdaptationManager": ".primitives.tone_adapt.manager",
+    "ValueAlignmentManager": ".primitives.value_align.manager",
+
+    # Expression layer (new work)
+    "ExpressionContext": ".expression.base",
+    "Domain": ".expression.base",
+    "CommunicationStyle": ".expression.base",
+    "ExpressionOrchestrator": ".expression.orchestrator",
+    "CustomerCareExpression": ".expression.customer_care",
+    "CustomerCareEscalation": ".expression.customer_care",
+    "MentalHealthExpression": ".expression.mental_health",
+    "TherapeuticSafety": ".expression.mental_health",
+    "VoiceAIExpression": ".expression.voice_ai",
+    "VoiceConfidenceIndicators": ".expression.voice_ai",
+}
+
 
-# Personalization layer (existing work)
-from .personalization.attention import AttentionManager
-from .personalization.memory import MemoryManager
-from .personalization.tone_adapt import ToneAdaptationManager
-from .personalization.value_align import ValueAlignmentManager
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Expression layer (new work)
-from .expression.base import ExpressionContext, Domain, CommunicationStyle
-from .expression.orchestrator import ExpressionOrchestrator
-from .expression.customer_care import CustomerCareExpression, CustomerCareEscalation
-from .expression.mental_health import MentalHealthExpression, TherapeuticSafety
-from .expression.voice_ai import VoiceAIExpression, VoiceConfidenceIndicators
 
 __all__ = [
     # Version
@@ -27,10 +27,17 @@ Integration Points:
 from typing import Dict, Any, List, Optional, Set, Tuple, Union, Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
+from collections import OrderedDict
+from itertools import chain, islice
+from types import MappingProxyType
 import time
 import uuid
 from datetime import datetime, timedelta
 import json
+import os
+
+import numpy as np
 
 # ==================== CORE ENUMS ====================
 
@@ -61,6 +68,10 @@ class ContextScope(Enum):
     UNIVERSAL = "universal"           # Universal human context
 
 
+# Scope ordering used for "adjacent scope" relevance checks
+_SCOPE_INDEX = {scope: i for i, scope in enumerate(ContextScope)}
+
+
 class ContextPriority(Enum):
     """Priority levels for different contextual factors"""
     CRITICAL = "critical"             # Must be considered immediately
@@ -70,6 +81,20 @@ class ContextPriority(Enum):
     IGNORE = "ignore"                 # Can be safely ignored
 
 
+# Relevance contribution of each priority level
+_PRIORITY_SCORES = {
+    ContextPriority.CRITICAL: 1.0,
+    ContextPriority.HIGH: 0.8,
+    ContextPriority.MEDIUM: 0.5,
+    ContextPriority.LOW: 0.2,
+    ContextPriority.IGNORE: 0.0
+}
+
+# Array form of _PRIORITY_SCORES, indexed by _PRIORITY_INDEX, for batch scoring
+_PRIORITY_INDEX = {priority: i for i, priority in enumerate(ContextPriority)}
+_PRIORITY_SCORE_TABLE = np.array([_PRIORITY_SCORES[p] for p in ContextPriority], dtype=np.float64)
+
+
 class ContextConfidence(Enum):
     """Confidence levels in contextual information"""
     CERTAIN = "certain"               # 0.9-1.0 confidence
@@ -124,8 +149,8 @@ class EmotionalContextType(Enum):
 @dataclass
 class ContextFactor:
     """Individual contextual element with rich metadata"""
+    type: ContextType  # Required, so it must precede the defaulted fields
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    type: ContextType
     subtype: str = ""  # Specific subtype (e.g., "time_of_day" for temporal)
     key: str = ""      # Specific factor name
     value: Any = None  # The actual contextual value
@@ -405,10 +430,15 @@ class ContextSnapshot:
     cognitive: CognitiveContext = field(default_factory=CognitiveContext)
     historical: HistoricalContext = field(default_factory=HistoricalContext)
     
-    # Individual context factors
-    context_factors: List[ContextFactor] = field(default_factory=list)
+    # Individual context factors (stored as a tuple so the cached factor
+    # indexes cannot go stale; assign a new sequence to change them)
+    context_factors: Tuple[ContextFactor, ...] = field(default_factory=tuple)
     
-    # Aggregate metrics
+    # Aggregate metrics (stored together in the _metrics array, see SNAPSHOT_METRICS)
+    _metrics: np.ndarray = field(
+        default_factory=lambda: np.zeros(len(SNAPSHOT_METRICS), dtype=np.float64),
+        init=False, repr=False, compare=False
+    )
     overall_context_quality: float = 0.0  # How rich/complete the context is
     context_confidence: float = 0.0  # Average confidence across factors
     context_stability: float = 0.0  # How stable/consistent the context is
@@ -430,6 +460,69 @@ class ContextSnapshot:
     context_delta: Dict[str, Any] = field(default_factory=dict)
     
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "context_factors":
+            value = tuple(value)
+            self.invalidate_factor_indexes()
+        super().__setattr__(name, value)
+    
+    def __copy__(self) -> "ContextSnapshot":
+        # A shallow copy must not share the metrics array with the original
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.__dict__["_metrics"] = self._metrics.copy()
+        return clone
+    
+    def invalidate_factor_indexes(self) -> None:
+        """Drop cached factor indexes; needed after changing a factor's fields in place"""
+        self.__dict__.pop("factor_index", None)
+        self.__dict__.pop("factors_by_priority", None)
+    
+    @cached_property
+    def factor_index(self) -> Dict[Tuple[ContextType, str], ContextFactor]:
+        """Highest-confidence factor for each (type, key), in first-seen order"""
+        index: Dict[Tuple[ContextType, str], ContextFactor] = {}
+        for factor in self.context_factors:
+            key = (factor.type, factor.key)
+            if key not in index or factor.confidence > index[key].confidence:
+                index[key] = factor
+        return index
+    
+    @cached_property
+    def factors_by_priority(self) -> Dict[ContextPriority, List[ContextFactor]]:
+        """Context factors grouped by priority, preserving factor order"""
+        groups: Dict[ContextPriority, List[ContextFactor]] = {p: [] for p in ContextPriority}
+        for factor in self.context_factors:
+            groups[factor.priority].append(factor)
+        return groups
+
+
+# Aggregate metrics of ContextSnapshot, in the column order of its _metrics array
+SNAPSHOT_METRICS = (
+    "overall_context_quality",
+    "context_confidence",
+    "context_stability",
+    "context_complexity",
+)
+
+
+def _snapshot_metric_property(index: int) -> property:
+    """Property exposing one column of ContextSnapshot._metrics as a float"""
+    def getter(self: ContextSnapshot) -> float:
+        return float(self._metrics[index])
+    
+    def setter(self: ContextSnapshot, value: float) -> None:
+        self._metrics[index] = value
+    
+    return property(getter, setter)
+
+
+# Back the aggregate metric fields with a single array so merging and anomaly
+# detection can stack snapshots directly instead of reading four attributes each
+for _index, _name in enumerate(SNAPSHOT_METRICS):
+    setattr(ContextSnapshot, _name, _snapshot_metric_property(_index))
+del _index, _name
 
 
 @dataclass
@@ -755,27 +848,72 @@ def create_context_change(
 
 # ==================== VALIDATION HELPERS ====================
 
+_bounds01_validators: Dict[Tuple[Tuple[str, str], ...], Callable[[Any], List[str]]] = {}
+
+
+def _make_bounds01_validator(fields: Tuple[Tuple[str, str], ...]) -> Callable[[Any], List[str]]:
+    """Generate (and cache) a validator checking that attributes lie within [0, 1]
+    
+    ``fields`` holds (attribute name, error message) pairs. The generated
+    function reads each attribute once into a local and returns the error
+    messages for out-of-range values, in field order.
+    """
+    validator = _bounds01_validators.get(fields)
+    if validator is not None:
+        return validator
+    
+    lines = ["def validate(obj):", "    errors = []"]
+    for i, (attribute, message) in enumerate(fields):
+        if not attribute.isidentifier():
+            raise ValueError(f"Invalid attribute name: {attribute!r}")
+        lines.append(f"    x{i} = obj.{attribute}")
+        lines.append(f"    if x{i} < 0 or x{i} > 1:")
+        lines.append(f"        errors.append({message!r})")
+    lines.append("    return errors")
+    
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    validator = namespace["validate"]
+    _bounds01_validators[fields] = validator
+    return validator
+
+
+_validate_factor_bounds = _make_bounds01_validator((
+    ("confidence", "Confidence must be between 0 and 1"),
+    ("influence_weight", "Influence weight must be between 0 and 1"),
+    ("reliability", "Reliability must be between 0 and 1"),
+    ("quality_score", "Quality score must be between 0 and 1"),
+))
+
+_validate_snapshot_bounds = _make_bounds01_validator((
+    ("overall_context_quality", "Overall context quality must be between 0 and 1"),
+    ("context_confidence", "Context confidence must be between 0 and 1"),
+    ("context_stability", "Context stability must be between 0 and 1"),
+    ("context_complexity", "Context complexity must be between 0 and 1"),
+))
+
+_validate_recommendation_bounds = _make_bounds01_validator((
+    ("confidence", "Confidence must be between 0 and 1"),
+))
+
+_validate_pattern_bounds = _make_bounds01_validator((
+    ("reliability", "Reliability must be between 0 and 1"),
+    ("predictive_power", "Predictive power must be between 0 and 1"),
+    ("confidence_level", "Confidence level must be between 0 and 1"),
+))
+
+
 def validate_context_factor(factor: ContextFactor) -> Tuple[bool, List[str]]:
     """Validate a ContextFactor for completeness and consistency"""
     errors = []
     
-    if not factor.key.strip():
+    if not factor.key or factor.key.isspace():
         errors.append("Context factor key is required")
     
     if factor.value is None:
         errors.append("Context factor value cannot be None")
     
-    if factor.confidence < 0 or factor.confidence > 1:
-        errors.append("Confidence must be between 0 and 1")
-    
-    if factor.influence_weight < 0 or factor.influence_weight > 1:
-        errors.append("Influence weight must be between 0 and 1")
-    
-    if factor.reliability < 0 or factor.reliability > 1:
-        errors.append("Reliability must be between 0 and 1")
-    
-    if factor.quality_score < 0 or factor.quality_score > 1:
-        errors.append("Quality score must be between 0 and 1")
+    errors.extend(_validate_factor_bounds(factor))
     
     if factor.staleness_tolerance < 0:
         errors.append("Staleness tolerance cannot be negative")
@@ -783,24 +921,35 @@ def validate_context_factor(factor: ContextFactor) -> Tuple[bool, List[str]]:
     return len(errors) == 0, errors
 
 
-def validate_context_snapshot(snapshot: ContextSnapshot) -> Tuple[bool, List[str]]:
-    """Validate a ContextSnapshot for completeness and consistency"""
-    errors = []
-    
-    if snapshot.overall_context_quality < 0 or snapshot.overall_context_quality > 1:
-        errors.append("Overall context quality must be between 0 and 1")
-    
-    if snapshot.context_confidence < 0 or snapshot.context_confidence > 1:
-        errors.append("Context confidence must be between 0 and 1")
-    
-    if snapshot.context_stability < 0 or snapshot.context_stability > 1:
-        errors.append("Context stability must be between 0 and 1")
+def validate_context_factor_fast(factor: ContextFactor) -> bool:
+    """Boolean-only ContextFactor validation that bails on the first issue"""
+    return (
+        bool(factor.key) and not factor.key.isspace()
+        and factor.value is not None
+        and factor.staleness_tolerance >= 0
+        and not _validate_factor_bounds(factor)
+    )
+
+
+def validate_context_snapshot(snapshot: ContextSnapshot, fast_path: bool = False) -> Tuple[bool, List[str]]:
+    """Validate a ContextSnapshot for completeness and consistency
     
-    if snapshot.context_complexity < 0 or snapshot.context_complexity > 1:
-        errors.append("Context complexity must be between 0 and 1")
+    With ``fast_path=True`` validation stops at the first failure, so the
+    returned error list holds at most one entry. Use it when only the
+    boolean result matters.
+    """
+    errors = _validate_snapshot_bounds(snapshot)
+    if fast_path and errors:
+        return False, errors[:1]
     
     # Validate individual context factors
     for factor in snapshot.context_factors:
+        if fast_path:
+            if not validate_context_factor_fast(factor):
+                _, factor_errors = validate_context_factor(factor)
+                return False, [f"Factor {factor.key}: {factor_errors[0]}"]
+            continue
+        
         factor_valid, factor_errors = validate_context_factor(factor)
         if not factor_valid:
             errors.extend([f"Factor {factor.key}: {error}" for error in factor_errors])
@@ -812,17 +961,16 @@ def validate_contextual_recommendation(rec: ContextualRecommendation) -> Tuple[b
     """Validate a ContextualRecommendation for completeness"""
     errors = []
     
-    if not rec.target_primitive.strip():
+    if not rec.target_primitive or rec.target_primitive.isspace():
         errors.append("Target primitive is required")
     
-    if not rec.title.strip():
+    if not rec.title or rec.title.isspace():
         errors.append("Recommendation title is required")
     
-    if not rec.description.strip():
+    if not rec.description or rec.description.isspace():
         errors.append("Recommendation description is required")
     
-    if rec.confidence < 0 or rec.confidence > 1:
-        errors.append("Confidence must be between 0 and 1")
+    errors.extend(_validate_recommendation_bounds(rec))
     
     if rec.effectiveness_score is not None and (rec.effectiveness_score < 0 or rec.effectiveness_score > 1):
         errors.append("Effectiveness score must be between 0 and 1")
@@ -834,20 +982,13 @@ def validate_context_pattern(pattern: ContextPattern) -> Tuple[bool, List[str]]:
     """Validate a ContextPattern for consistency"""
     errors = []
     
-    if not pattern.name.strip():
+    if not pattern.name or pattern.name.isspace():
         errors.append("Pattern name is required")
     
-    if not pattern.description.strip():
+    if not pattern.description or pattern.description.isspace():
         errors.append("Pattern description is required")
     
-    if pattern.reliability < 0 or pattern.reliability > 1:
-        errors.append("Reliability must be between 0 and 1")
-    
-    if pattern.predictive_power < 0 or pattern.predictive_power > 1:
-        errors.append("Predictive power must be between 0 and 1")
-    
-    if pattern.confidence_level < 0 or pattern.confidence_level > 1:
-        errors.append("Confidence level must be between 0 and 1")
+    errors.extend(_validate_pattern_bounds(pattern))
     
     if pattern.observation_count < 0:
         errors.append("Observation count cannot be negative")
@@ -869,25 +1010,35 @@ def calculate_context_staleness(factor: ContextFactor, current_time: Optional[fl
     return staleness
 
 
+def calculate_context_staleness_batch(
+    factors: List[ContextFactor],
+    current_time: Optional[float] = None
+) -> np.ndarray:
+    """Vectorized calculate_context_staleness that reads the clock only once"""
+    current_time = current_time or time.time()
+    count = len(factors)
+    
+    timestamps = np.fromiter((f.timestamp for f in factors), dtype=np.float64, count=count)
+    tolerances = np.fromiter((f.staleness_tolerance for f in factors), dtype=np.float64, count=count)
+    
+    # Never stale if no tolerance set
+    has_tolerance = tolerances > 0
+    staleness = np.minimum((current_time - timestamps) / np.where(has_tolerance, tolerances, 1.0), 1.0)
+    return np.where(has_tolerance, staleness, 0.0)
+
+
 def calculate_context_relevance(factor: ContextFactor, target_context: Dict[str, Any]) -> float:
     """Calculate how relevant a context factor is to a target context"""
     relevance_score = 0.0
     
     # Priority-based relevance
-    priority_scores = {
-        ContextPriority.CRITICAL: 1.0,
-        ContextPriority.HIGH: 0.8,
-        ContextPriority.MEDIUM: 0.5,
-        ContextPriority.LOW: 0.2,
-        ContextPriority.IGNORE: 0.0
-    }
-    relevance_score += priority_scores.get(factor.priority, 0.5) * 0.4
+    relevance_score += _PRIORITY_SCORES.get(factor.priority, 0.5) * 0.4
     
     # Scope-based relevance
     target_scope = target_context.get("scope", ContextScope.SESSION)
     if factor.scope == target_scope:
         relevance_score += 0.3
-    elif abs(list(ContextScope).index(factor.scope) - list(ContextScope).index(target_scope)) <= 1:
+    elif abs(_SCOPE_INDEX[factor.scope] - _SCOPE_INDEX[target_scope]) <= 1:
         relevance_score += 0.15
     
     # Type-based relevance
@@ -898,6 +1049,57 @@ def calculate_context_relevance(factor: ContextFactor, target_context: Dict[str,
     return min(relevance_score, 1.0)
 
 
+def calculate_context_relevance_batch(
+    factors: List[ContextFactor],
+    target_context: Dict[str, Any]
+) -> np.ndarray:
+    """Vectorized calculate_context_relevance over many factors at once
+    
+    Returns an array of relevance scores aligned with ``factors``.
+    """
+    count = len(factors)
+    if count == 0:
+        return np.zeros(0, dtype=np.float64)
+    
+    target_scope = _SCOPE_INDEX[target_context.get("scope", ContextScope.SESSION)]
+    target_types = set(target_context.get("relevant_types", []))
+    
+    priorities = np.fromiter((_PRIORITY_INDEX[f.priority] for f in factors), dtype=np.intp, count=count)
+    scopes = np.fromiter((_SCOPE_INDEX[f.scope] for f in factors), dtype=np.intp, count=count)
+    type_matches = np.fromiter((f.type in target_types for f in factors), dtype=bool, count=count)
+    
+    # Priority-based relevance
+    relevance = _PRIORITY_SCORE_TABLE[priorities] * 0.4
+    
+    # Scope-based relevance
+    relevance += np.where(scopes == target_scope, 0.3,
+                          np.where(np.abs(scopes - target_scope) <= 1, 0.15, 0.0))
+    
+    # Type-based relevance
+    relevance += type_matches * 0.3
+    
+    return np.minimum(relevance, 1.0)
+
+
+def _fold_factor_index(
+    accumulated: Dict[Tuple[ContextType, str], ContextFactor],
+    index: Dict[Tuple[ContextType, str], ContextFactor]
+) -> None:
+    """Fold one snapshot's factor index into the merge accumulator in place"""
+    if not index:
+        return
+    
+    # No overlapping keys: nothing to compare, take the whole delta at once
+    if accumulated.keys().isdisjoint(index):
+        accumulated.update(index)
+        return
+    
+    for key, factor in index.items():
+        current = accumulated.get(key)
+        if current is None or factor.confidence > current.confidence:
+            accumulated[key] = factor
+
+
 def merge_context_snapshots(snapshots: List[ContextSnapshot], weights: Optional[List[float]] = None) -> ContextSnapshot:
     """Merge multiple context snapshots into a single comprehensive snapshot"""
     if not snapshots:
@@ -906,33 +1108,33 @@ def merge_context_snapshots(snapshots: List[ContextSnapshot], weights: Optional[
     if len(snapshots) == 1:
         return snapshots[0]
     
-    weights = weights or [1.0] * len(snapshots)
-    total_weight = sum(weights)
-    
-    # Normalize weights
-    weights = [w / total_weight for w in weights]
+    # Normalize weights, falling back to equal weights when they sum to zero
+    w = np.asarray(weights or [1.0] * len(snapshots), dtype=np.float64)
+    total = w.sum()
+    if total == 0:
+        w = np.full(len(w), 1.0 / len(w))
+    else:
+        w /= total
     
     merged = ContextSnapshot()
     
-    # Merge aggregate metrics using weighted averages
-    merged.overall_context_quality = sum(s.overall_context_quality * w for s, w in zip(snapshots, weights))
-    merged.context_confidence = sum(s.context_confidence * w for s, w in zip(snapshots, weights))
-    merged.context_stability = sum(s.context_stability * w for s, w in zip(snapshots, weights))
-    merged.context_complexity = sum(s.context_complexity * w for s, w in zip(snapshots, weights))
+    # Merge aggregate metrics using weighted averages (extra snapshots or
+    # weights beyond the shorter of the two lists are ignored)
+    count = min(len(snapshots), len(w))
+    merged._metrics[:] = w[:count] @ np.stack([s._metrics for s in snapshots[:count]])
     
-    # Collect all context factors
-    all_factors = []
+    # Remove duplicates based on key, keeping highest confidence; each snapshot's
+    # index is already deduplicated, so only cross-snapshot conflicts remain.
+    # A snapshot object repeated in the list can never win a conflict.
+    factor_map: Dict[Tuple[ContextType, str], ContextFactor] = {}
+    folded_ids = set()
     for snapshot in snapshots:
-        all_factors.extend(snapshot.context_factors)
+        if id(snapshot) in folded_ids:
+            continue
+        folded_ids.add(id(snapshot))
+        _fold_factor_index(factor_map, snapshot.factor_index)
     
-    # Remove duplicates based on key, keeping highest confidence
-    factor_map = {}
-    for factor in all_factors:
-        key = f"{factor.type.value}:{factor.key}"
-        if key not in factor_map or factor.confidence > factor_map[key].confidence:
-            factor_map[key] = factor
-    
-    merged.context_factors = list(factor_map.values())
+    merged.context_factors = tuple(factor_map.values())
     
     # Merge situational summary
     summaries = [s.situation_summary for s in snapshots if s.situation_summary]
@@ -951,61 +1153,203 @@ def merge_context_snapshots(snapshots: List[ContextSnapshot], weights: Optional[
     return merged
 
 
-def detect_context_anomalies(current: ContextSnapshot, historical: List[ContextSnapshot]) -> List[Dict[str, Any]]:
-    """Detect anomalies in current context compared to historical patterns"""
+# Metrics tracked for anomaly detection, as (anomaly type, snapshot attribute)
+ANOMALY_METRICS = (
+    ("context_quality_anomaly", "overall_context_quality"),
+    ("context_confidence_anomaly", "context_confidence"),
+    ("context_stability_anomaly", "context_stability"),
+)
+_ANOMALY_METRIC_COLUMNS = [SNAPSHOT_METRICS.index(attr) for _, attr in ANOMALY_METRICS]
+ANOMALY_MIN_SAMPLES = 30  # Below this, std estimates are too noisy to trust
+ANOMALY_ABSOLUTE_THRESHOLD = 0.3  # Fallback 30% deviation threshold
+ANOMALY_ABSOLUTE_HIGH_SEVERITY = 0.5
+
+
+@dataclass
+class ContextAnomalyBaseline:
+    """Rolling mean/variance of snapshot metrics for streaming anomaly detection
+
+    Maintained incrementally with Welford's online algorithm so each update is
+    O(1) instead of rescanning the full history on every check.
+    """
+    n: int = 0
+    mean: List[float] = field(default_factory=lambda: [0.0] * len(ANOMALY_METRICS))
+    M2: List[float] = field(default_factory=lambda: [0.0] * len(ANOMALY_METRICS))
+    z_threshold: float = 2.0  # Standard deviations before a value is anomalous
+    z_high_severity: float = 3.0
+
+    def update(self, snapshot: ContextSnapshot) -> None:
+        """Fold a snapshot's metrics into the running baseline"""
+        self.n += 1
+        for i, (_, attr) in enumerate(ANOMALY_METRICS):
+            value = getattr(snapshot, attr)
+            delta = value - self.mean[i]
+            self.mean[i] += delta / self.n
+            self.M2[i] += delta * (value - self.mean[i])
+
+    def std(self) -> List[float]:
+        """Population standard deviation of each tracked metric"""
+        if self.n == 0:
+            return [0.0] * len(ANOMALY_METRICS)
+        return [(m2 / self.n) ** 0.5 for m2 in self.M2]
+
+    def check(self, current: ContextSnapshot) -> List[Dict[str, Any]]:
+        """Detect anomalies in a snapshot relative to this baseline"""
+        if self.n == 0:
+            return []
+        return _collect_anomalies(
+            current, self.mean, self.std(), self.n,
+            self.z_threshold, self.z_high_severity
+        )
+
+
+def _collect_anomalies(
+    current: ContextSnapshot,
+    means: List[float],
+    stds: List[float],
+    sample_count: int,
+    z_threshold: float = 2.0,
+    z_high_severity: float = 3.0
+) -> List[Dict[str, Any]]:
+    """Compare current metrics against baseline statistics
+
+    Uses a std-based (z-score) threshold once enough samples exist, and the
+    fixed absolute deviation threshold otherwise.
+    """
     anomalies = []
+    use_std = sample_count >= ANOMALY_MIN_SAMPLES
+    
+    for (anomaly_type, attr), expected, std in zip(ANOMALY_METRICS, means, stds):
+        current_value = getattr(current, attr)
+        deviation = abs(current_value - expected)
+        
+        if use_std and std > 0:
+            is_anomaly = deviation > z_threshold * std
+            is_high = deviation > z_high_severity * std
+        else:
+            is_anomaly = deviation > ANOMALY_ABSOLUTE_THRESHOLD
+            is_high = deviation > ANOMALY_ABSOLUTE_HIGH_SEVERITY
+        
+        if is_anomaly:
+            anomalies.append({
+                "type": anomaly_type,
+                "current_value": current_value,
+                "expected_value": float(expected),
+                "deviation": float(deviation),
+                "severity": "high" if is_high else "medium"
+            })
+    
+    return anomalies
+
+
+def detect_context_anomalies(
+    current: ContextSnapshot,
+    historical: Union[List[ContextSnapshot], ContextAnomalyBaseline]
+) -> List[Dict[str, Any]]:
+    """Detect anomalies in current context compared to historical patterns
+
+    ``historical`` may be a list of snapshots or a ContextAnomalyBaseline
+    maintained incrementally by the caller.
+    """
+    if isinstance(historical, ContextAnomalyBaseline):
+        return historical.check(current)
     
     if not historical:
-        return anomalies
-    
-    # Calculate historical averages for key metrics
-    historical_quality = [s.overall_context_quality for s in historical]
-    historical_confidence = [s.context_confidence for s in historical]
-    historical_stability = [s.context_stability for s in historical]
-    
-    avg_quality = sum(historical_quality) / len(historical_quality)
-    avg_confidence = sum(historical_confidence) / len(historical_confidence)
-    avg_stability = sum(historical_stability) / len(historical_stability)
-    
-    # Check for significant deviations
-    quality_deviation = abs(current.overall_context_quality - avg_quality)
-    confidence_deviation = abs(current.context_confidence - avg_confidence)
-    stability_deviation = abs(current.context_stability - avg_stability)
-    
-    anomaly_threshold = 0.3  # 30% deviation threshold
-    
-    if quality_deviation > anomaly_threshold:
-        anomalies.append({
-            "type": "context_quality_anomaly",
-            "current_value": current.overall_context_quality,
-            "expected_value": avg_quality,
-            "deviation": quality_deviation,
-            "severity": "high" if quality_deviation > 0.5 else "medium"
-        })
-    
-    if confidence_deviation > anomaly_threshold:
-        anomalies.append({
-            "type": "context_confidence_anomaly",
-            "current_value": current.context_confidence,
-            "expected_value": avg_confidence,
-            "deviation": confidence_deviation,
-            "severity": "high" if confidence_deviation > 0.5 else "medium"
-        })
-    
-    if stability_deviation > anomaly_threshold:
-        anomalies.append({
-            "type": "context_stability_anomaly",
-            "current_value": current.context_stability,
-            "expected_value": avg_stability,
-            "deviation": stability_deviation,
-            "severity": "high" if stability_deviation > 0.5 else "medium"
-        })
+        return []
     
-    return anomalies
+    # Calculate historical statistics for key metrics in one vectorized pass
+    values = np.stack([s._metrics for s in historical])[:, _ANOMALY_METRIC_COLUMNS]
+    
+    return _collect_anomalies(
+        current, values.mean(axis=0).tolist(), values.std(axis=0).tolist(), len(historical)
+    )
+
+
+# LRU cache of generated insights keyed by the snapshot fields they depend on
+_INSIGHTS_CACHE_MAXSIZE = 512
+_insights_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+
+
+def _insights_cache_key(snapshot: ContextSnapshot) -> Tuple[Any, ...]:
+    """Build the cache key for generate_context_insights
+    
+    The key holds the content the insights are built from rather than the
+    snapshot id, so in-place changes to a snapshot or its factors can never
+    return stale insights. Insights read only the type, key and priority of
+    each factor.
+    """
+    return (
+        snapshot.overall_context_quality,
+        snapshot.cognitive.attention_state,
+        snapshot.temporal.time_pressure_level,
+        snapshot.cognitive.cognitive_load,
+        snapshot.social.social_battery_level,
+        snapshot.social.team_dynamics,
+        snapshot.temporal.energy_cycle_phase,
+        snapshot.temporal.next_commitment_minutes,
+        snapshot.emotional.stress_level,
+        snapshot.emotional.motivation_level,
+        tuple((f.type, f.key, f.priority) for f in snapshot.context_factors),
+    )
+
+
+def invalidate_insights() -> None:
+    """Drop all cached insights, e.g. to release memory"""
+    _insights_cache.clear()
 
 
 def generate_context_insights(snapshot: ContextSnapshot) -> Dict[str, Any]:
-    """Generate insights from a context snapshot"""
+    """Generate insights from a context snapshot
+    
+    Results are memoized per snapshot content; callers receive their own copy.
+    """
+    key = _insights_cache_key(snapshot)
+    insights = _insights_cache.get(key)
+    
+    if insights is None:
+        insights = _build_context_insights(snapshot)
+        _insights_cache[key] = insights
+        if len(_insights_cache) > _INSIGHTS_CACHE_MAXSIZE:
+            _insights_cache.popitem(last=False)
+    else:
+        _insights_cache.move_to_end(key)
+    
+    return {k: list(v) if isinstance(v, list) else v for k, v in insights.items()}
+
+
+# Declarative insight rules: (insights section, snapshot component, attribute,
+# {attribute value: message}). Rules are applied in order.
+_INSIGHT_RULES = (
+    ("attention_recommendations", "cognitive", "attention_state", {
+        "scattered": "Consider focused work techniques to improve concentration",
+    }),
+    ("attention_recommendations", "temporal", "time_pressure_level", {
+        "urgent": "Prioritize critical tasks given time pressure",
+    }),
+    ("attention_recommendations", "cognitive", "cognitive_load", {
+        "overloaded": "Reduce cognitive load by simplifying current tasks",
+    }),
+    ("collaboration_insights", "social", "social_battery_level", {
+        "low": "Consider asynchronous collaboration to preserve social energy",
+    }),
+    ("collaboration_insights", "social", "team_dynamics", {
+        "collaborative": "Good opportunity for group brainstorming or team decision-making",
+    }),
+    ("timing_insights", "temporal", "energy_cycle_phase", {
+        "peak": "Optimal time for challenging or creative work",
+    }),
+    ("mood_context_notes", "emotional", "stress_level", {
+        "high": "High stress detected - consider stress reduction techniques",
+        "overwhelming": "High stress detected - consider stress reduction techniques",
+    }),
+    ("mood_context_notes", "emotional", "motivation_level", {
+        "very_high": "High motivation - good opportunity for ambitious goals",
+    }),
+)
+
+
+def _build_context_insights(snapshot: ContextSnapshot) -> Dict[str, Any]:
+    """Compute insights for generate_context_insights"""
     insights = {
         "primary_context_drivers": [],
         "context_quality_assessment": "",
@@ -1016,8 +1360,11 @@ def generate_context_insights(snapshot: ContextSnapshot) -> Dict[str, Any]:
     }
     
     # Identify primary context drivers
-    high_priority_factors = [f for f in snapshot.context_factors if f.priority == ContextPriority.CRITICAL or f.priority == ContextPriority.HIGH]
-    insights["primary_context_drivers"] = [f"{f.type.value}: {f.key}" for f in high_priority_factors[:5]]
+    by_priority = snapshot.factors_by_priority
+    high_priority_factors = islice(
+        chain(by_priority[ContextPriority.CRITICAL], by_priority[ContextPriority.HIGH]), 5
+    )
+    insights["primary_context_drivers"] = [f"{f.type.value}: {f.key}" for f in high_priority_factors]
     
     # Assess context quality
     if snapshot.overall_context_quality > 0.8:
@@ -1029,43 +1376,21 @@ def generate_context_insights(snapshot: ContextSnapshot) -> Dict[str, Any]:
     else:
         insights["context_quality_assessment"] = "Poor context understanding, high uncertainty"
     
-    # Generate attention recommendations based on context
-    if snapshot.cognitive.attention_state == "scattered":
-        insights["attention_recommendations"].append("Consider focused work techniques to improve concentration")
-    
-    if snapshot.temporal.time_pressure_level == "urgent":
-        insights["attention_recommendations"].append("Prioritize critical tasks given time pressure")
-    
-    if snapshot.cognitive.cognitive_load == "overloaded":
-        insights["attention_recommendations"].append("Reduce cognitive load by simplifying current tasks")
-    
-    # Generate collaboration insights
-    if snapshot.social.social_battery_level == "low":
-        insights["collaboration_insights"].append("Consider asynchronous collaboration to preserve social energy")
-    
-    if snapshot.social.team_dynamics == "collaborative":
-        insights["collaboration_insights"].append("Good opportunity for group brainstorming or team decision-making")
-    
-    # Generate timing insights
-    if snapshot.temporal.energy_cycle_phase == "peak":
-        insights["timing_insights"].append("Optimal time for challenging or creative work")
+    # Generate attention, collaboration, timing and mood insights from the rule table
+    for section, component, attribute, messages in _INSIGHT_RULES:
+        message = messages.get(getattr(getattr(snapshot, component), attribute))
+        if message:
+            insights[section].append(message)
     
     if snapshot.temporal.next_commitment_minutes and snapshot.temporal.next_commitment_minutes < 30:
         insights["timing_insights"].append("Limited time available before next commitment")
     
-    # Generate mood context notes
-    if snapshot.emotional.stress_level in ["high", "overwhelming"]:
-        insights["mood_context_notes"].append("High stress detected - consider stress reduction techniques")
-    
-    if snapshot.emotional.motivation_level == "very_high":
-        insights["mood_context_notes"].append("High motivation - good opportunity for ambitious goals")
-    
     return insights
 
 
 # ==================== SCHEMA REGISTRY ====================
 
-CONTEXT_SCHEMA_REGISTRY = {
+_CONTEXT_SCHEMA_REGISTRY_RAW = {
     "ContextFactor": ContextFactor,
     "EnvironmentalContext": EnvironmentalContext,
     "SocialContext": SocialContext,
@@ -1081,6 +1406,9 @@ CONTEXT_SCHEMA_REGISTRY = {
     "ContextMetrics": ContextMetrics,
 }
 
+# Read-only view; the registry is fixed at import time
+CONTEXT_SCHEMA_REGISTRY = MappingProxyType(_CONTEXT_SCHEMA_REGISTRY_RAW)
+
 # Export all schemas for easy importing
 __all__ = [
     # Enums
@@ -1091,7 +1419,7 @@ __all__ = [
     "ContextFactor", "EnvironmentalContext", "SocialContext", "TemporalContext",
     "TaskContext", "EmotionalContext", "CognitiveContext", "HistoricalContext",
     "ContextSnapshot", "ContextPattern", "ContextChange", "ContextualRecommendation",
-    "ContextMetrics",
+    "ContextMetrics", "SNAPSHOT_METRICS",
     
     # Helper Functions
     "create_context_factor", "create_environmental_context", "create_social_context",
@@ -1100,18 +1428,21 @@ __all__ = [
     "create_context_pattern", "create_context_change",
     
     # Validation Functions
-    "validate_context_factor", "validate_context_snapshot", 
+    "validate_context_factor", "validate_context_factor_fast", "validate_context_snapshot",
     "validate_contextual_recommendation", "validate_context_pattern",
     
     # Utility Functions
-    "calculate_context_staleness", "calculate_context_relevance", 
+    "calculate_context_staleness", "calculate_context_staleness_batch",
+    "calculate_context_relevance", "calculate_context_relevance_batch",
     "merge_context_snapshots", "detect_context_anomalies", "generate_context_insights",
+    "ContextAnomalyBaseline", "invalidate_insights",
     
     # Registry
     "CONTEXT_SCHEMA_REGISTRY"
 ]
 
-if __name__ == "__main__":
+# Set PACT_HX_DEMO=1 to run the demo when executing this file directly
+if __name__ == "__main__" and os.getenv("PACT_HX_DEMO"):
     print("🌍 Context Manager Schemas Loaded!")
     print(f"📊 {len(CONTEXT_SCHEMA_REGISTRY)} schema types available")
     print("🧠 Complete situational intelligence architecture ready!")
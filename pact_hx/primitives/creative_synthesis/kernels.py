@@ -0,0 +1,58 @@
+# pact_hx/primitives/creative_synthesis/kernels.py
+"""
+PACT Creative Synthesis Numeric Kernels
+
+Loop kernels shared by the creative synthesis manager and schemas, compiled
+with numba when it is installed and run as plain Python otherwise.
+
+This module must stay pure Python: schemas.py may be compiled with Cython
+(see setup.py), and numba cannot JIT functions defined in a compiled module.
+Callers check NUMBA_AVAILABLE and keep their NumPy path for small inputs,
+where dispatching to a compiled kernel costs more than it saves.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; without it the kernels run as plain Python
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def mean_engagement(values: np.ndarray) -> float:
+    """Mean of engagement scores, or a neutral 0.5 when there is no history"""
+    count = values.shape[0]
+    if count == 0:
+        return 0.5
+    total = 0.0
+    for i in range(count):
+        total += values[i]
+    return total / count
+
+
+@njit(cache=True, parallel=True)
+def engagement_kernel(factor_counts: np.ndarray, modality_counts: np.ndarray,
+                      creativity_levels: np.ndarray, boost: np.ndarray) -> np.ndarray:
+    """Engagement potential over many candidates in one pass
+
+    creativity_levels must already be valid indexes into boost; the compiled
+    loop does no bounds checking.
+    """
+    out = np.empty(factor_counts.shape[0])
+    for i in prange(factor_counts.shape[0]):
+        out[i] = min(
+            1.0,
+            0.5 + factor_counts[i] * 0.1 + modality_counts[i] * 0.05 + boost[creativity_levels[i]]
+        )
+    return out
+
+
+__all__ = ["NUMBA_AVAILABLE", "mean_engagement", "engagement_kernel"]
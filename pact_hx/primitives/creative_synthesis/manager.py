@@ -48,16 +48,151 @@ Integration with PACT Ecosystem:
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple, Union
-from dataclasses import dataclass, field
+from array import array
+from typing import Callable, Dict, Hashable, List, Mapping, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache, partial
+from operator import attrgetter
+from collections import OrderedDict, defaultdict
+import copy
+import hashlib
+import heapq
 import json
 import random
 from datetime import datetime
 import logging
+from statistics import fmean
+import sys
+import time
+from types import MappingProxyType
+
+import numpy as np
+
+from .kernels import mean_engagement
 
 logger = logging.getLogger(__name__)
 
+ANALYSIS_CACHE_MAX_SIZE = 512
+
+# Per-experience effectiveness metrics, in storage column order
+EFFECTIVENESS_METRICS = (
+    'engagement_level',
+    'learning_achievement',
+    'creative_expression',
+    'retention_prediction',
+    'student_satisfaction'
+)
+
+# Retention prediction weights for engagement, creative expression and
+# learning achievement
+RETENTION_WEIGHTS = (0.4, 0.3, 0.3)
+
+# Goal Primitive objective analyses are reused for up to an hour
+GOAL_ANALYSIS_CACHE_MAX_SIZE = 1024
+GOAL_ANALYSIS_TTL_SECONDS = 3600
+
+# Collaborator requests arriving within this window are sent as one batch
+COLLABORATOR_BATCH_MAX_SIZE = 32
+COLLABORATOR_BATCH_WINDOW_SECONDS = 0.01
+
+# Common words ignored when extracting key concepts
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+# Trigger words that mark an objective as a given learning type, in report order
+LEARNING_TYPE_TRIGGERS = (
+    ('conceptual', ('understand', 'explain', 'describe')),
+    ('procedural', ('solve', 'calculate', 'apply')),
+    ('creative', ('create', 'design', 'build')),
+    ('critical_thinking', ('analyze', 'evaluate', 'compare')),
+)
+
+
+def _fingerprint(*parts: Any) -> str:
+    """Stable hash of JSON-serializable inputs, used as a cache key"""
+    payload = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _lru_get(cache: OrderedDict, key: Hashable) -> Any:
+    """Look up a key in an LRU cache, marking it as recently used"""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _lru_put(cache: OrderedDict, key: Hashable, value: Any, max_size: int = ANALYSIS_CACHE_MAX_SIZE) -> None:
+    """Store a value in an LRU cache, evicting the least recently used entry"""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+
+
+class _MicroBatcher:
+    """Coalesce single requests made within a short window into one batched call
+    
+    batch_fn takes a list of items and returns a list of results in the same order.
+    """
+    
+    def __init__(
+        self,
+        batch_fn: Callable,
+        max_size: int = COLLABORATOR_BATCH_MAX_SIZE,
+        window: float = COLLABORATOR_BATCH_WINDOW_SECONDS
+    ):
+        self._batch_fn = batch_fn
+        self._max_size = max_size
+        self._window = window
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Strong references keep in-flight dispatches from being garbage collected
+        self._tasks: set = set()
+    
+    def submit(self, item: Any) -> asyncio.Future:
+        """Queue an item; the returned future resolves to its result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self._max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return future
+    
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self._batch_fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch returned {len(results)} results for {len(batch)} requests")
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancellation or other BaseExceptions must not leave callers waiting
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class CreativeModality(Enum):
     """Different creative approaches available"""
@@ -81,7 +216,7 @@ class LearningStyle(Enum):
     SOLITARY = "solitary"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class CreativeHook:
     """A creative element that captures imagination"""
     type: CreativeModality
@@ -90,12 +225,31 @@ class CreativeHook:
     engagement_score: float
     learning_alignment: float
     implementation_complexity: int  # 1-10 scale
-    materials_needed: List[str] = field(default_factory=list)
+    materials_needed: Tuple[str, ...] = ()
     time_estimate: int = 0  # minutes
     age_appropriateness: Tuple[int, int] = (5, 18)  # min, max age
+    
+    @property
+    def score(self) -> float:
+        """Engagement potential used to rank hooks"""
+        return self.engagement_score * self.learning_alignment
+
 
+# Shared template for surprise hooks; only the description varies per objective
+_SURPRISE_HOOK_PROTOTYPE = CreativeHook(
+    type=CreativeModality.SURPRISE,
+    title="The Unexpected Connection",
+    description="",
+    engagement_score=0.7,
+    learning_alignment=0.6,
+    implementation_complexity=4,
+    materials_needed=("surprise_reveal_materials",),
+    time_estimate=15,
+    age_appropriateness=(8, 18)
+)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class LearningExperience:
     """A complete creative learning experience"""
     title: str
@@ -109,10 +263,10 @@ class LearningExperience:
     multi_sensory_components: Dict[str, Any]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StudentCreativeProfile:
     """Student's creative preferences and response patterns"""
-    preferred_modalities: List[CreativeModality]
+    preferred_modalities: Tuple[CreativeModality, ...]  # Stored as a tuple, see __setattr__
     learning_styles: List[LearningStyle]
     engagement_history: Dict[str, float]
     creative_strengths: List[str]
@@ -120,6 +274,357 @@ class StudentCreativeProfile:
     interest_themes: List[str]
     attention_span: int  # minutes
     collaboration_preference: str  # "individual", "small_group", "large_group"
+    _modalities_display: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Modalities are frozen on assignment, so assignment is the only way
+        # they change and the only place the cached display needs dropping
+        if name == 'preferred_modalities':
+            value = tuple(value)
+            object.__setattr__(self, '_modalities_display', None)
+        object.__setattr__(self, name, value)
+    
+    def preferred_modalities_display(self) -> str:
+        """Comma-separated preferred modality names, cached until the modalities are reassigned"""
+        display = self._modalities_display
+        if display is None:
+            display = self._modalities_display = ', '.join(m.value for m in self.preferred_modalities)
+        return display
+    
+    def engagement_values(self) -> np.ndarray:
+        """Engagement scores as an array for NumPy and kernel reductions
+        
+        Built on every call: the history is a mutable dict, so checking a
+        cached copy would cost as much as rebuilding it.
+        """
+        history = self.engagement_history
+        return np.fromiter(history.values(), dtype=np.float64, count=len(history))
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples,
+    interning strings so table lookups compare by identity"""
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+# Static creative tables, shared read-only by every CreativeSynthesisManager
+
+# Patterns for different creative approaches
+CREATIVE_PATTERNS = _freeze({
+    "story_structures": [
+        {
+            "name": "Hero's Journey Learning",
+            "template": "student_as_hero",
+            "phases": ["call_to_adventure", "mentorship", "challenges", "revelation", "return"],
+            "best_for": ["complex_concepts", "skill_development", "character_building"]
+        },
+        {
+            "name": "Mystery Investigation",
+            "template": "detective_story",
+            "phases": ["problem_discovery", "clue_gathering", "hypothesis", "testing", "solution"],
+            "best_for": ["scientific_method", "critical_thinking", "research_skills"]
+        },
+        {
+            "name": "Time Travel Adventure",
+            "template": "temporal_exploration",
+            "phases": ["departure", "historical_immersion", "interaction", "learning", "return"],
+            "best_for": ["history", "cause_effect", "cultural_understanding"]
+        }
+    ],
+    "metaphor_categories": {
+        "nature": ["ecosystem", "seasons", "weather", "animals", "plants"],
+        "technology": ["machines", "networks", "computers", "tools"],
+        "sports": ["teamwork", "strategy", "competition", "training"],
+        "cooking": ["recipes", "ingredients", "processes", "flavors"],
+        "building": ["foundation", "structure", "tools", "blueprints"],
+        "journey": ["paths", "destinations", "obstacles", "companions"]
+    },
+    "game_elements": [
+        "quests", "levels", "achievements", "leaderboards", "collaboration",
+        "resource_management", "strategy", "puzzles", "exploration", "creation"
+    ]
+})
+
+# Story frameworks for different learning scenarios
+STORY_TEMPLATES = _freeze({
+    "concept_introduction": {
+        "opening": "In a world where {concept} holds the key to {benefit}...",
+        "conflict": "But understanding {concept} requires overcoming {challenge}...",
+        "resolution": "Through {learning_method}, our heroes discover {insight}..."
+    },
+    "skill_building": {
+        "opening": "Every master of {skill} began as an apprentice...",
+        "journey": "Through practice, mistakes, and gradual improvement...",
+        "mastery": "Until one day, {skill} becomes second nature..."
+    },
+    "problem_solving": {
+        "setup": "A puzzling situation emerges: {problem}",
+        "investigation": "Our team of investigators uses {method} to explore...",
+        "breakthrough": "The aha moment arrives when we realize {solution}..."
+    }
+})
+
+# Database of powerful learning metaphors
+METAPHOR_DATABASE = _freeze({
+    "mathematics": [
+        {
+            "concept": "algebra",
+            "metaphor": "detective_work",
+            "explanation": "Variables are mysteries to solve, equations are clues"
+        },
+        {
+            "concept": "geometry",
+            "metaphor": "architecture",
+            "explanation": "Shapes are building blocks, proofs are blueprints"
+        }
+    ],
+    "science": [
+        {
+            "concept": "atoms",
+            "metaphor": "social_network",
+            "explanation": "Atoms are like people who form relationships (bonds)"
+        },
+        {
+            "concept": "ecosystem",
+            "metaphor": "neighborhood",
+            "explanation": "Different species are neighbors with various relationships"
+        }
+    ],
+    "language": [
+        {
+            "concept": "grammar",
+            "metaphor": "traffic_rules",
+            "explanation": "Rules that help words flow smoothly and safely"
+        },
+        {
+            "concept": "writing",
+            "metaphor": "cooking",
+            "explanation": "Ideas are ingredients, structure is the recipe"
+        }
+    ]
+})
+
+# Game elements that enhance learning
+GAME_MECHANICS = _freeze({
+    "progression_systems": [
+        {
+            "name": "skill_trees",
+            "description": "Visual progression through interconnected abilities",
+            "best_for": ["complex_subjects", "long_term_learning"]
+        },
+        {
+            "name": "achievement_badges",
+            "description": "Recognition for specific accomplishments",
+            "best_for": ["motivation", "diverse_goals"]
+        }
+    ],
+    "engagement_mechanics": [
+        {
+            "name": "collaborative_challenges",
+            "description": "Team-based problem solving",
+            "social_component": True
+        },
+        {
+            "name": "discovery_quests",
+            "description": "Self-directed exploration with guidance",
+            "autonomy_component": True
+        }
+    ]
+})
+
+# Elements of surprise that spark curiosity
+SURPRISE_CATALOG = _freeze({
+    "unexpected_connections": [
+        "How music theory relates to mathematics",
+        "Why cooking is applied chemistry",
+        "How video games teach physics"
+    ],
+    "perspective_shifts": [
+        "Seeing history from multiple viewpoints",
+        "Understanding problems through different roles",
+        "Exploring concepts at different scales"
+    ],
+    "interactive_reveals": [
+        "Hidden information revealed through action",
+        "Concepts that emerge from student discovery",
+        "Surprising outcomes from student choices"
+    ]
+})
+
+# Formats offered by visual and experiential hooks
+VISUAL_APPROACHES = (
+    "interactive_diagram",
+    "concept_map",
+    "infographic_creation",
+    "visual_story",
+    "data_visualization"
+)
+
+EXPERIENCE_TYPES = (
+    "hands_on_experiment",
+    "role_playing_scenario",
+    "simulation_activity",
+    "real_world_application",
+    "maker_project"
+)
+
+
+# Components that engage each sense, shared by every experience
+MULTI_SENSORY_COMPONENTS = _freeze({
+    'visual': [
+        'color_coded_materials',
+        'visual_progress_tracking',
+        'infographic_summaries',
+        'student_created_visuals'
+    ],
+    'auditory': [
+        'background_music_for_focus',
+        'sound_effects_for_engagement',
+        'verbal_explanation_opportunities',
+        'discussion_and_sharing_time'
+    ],
+    'tactile': [
+        'manipulative_materials',
+        'texture_based_learning_aids',
+        'hands_on_creation_activities',
+        'physical_model_building'
+    ],
+    'kinesthetic': [
+        'movement_based_activities',
+        'gesture_and_demonstration',
+        'role_playing_and_acting',
+        'physical_space_utilization'
+    ],
+    'environmental': [
+        'flexible_seating_arrangements',
+        'natural_lighting_when_possible',
+        'temperature_and_comfort_considerations',
+        'noise_level_management'
+    ]
+})
+
+# Overarching narrative per primary hook modality; {concept} is the main concept
+NARRATIVE_TEMPLATES = MappingProxyType({
+    CreativeModality.STORY: "Our learning journey follows heroes who must master {concept} to overcome challenges and help their community. Each lesson reveals new powers and deeper understanding.",
+    CreativeModality.GAME: "Welcome to the {concept} Academy, where students progress through levels of mastery, unlocking new abilities and taking on greater challenges.",
+    CreativeModality.EXPERIENCE: "Step into the world where {concept} comes alive through hands-on discovery, real-world application, and tangible experimentation."
+})
+
+DEFAULT_NARRATIVE_TEMPLATE = "Embark on a creative exploration of {concept}, where every discovery builds toward mastery and understanding."
+
+# Learning outcome specific to each hook modality
+HOOK_OUTCOMES = MappingProxyType({
+    CreativeModality.STORY: "Students will connect learning to narrative elements",
+    CreativeModality.GAME: "Students will demonstrate strategic thinking and problem-solving",
+    CreativeModality.VISUAL: "Students will communicate ideas through visual representation",
+    CreativeModality.EXPERIENCE: "Students will make tangible connections between theory and practice"
+})
+
+# Surprise elements that can be woven into any experience
+EXPERIENCE_SURPRISES = (
+    # Unexpected connections
+    "Reveal surprising real-world applications of the concepts",
+    "Show connections to student's personal interests",
+    "Introduce guest expert or unusual perspective",
+    # Interactive reveals
+    "Hidden information unlocked through student discovery",
+    "Unexpected twist in the narrative or challenge",
+    "Student choice that changes the learning path",
+    # Perspective shifts
+    "View the concept from an unusual angle or scale",
+    "Role reversal where students become the teachers",
+    "Time-shift perspective (past, future, or different era)"
+)
+
+# Personalization note for each collaboration preference
+COLLABORATION_NOTES = MappingProxyType({
+    "individual": "Respect need for individual work time while providing optional collaboration",
+    "small_group": "Design activities for 2-4 student groups with clear roles",
+    "large_group": "Include whole-class activities and community building elements"
+})
+
+# Activity adaptation for each learning style, in the order they are suggested
+LEARNING_STYLE_ADAPTATIONS = (
+    (LearningStyle.VISUAL, "Include visual aids, diagrams, and color coding"),
+    (LearningStyle.AUDITORY, "Incorporate discussions, explanations, and audio elements"),
+    (LearningStyle.KINESTHETIC, "Add movement, hands-on manipulation, and physical activity"),
+    (LearningStyle.SOCIAL, "Include group work, peer collaboration, and shared reflection"),
+    (LearningStyle.SOLITARY, "Provide individual reflection time and personal goal setting")
+)
+
+# Step-by-step activity instructions per hook modality; {concept} is the
+# activity's main concept
+ACTIVITY_STEPS = MappingProxyType({
+    CreativeModality.STORY: (
+        "1. Introduce the story world and characters",
+        "2. Present the challenge related to {concept}",
+        "3. Guide students through the learning journey",
+        "4. Have students apply {concept} to overcome obstacles",
+        "5. Celebrate the victory and reflect on learning"
+    ),
+    CreativeModality.GAME: (
+        "1. Explain the game rules and objectives",
+        "2. Demonstrate how {concept} knowledge helps in the game",
+        "3. Start with easier challenges to build confidence",
+        "4. Increase difficulty as students master skills",
+        "5. Debrief on strategies and learning insights"
+    ),
+    CreativeModality.VISUAL: (
+        "1. Show examples of effective visual representations",
+        "2. Brainstorm key aspects of {concept} to visualize",
+        "3. Create initial sketches or drafts",
+        "4. Develop and refine the visual representation",
+        "5. Present and explain the final visualization"
+    )
+})
+
+DEFAULT_ACTIVITY_STEPS = (
+    "1. Set up the learning environment",
+    "2. Introduce {concept} through the creative approach",
+    "3. Guide hands-on exploration and discovery",
+    "4. Encourage experimentation and hypothesis testing",
+    "5. Reflect on discoveries and consolidate learning"
+)
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_MAX_SIZE)
+def _activity_instructions(modality: CreativeModality, concept: str) -> Tuple[str, ...]:
+    """Activity instructions for a hook modality, formatted for the concept"""
+    steps = ACTIVITY_STEPS.get(modality, DEFAULT_ACTIVITY_STEPS)
+    return tuple(step.format(concept=concept) for step in steps)
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_MAX_SIZE)
+def _narrative_thread(modality: CreativeModality, concept: str) -> str:
+    """Overarching narrative for a primary hook modality, formatted for the concept"""
+    template = NARRATIVE_TEMPLATES.get(modality, DEFAULT_NARRATIVE_TEMPLATE)
+    return template.format(concept=concept)
+
+
+def _index_story_structures(story_structures: Tuple[Mapping[str, Any], ...]) -> Mapping[str, Tuple[Mapping[str, Any], ...]]:
+    """Map each 'best_for' tag to the story structures suited to it"""
+    index = defaultdict(list)
+    for structure in story_structures:
+        for tag in structure['best_for']:
+            index[tag].append(structure)
+    return MappingProxyType({tag: tuple(structures) for tag, structures in index.items()})
+
+
+# Lookup indexes over the static tables
+_STORY_BY_TAG = _index_story_structures(CREATIVE_PATTERNS['story_structures'])
+_METAPHOR_BY_CONCEPT = MappingProxyType({
+    (subject, metaphor['concept']): metaphor
+    for subject, metaphors in METAPHOR_DATABASE.items()
+    for metaphor in metaphors
+})
+_METAPHOR_CATEGORY_NAMES = tuple(CREATIVE_PATTERNS['metaphor_categories'])
+_SURPRISE_CATEGORIES = tuple(SURPRISE_CATALOG)
 
 
 class CreativeSynthesisManager:
@@ -129,171 +634,57 @@ class CreativeSynthesisManager:
     while ensuring deep learning occurs.
     """
     
-    def __init__(self):
-        self.creative_patterns = self._initialize_creative_patterns()
-        self.story_templates = self._initialize_story_templates()
-        self.metaphor_database = self._initialize_metaphor_database()
-        self.game_mechanics = self._initialize_game_mechanics()
-        self.surprise_catalog = self._initialize_surprise_catalog()
-        
-        # Learning effectiveness tracking
+    creative_patterns = CREATIVE_PATTERNS
+    story_templates = STORY_TEMPLATES
+    metaphor_database = METAPHOR_DATABASE
+    game_mechanics = GAME_MECHANICS
+    surprise_catalog = SURPRISE_CATALOG
+    
+    _story_by_tag = _STORY_BY_TAG
+    _metaphor_by_concept = _METAPHOR_BY_CONCEPT
+    _metaphor_category_names = _METAPHOR_CATEGORY_NAMES
+    _surprise_categories = _SURPRISE_CATEGORIES
+    
+    def __init__(self, seed: Optional[int] = None):
+        # Private RNG avoids the global random lock and allows seeded, reproducible runs
+        self._rng = random.Random(seed)
+        
+        # Memoized objective analysis, keyed by (objective, context) fingerprint
+        self._objective_cache: OrderedDict = OrderedDict()
+        self._concept_cache: OrderedDict = OrderedDict()
+        self._hook_plan_cache: OrderedDict = OrderedDict()
+        
+        # Hook builder for each creative modality
+        self._hook_factories = {
+            CreativeModality.STORY: self._create_story_hook,
+            CreativeModality.METAPHOR: self._create_metaphor_hook,
+            CreativeModality.GAME: self._create_game_hook,
+            CreativeModality.VISUAL: self._create_visual_hook,
+            CreativeModality.EXPERIENCE: self._create_experience_hook
+        }
+        
+        # Learning effectiveness tracking (the setter builds the column storage)
         self.experience_effectiveness = {}
         self.student_response_patterns = {}
+        # Running [sum, count] of engagement per student and modality, so
+        # refinement does not rescan each modality's score list
+        self._modality_totals: Dict[str, Dict[str, List[float]]] = {}
         
         # Integration points with other PACT primitives
         self.goal_primitive = None
+        # (created_at, analysis) per objective fingerprint, plus the in-flight
+        # analysis futures that concurrent requests for an objective share
+        self._goal_analysis_cache: OrderedDict = OrderedDict()
+        self._goal_analysis_pending: Dict[str, asyncio.Future] = {}
+        # Set when the collaborator offers a batch API (see set_goal_primitive
+        # and set_empathetic_interaction)
+        self._goal_batcher: Optional[_MicroBatcher] = None
+        self._profile_batcher: Optional[_MicroBatcher] = None
         self.empathetic_interaction = None
         self.adaptive_reasoning = None
         self.contextual_memory = None
         self.system_evolution = None
     
-    def _initialize_creative_patterns(self) -> Dict[str, Any]:
-        """Initialize patterns for different creative approaches"""
-        return {
-            "story_structures": [
-                {
-                    "name": "Hero's Journey Learning",
-                    "template": "student_as_hero",
-                    "phases": ["call_to_adventure", "mentorship", "challenges", "revelation", "return"],
-                    "best_for": ["complex_concepts", "skill_development", "character_building"]
-                },
-                {
-                    "name": "Mystery Investigation",
-                    "template": "detective_story",
-                    "phases": ["problem_discovery", "clue_gathering", "hypothesis", "testing", "solution"],
-                    "best_for": ["scientific_method", "critical_thinking", "research_skills"]
-                },
-                {
-                    "name": "Time Travel Adventure",
-                    "template": "temporal_exploration",
-                    "phases": ["departure", "historical_immersion", "interaction", "learning", "return"],
-                    "best_for": ["history", "cause_effect", "cultural_understanding"]
-                }
-            ],
-            "metaphor_categories": {
-                "nature": ["ecosystem", "seasons", "weather", "animals", "plants"],
-                "technology": ["machines", "networks", "computers", "tools"],
-                "sports": ["teamwork", "strategy", "competition", "training"],
-                "cooking": ["recipes", "ingredients", "processes", "flavors"],
-                "building": ["foundation", "structure", "tools", "blueprints"],
-                "journey": ["paths", "destinations", "obstacles", "companions"]
-            },
-            "game_elements": [
-                "quests", "levels", "achievements", "leaderboards", "collaboration",
-                "resource_management", "strategy", "puzzles", "exploration", "creation"
-            ]
-        }
-    
-    def _initialize_story_templates(self) -> Dict[str, Any]:
-        """Story frameworks for different learning scenarios"""
-        return {
-            "concept_introduction": {
-                "opening": "In a world where {concept} holds the key to {benefit}...",
-                "conflict": "But understanding {concept} requires overcoming {challenge}...",
-                "resolution": "Through {learning_method}, our heroes discover {insight}..."
-            },
-            "skill_building": {
-                "opening": "Every master of {skill} began as an apprentice...",
-                "journey": "Through practice, mistakes, and gradual improvement...",
-                "mastery": "Until one day, {skill} becomes second nature..."
-            },
-            "problem_solving": {
-                "setup": "A puzzling situation emerges: {problem}",
-                "investigation": "Our team of investigators uses {method} to explore...",
-                "breakthrough": "The aha moment arrives when we realize {solution}..."
-            }
-        }
-    
-    def _initialize_metaphor_database(self) -> Dict[str, List[Dict]]:
-        """Database of powerful learning metaphors"""
-        return {
-            "mathematics": [
-                {
-                    "concept": "algebra",
-                    "metaphor": "detective_work",
-                    "explanation": "Variables are mysteries to solve, equations are clues"
-                },
-                {
-                    "concept": "geometry",
-                    "metaphor": "architecture",
-                    "explanation": "Shapes are building blocks, proofs are blueprints"
-                }
-            ],
-            "science": [
-                {
-                    "concept": "atoms",
-                    "metaphor": "social_network",
-                    "explanation": "Atoms are like people who form relationships (bonds)"
-                },
-                {
-                    "concept": "ecosystem",
-                    "metaphor": "neighborhood",
-                    "explanation": "Different species are neighbors with various relationships"
-                }
-            ],
-            "language": [
-                {
-                    "concept": "grammar",
-                    "metaphor": "traffic_rules",
-                    "explanation": "Rules that help words flow smoothly and safely"
-                },
-                {
-                    "concept": "writing",
-                    "metaphor": "cooking",
-                    "explanation": "Ideas are ingredients, structure is the recipe"
-                }
-            ]
-        }
-    
-    def _initialize_game_mechanics(self) -> Dict[str, Any]:
-        """Game elements that enhance learning"""
-        return {
-            "progression_systems": [
-                {
-                    "name": "skill_trees",
-                    "description": "Visual progression through interconnected abilities",
-                    "best_for": ["complex_subjects", "long_term_learning"]
-                },
-                {
-                    "name": "achievement_badges",
-                    "description": "Recognition for specific accomplishments",
-                    "best_for": ["motivation", "diverse_goals"]
-                }
-            ],
-            "engagement_mechanics": [
-                {
-                    "name": "collaborative_challenges",
-                    "description": "Team-based problem solving",
-                    "social_component": True
-                },
-                {
-                    "name": "discovery_quests",
-                    "description": "Self-directed exploration with guidance",
-                    "autonomy_component": True
-                }
-            ]
-        }
-    
-    def _initialize_surprise_catalog(self) -> Dict[str, List[str]]:
-        """Elements of surprise that spark curiosity"""
-        return {
-            "unexpected_connections": [
-                "How music theory relates to mathematics",
-                "Why cooking is applied chemistry",
-                "How video games teach physics"
-            ],
-            "perspective_shifts": [
-                "Seeing history from multiple viewpoints",
-                "Understanding problems through different roles",
-                "Exploring concepts at different scales"
-            ],
-            "interactive_reveals": [
-                "Hidden information revealed through action",
-                "Concepts that emerge from student discovery",
-                "Surprising outcomes from student choices"
-            ]
-        }
-    
     async def create_learning_experience(
         self,
         learning_objective: str,
@@ -307,11 +698,12 @@ class CreativeSynthesisManager:
         """
         logger.info(f"Creating creative learning experience for: {learning_objective}")
         
-        # Step 1: Understand the Learning Goal
-        learning_analysis = await self._analyze_learning_objective(learning_objective, subject_context)
-        
-        # Step 2: Know the Student
-        creative_preferences = await self._analyze_student_creativity(student_profile)
+        # Step 1: Understand the Learning Goal, and
+        # Step 2: Know the Student -- independent, so run them concurrently
+        learning_analysis, creative_preferences = await asyncio.gather(
+            self._analyze_learning_objective(learning_objective, subject_context),
+            self._analyze_student_creativity(student_profile)
+        )
         
         # Step 3: Find the Creative Hook
         creative_hooks = await self._generate_creative_hooks(
@@ -319,12 +711,12 @@ class CreativeSynthesisManager:
         )
         
         # Step 4: Design the Experience
-        experience = await self._design_complete_experience(
+        experience = self._design_complete_experience(
             learning_objective, creative_hooks, student_profile, learning_analysis
         )
         
         # Step 5: Add Surprise Elements
-        experience = await self._add_surprise_elements(experience, student_profile)
+        experience = self._add_surprise_elements(experience, student_profile)
         
         return experience
     
@@ -335,25 +727,27 @@ class CreativeSynthesisManager:
     ) -> Dict[str, Any]:
         """Analyze what type of learning experience is needed"""
         
-        # Determine learning type
-        learning_types = []
-        if any(word in objective.lower() for word in ['understand', 'explain', 'describe']):
-            learning_types.append('conceptual')
-        if any(word in objective.lower() for word in ['solve', 'calculate', 'apply']):
-            learning_types.append('procedural')
-        if any(word in objective.lower() for word in ['create', 'design', 'build']):
-            learning_types.append('creative')
-        if any(word in objective.lower() for word in ['analyze', 'evaluate', 'compare']):
-            learning_types.append('critical_thinking')
+        cache_key = _fingerprint(objective, context)
+        cached = _lru_get(self._objective_cache, cache_key)
+        if cached is not None:
+            return {k: list(v) if isinstance(v, list) else v for k, v in cached.items()}
+        
+        # Determine learning type; triggers match anywhere in the lowercased
+        # objective, so "understanding" or "designs" still count
+        lowered = objective.lower()
+        learning_types = [
+            learning_type for learning_type, triggers in LEARNING_TYPE_TRIGGERS
+            if any(trigger in lowered for trigger in triggers)
+        ]
         
         # Assess complexity
-        complexity_indicators = len([word for word in objective.split() if len(word) > 6])
+        complexity_indicators = sum(1 for word in objective.split() if len(word) > 6)
         complexity = min(10, max(1, complexity_indicators))
         
         # Identify key concepts
         key_concepts = await self._extract_key_concepts(objective, context)
         
-        return {
+        analysis = {
             'learning_types': learning_types,
             'complexity': complexity,
             'key_concepts': key_concepts,
@@ -361,21 +755,34 @@ class CreativeSynthesisManager:
             'prerequisites': context.get('prerequisites', []),
             'time_available': context.get('time_limit', 60)
         }
+        _lru_put(self._objective_cache, cache_key, analysis)
+        
+        return {k: list(v) if isinstance(v, list) else v for k, v in analysis.items()}
     
     async def _extract_key_concepts(self, objective: str, context: Dict[str, Any]) -> List[str]:
         """Extract the main concepts to be learned"""
-        # This would typically use NLP, but for now we'll use heuristics
-        words = objective.lower().split()
-        
-        # Remove common words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        content_words = [word for word in words if word not in stop_words and len(word) > 3]
+        cache_key = _fingerprint(objective, context)
+        cached = _lru_get(self._concept_cache, cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        # This would typically use NLP, but for now we'll use heuristics;
+        # remove short and common words in a single pass
+        content_words = [
+            word for word in objective.lower().split()
+            if len(word) > 3 and word not in STOP_WORDS
+        ]
         
         # Add context-specific concepts
         if 'key_concepts' in context:
             content_words.extend(context['key_concepts'])
         
-        return list(set(content_words[:5]))  # Top 5 unique concepts
+        # Top 5 unique concepts; interned since the same few concepts recur
+        # across every hook, cache key and effectiveness record
+        key_concepts = list(dict.fromkeys(map(sys.intern, content_words)))[:5]
+        _lru_put(self._concept_cache, cache_key, key_concepts)
+        
+        return list(key_concepts)
     
     async def _analyze_student_creativity(
         self, 
@@ -383,11 +790,11 @@ class CreativeSynthesisManager:
     ) -> Dict[str, Any]:
         """Analyze student's creative preferences and optimal engagement strategies"""
         
-        primary_modalities = profile.preferred_modalities[:3]
+        primary_modalities = list(profile.preferred_modalities[:3])
         learning_style_weights = {style.value: 1.0 for style in profile.learning_styles}
         
         # Calculate engagement patterns
-        avg_engagement = sum(profile.engagement_history.values()) / len(profile.engagement_history) if profile.engagement_history else 0.5
+        avg_engagement = float(mean_engagement(profile.engagement_values()))
         
         # Determine optimal challenge level
         challenge_preference = "moderate"
@@ -414,66 +821,122 @@ class CreativeSynthesisManager:
     ) -> List[CreativeHook]:
         """Generate multiple creative approaches for the learning objective"""
         
-        hooks = []
-        primary_modalities = creative_preferences['primary_modalities']
+        # Every hook is built around a key concept; without one there is
+        # nothing to dispatch
+        if not learning_analysis['key_concepts']:
+            return []
         
-        # Generate hooks for each preferred modality
-        for modality in primary_modalities:
-            if modality == CreativeModality.STORY:
-                hook = await self._create_story_hook(learning_analysis, creative_preferences)
-            elif modality == CreativeModality.METAPHOR:
-                hook = await self._create_metaphor_hook(learning_analysis, creative_preferences)
-            elif modality == CreativeModality.GAME:
-                hook = await self._create_game_hook(learning_analysis, creative_preferences)
-            elif modality == CreativeModality.VISUAL:
-                hook = await self._create_visual_hook(learning_analysis, creative_preferences)
-            elif modality == CreativeModality.EXPERIENCE:
-                hook = await self._create_experience_hook(learning_analysis, creative_preferences)
-            else:
-                continue
-            
-            if hook and self._meets_constraints(hook, constraints):
-                hooks.append(hook)
+        plan = self._get_hook_plan(learning_analysis, creative_preferences)
+        
+        # Generate hooks for each preferred modality, plus the surprise element,
+        # concurrently
+        *modality_hooks, surprise_hook = await asyncio.gather(
+            *[step(learning_analysis, creative_preferences) for step in plan],
+            self._create_surprise_hook(learning_analysis, creative_preferences)
+        )
+        hooks = self._filter_by_constraints(modality_hooks, constraints)
         
         # Always add a surprise element
-        surprise_hook = await self._create_surprise_hook(learning_analysis, creative_preferences)
-        if surprise_hook:
-            hooks.append(surprise_hook)
+        hooks.append(surprise_hook)
         
-        # Sort by engagement potential
-        hooks.sort(key=lambda h: h.engagement_score * h.learning_alignment, reverse=True)
+        # Top 5 hooks by engagement potential
+        return heapq.nlargest(5, hooks, key=attrgetter('score'))
+    
+    def _get_hook_plan(
+        self,
+        learning_analysis: Dict[str, Any],
+        creative_preferences: Dict[str, Any]
+    ) -> Tuple[Callable, ...]:
+        """Return the cached hook-generation plan for this request's structure
         
-        return hooks[:5]  # Top 5 hooks
+        Which factories run, and the story structures and game framing they
+        use, depend only on subject, learning types, modalities and social
+        preference; only the concepts vary between requests with the same plan.
+        """
+        learning_types = learning_analysis['learning_types']
+        primary_modalities = creative_preferences['primary_modalities']
+        social_preference = creative_preferences['social_preference']
+        plan_key = (
+            learning_analysis['subject_domain'],
+            tuple(sorted(learning_types)),
+            tuple(m.value for m in primary_modalities),
+            social_preference
+        )
+        
+        plan = _lru_get(self._hook_plan_cache, plan_key)
+        if plan is None:
+            steps = []
+            for modality in primary_modalities:
+                factory = self._hook_factories.get(modality)
+                if factory is None:
+                    continue
+                if modality == CreativeModality.STORY:
+                    factory = partial(
+                        factory, suitable_structures=self._select_story_structures(learning_types)
+                    )
+                elif modality == CreativeModality.GAME:
+                    factory = partial(
+                        factory,
+                        description_template=self._select_game_template(learning_types, social_preference)
+                    )
+                steps.append(factory)
+            plan = tuple(steps)
+            _lru_put(self._hook_plan_cache, plan_key, plan)
+        
+        return plan
+    
+    def _select_story_structures(self, learning_types: List[str]) -> Tuple[Mapping[str, Any], ...]:
+        """Story structures suited to the learning types, or all of them if none fit"""
+        suitable_structures = tuple({
+            id(structure): structure
+            for learning_type in learning_types
+            for structure in self._story_by_tag.get(learning_type, ())
+        }.values())
+        
+        return suitable_structures or self.creative_patterns['story_structures']
+    
+    @staticmethod
+    def _select_game_template(learning_types: List[str], social_preference: str) -> str:
+        """Game description template (with a {concept} placeholder) for the learning types"""
+        # Select game mechanics based on learning type
+        if 'procedural' in learning_types:
+            template = "Master {concept} through progressive challenges that unlock new abilities"
+        elif 'critical_thinking' in learning_types:
+            template = "Use {concept} knowledge to solve complex scenarios and outwit challenges"
+        else:
+            template = "Discover the secrets of {concept} through interactive exploration"
+        
+        # Add social element if preferred
+        if social_preference != 'solitary':
+            template += " with teammates"
+        
+        return template
     
     async def _create_story_hook(
         self,
         learning_analysis: Dict[str, Any],
-        preferences: Dict[str, Any]
-    ) -> Optional[CreativeHook]:
+        preferences: Dict[str, Any],
+        suitable_structures: Optional[Tuple[Mapping[str, Any], ...]] = None
+    ) -> CreativeHook:
         """Create a story-based creative hook"""
         
         concepts = learning_analysis['key_concepts']
-        if not concepts:
-            return None
         
         # Select appropriate story structure
-        story_structures = self.creative_patterns['story_structures']
-        suitable_structures = [s for s in story_structures 
-                             if any(lt in s['best_for'] for lt in learning_analysis['learning_types'])]
+        if suitable_structures is None:
+            suitable_structures = self._select_story_structures(learning_analysis['learning_types'])
         
-        if not suitable_structures:
-            suitable_structures = story_structures
-        
-        selected_structure = random.choice(suitable_structures)
-        main_concept = concepts[0] if concepts else "the subject"
+        selected_structure = self._rng.choice(suitable_structures)
+        main_concept = concepts[0]
+        interests = preferences['interest_hooks']
         
         # Create story narrative
         story_title = f"The Quest for {main_concept.title()}"
         story_desc = f"Students embark on a {selected_structure['name'].lower()} where they must master {main_concept} to overcome challenges and help others."
         
         # Connect to student interests
-        if preferences['interest_hooks']:
-            interest = random.choice(preferences['interest_hooks'])
+        if interests:
+            interest = self._rng.choice(interests)
             story_desc += f" The adventure takes place in a world of {interest}."
         
         return CreativeHook(
@@ -483,7 +946,7 @@ class CreativeSynthesisManager:
             engagement_score=0.8,
             learning_alignment=0.7,
             implementation_complexity=6,
-            materials_needed=["story_outline", "character_sheets", "setting_description"],
+            materials_needed=("story_outline", "character_sheets", "setting_description"),
             time_estimate=preferences['attention_span'],
             age_appropriateness=(8, 18)
         )
@@ -492,37 +955,37 @@ class CreativeSynthesisManager:
         self,
         learning_analysis: Dict[str, Any],
         preferences: Dict[str, Any]
-    ) -> Optional[CreativeHook]:
+    ) -> CreativeHook:
         """Create a metaphor-based creative hook"""
         
         subject = learning_analysis['subject_domain']
         concepts = learning_analysis['key_concepts']
+        main_concept = concepts[0]
         
-        if not concepts:
-            return None
-        
-        # Find relevant metaphors
+        # Find relevant metaphors, preferring one written for a key concept
+        concept_metaphors = (self._metaphor_by_concept.get((subject, c)) for c in concepts)
+        concept_metaphor = next((m for m in concept_metaphors if m), None)
         metaphors = self.metaphor_database.get(subject, [])
-        if not metaphors:
+        if concept_metaphor:
+            metaphor_desc = concept_metaphor['explanation']
+        elif not metaphors:
             # Create a generic metaphor based on concept
-            main_concept = concepts[0]
-            metaphor_categories = list(self.creative_patterns['metaphor_categories'].keys())
-            selected_category = random.choice(metaphor_categories)
+            selected_category = self._rng.choice(self._metaphor_category_names)
             metaphor_examples = self.creative_patterns['metaphor_categories'][selected_category]
             
             metaphor_desc = f"Understanding {main_concept} is like exploring {selected_category} - each element has its role and relationships."
         else:
-            relevant_metaphor = random.choice(metaphors)
+            relevant_metaphor = self._rng.choice(metaphors)
             metaphor_desc = relevant_metaphor['explanation']
         
         return CreativeHook(
             type=CreativeModality.METAPHOR,
-            title=f"The {concepts[0].title()} Connection",
+            title=f"The {main_concept.title()} Connection",
             description=metaphor_desc,
             engagement_score=0.7,
             learning_alignment=0.9,
             implementation_complexity=3,
-            materials_needed=["visual_aids", "comparison_charts"],
+            materials_needed=("visual_aids", "comparison_charts"),
             time_estimate=20,
             age_appropriateness=(6, 18)
         )
@@ -530,37 +993,28 @@ class CreativeSynthesisManager:
     async def _create_game_hook(
         self,
         learning_analysis: Dict[str, Any],
-        preferences: Dict[str, Any]
-    ) -> Optional[CreativeHook]:
+        preferences: Dict[str, Any],
+        description_template: Optional[str] = None
+    ) -> CreativeHook:
         """Create a game-based creative hook"""
         
         concepts = learning_analysis['key_concepts']
-        if not concepts:
-            return None
-        
-        # Select game mechanics based on learning type
-        if 'procedural' in learning_analysis['learning_types']:
-            game_type = "skill_challenge"
-            game_desc = f"Master {concepts[0]} through progressive challenges that unlock new abilities"
-        elif 'critical_thinking' in learning_analysis['learning_types']:
-            game_type = "strategy_game"
-            game_desc = f"Use {concepts[0]} knowledge to solve complex scenarios and outwit challenges"
-        else:
-            game_type = "exploration_adventure"
-            game_desc = f"Discover the secrets of {concepts[0]} through interactive exploration"
         
-        # Add social element if preferred
-        if preferences['social_preference'] != 'solitary':
-            game_desc += " with teammates"
+        if description_template is None:
+            description_template = self._select_game_template(
+                learning_analysis['learning_types'], preferences['social_preference']
+            )
+        main_concept = concepts[0]
+        game_desc = description_template.format(concept=main_concept)
         
         return CreativeHook(
             type=CreativeModality.GAME,
-            title=f"The {concepts[0].title()} Challenge",
+            title=f"The {main_concept.title()} Challenge",
             description=game_desc,
             engagement_score=0.9,
             learning_alignment=0.8,
             implementation_complexity=7,
-            materials_needed=["game_rules", "scoring_system", "challenge_cards"],
+            materials_needed=("game_rules", "scoring_system", "challenge_cards"),
             time_estimate=preferences['attention_span'],
             age_appropriateness=(8, 18)
         )
@@ -569,31 +1023,21 @@ class CreativeSynthesisManager:
         self,
         learning_analysis: Dict[str, Any],
         preferences: Dict[str, Any]
-    ) -> Optional[CreativeHook]:
+    ) -> CreativeHook:
         """Create a visual-based creative hook"""
         
         concepts = learning_analysis['key_concepts']
-        if not concepts:
-            return None
-        
-        visual_approaches = [
-            "interactive_diagram",
-            "concept_map",
-            "infographic_creation",
-            "visual_story",
-            "data_visualization"
-        ]
-        
-        selected_approach = random.choice(visual_approaches)
+        main_concept = concepts[0]
+        selected_approach = self._rng.choice(VISUAL_APPROACHES)
         
         return CreativeHook(
             type=CreativeModality.VISUAL,
-            title=f"Visualizing {concepts[0].title()}",
-            description=f"Create stunning {selected_approach}s that reveal the hidden patterns and connections in {concepts[0]}",
+            title=f"Visualizing {main_concept.title()}",
+            description=f"Create stunning {selected_approach}s that reveal the hidden patterns and connections in {main_concept}",
             engagement_score=0.8,
             learning_alignment=0.8,
             implementation_complexity=5,
-            materials_needed=["design_tools", "templates", "color_coding_system"],
+            materials_needed=("design_tools", "templates", "color_coding_system"),
             time_estimate=30,
             age_appropriateness=(5, 18)
         )
@@ -602,31 +1046,21 @@ class CreativeSynthesisManager:
         self,
         learning_analysis: Dict[str, Any],
         preferences: Dict[str, Any]
-    ) -> Optional[CreativeHook]:
+    ) -> CreativeHook:
         """Create an experiential creative hook"""
         
         concepts = learning_analysis['key_concepts']
-        if not concepts:
-            return None
-        
-        experience_types = [
-            "hands_on_experiment",
-            "role_playing_scenario",
-            "simulation_activity",
-            "real_world_application",
-            "maker_project"
-        ]
-        
-        selected_type = random.choice(experience_types)
+        main_concept = concepts[0]
+        selected_type = self._rng.choice(EXPERIENCE_TYPES)
         
         return CreativeHook(
             type=CreativeModality.EXPERIENCE,
-            title=f"Living {concepts[0].title()}",
-            description=f"Experience {concepts[0]} through {selected_type} that makes abstract concepts tangible and memorable",
+            title=f"Living {main_concept.title()}",
+            description=f"Experience {main_concept} through {selected_type} that makes abstract concepts tangible and memorable",
             engagement_score=0.9,
             learning_alignment=0.9,
             implementation_complexity=8,
-            materials_needed=["activity_materials", "setup_guide", "safety_equipment"],
+            materials_needed=("activity_materials", "setup_guide", "safety_equipment"),
             time_estimate=45,
             age_appropriateness=(6, 18)
         )
@@ -635,49 +1069,48 @@ class CreativeSynthesisManager:
         self,
         learning_analysis: Dict[str, Any],
         preferences: Dict[str, Any]
-    ) -> Optional[CreativeHook]:
+    ) -> CreativeHook:
         """Create a surprise element that sparks curiosity"""
         
         concepts = learning_analysis['key_concepts']
-        if not concepts:
-            return None
         
-        surprise_categories = list(self.surprise_catalog.keys())
-        selected_category = random.choice(surprise_categories)
+        selected_category = self._rng.choice(self._surprise_categories)
         surprise_examples = self.surprise_catalog[selected_category]
         
-        return CreativeHook(
-            type=CreativeModality.SURPRISE,
-            title="The Unexpected Connection",
-            description=f"Discover surprising connections between {concepts[0]} and unexpected domains that will change how you see the world",
-            engagement_score=0.7,
-            learning_alignment=0.6,
-            implementation_complexity=4,
-            materials_needed=["surprise_reveal_materials"],
-            time_estimate=15,
-            age_appropriateness=(8, 18)
+        return replace(
+            _SURPRISE_HOOK_PROTOTYPE,
+            description=f"Discover surprising connections between {concepts[0]} and unexpected domains that will change how you see the world"
         )
     
-    def _meets_constraints(self, hook: CreativeHook, constraints: Optional[Dict[str, Any]]) -> bool:
-        """Check if a creative hook meets the given constraints"""
-        if not constraints:
-            return True
+    def _filter_by_constraints(
+        self,
+        hooks: List[CreativeHook],
+        constraints: Optional[Dict[str, Any]]
+    ) -> List[CreativeHook]:
+        """Keep the creative hooks that meet the given constraints
+        
+        Numeric limits are checked for all hooks at once with NumPy masks.
+        """
+        if not constraints or not hooks:
+            return list(hooks)
         
-        if 'max_time' in constraints and hook.time_estimate > constraints['max_time']:
-            return False
+        keep = np.ones(len(hooks), dtype=bool)
         
-        if 'max_complexity' in constraints and hook.implementation_complexity > constraints['max_complexity']:
-            return False
+        if 'max_time' in constraints:
+            times = np.fromiter((h.time_estimate for h in hooks), dtype=np.float64, count=len(hooks))
+            keep &= times <= constraints['max_time']
+        
+        if 'max_complexity' in constraints:
+            complexities = np.fromiter((h.implementation_complexity for h in hooks), dtype=np.float64, count=len(hooks))
+            keep &= complexities <= constraints['max_complexity']
         
         if 'required_materials' in constraints:
             required = set(constraints['required_materials'])
-            available = set(hook.materials_needed)
-            if not required.issubset(available):
-                return False
+            keep &= np.fromiter((required.issubset(h.materials_needed) for h in hooks), dtype=bool, count=len(hooks))
         
-        return True
+        return [hook for hook, kept in zip(hooks, keep) if kept]
     
-    async def _design_complete_experience(
+    def _design_complete_experience(
         self,
         objective: str,
         hooks: List[CreativeHook],
@@ -692,34 +1125,19 @@ class CreativeSynthesisManager:
         primary_hook = hooks[0]
         supporting_hooks = hooks[1:3]  # Use up to 2 supporting hooks
         
-        # Create narrative thread
-        narrative = await self._create_narrative_thread(primary_hook, learning_analysis)
-        
-        # Design activities
-        activities = await self._design_activities(hooks, learning_analysis, student_profile)
-        
-        # Create assessment integration
-        assessment = await self._design_creative_assessment(objective, hooks, student_profile)
-        
-        # Generate personalization notes
-        personalization = await self._create_personalization_notes(student_profile, hooks)
-        
-        # Design multi-sensory components
-        multi_sensory = await self._design_multi_sensory_components(hooks, student_profile)
-        
         return LearningExperience(
             title=primary_hook.title,
             objective=objective,
             creative_hooks=hooks,
-            narrative_thread=narrative,
-            activities=activities,
-            assessment_integration=assessment,
-            personalization_notes=personalization,
+            narrative_thread=self._create_narrative_thread(primary_hook, learning_analysis),
+            activities=self._design_activities(hooks, learning_analysis, student_profile),
+            assessment_integration=self._design_creative_assessment(objective, hooks, student_profile),
+            personalization_notes=self._create_personalization_notes(student_profile, hooks),
             surprise_elements=[],  # Will be added later
-            multi_sensory_components=multi_sensory
+            multi_sensory_components=self._design_multi_sensory_components(hooks, student_profile)
         )
     
-    async def _create_narrative_thread(
+    def _create_narrative_thread(
         self,
         primary_hook: CreativeHook,
         learning_analysis: Dict[str, Any]
@@ -729,19 +1147,9 @@ class CreativeSynthesisManager:
         concepts = learning_analysis['key_concepts']
         main_concept = concepts[0] if concepts else "the subject"
         
-        if primary_hook.type == CreativeModality.STORY:
-            return f"Our learning journey follows heroes who must master {main_concept} to overcome challenges and help their community. Each lesson reveals new powers and deeper understanding."
-        
-        elif primary_hook.type == CreativeModality.GAME:
-            return f"Welcome to the {main_concept} Academy, where students progress through levels of mastery, unlocking new abilities and taking on greater challenges."
-        
-        elif primary_hook.type == CreativeModality.EXPERIENCE:
-            return f"Step into the world where {main_concept} comes alive through hands-on discovery, real-world application, and tangible experimentation."
-        
-        else:
-            return f"Embark on a creative exploration of {main_concept}, where every discovery builds toward mastery and understanding."
+        return _narrative_thread(primary_hook.type, main_concept)
     
-    async def _design_activities(
+    def _design_activities(
         self,
         hooks: List[CreativeHook],
         learning_analysis: Dict[str, Any],
@@ -757,16 +1165,16 @@ class CreativeSynthesisManager:
                 'type': hook.type.value,
                 'description': hook.description,
                 'duration': hook.time_estimate,
-                'materials': hook.materials_needed,
-                'instructions': await self._generate_activity_instructions(hook, learning_analysis),
-                'learning_outcomes': await self._define_learning_outcomes(hook, learning_analysis),
-                'adaptation_notes': await self._create_adaptation_notes(hook, student_profile)
+                'materials': list(hook.materials_needed),
+                'instructions': self._generate_activity_instructions(hook, learning_analysis),
+                'learning_outcomes': self._define_learning_outcomes(hook, learning_analysis),
+                'adaptation_notes': self._create_adaptation_notes(hook, student_profile)
             }
             activities.append(activity)
         
         return activities
     
-    async def _generate_activity_instructions(
+    def _generate_activity_instructions(
         self,
         hook: CreativeHook,
         learning_analysis: Dict[str, Any]
@@ -776,43 +1184,9 @@ class CreativeSynthesisManager:
         concepts = learning_analysis['key_concepts']
         main_concept = concepts[0] if concepts else "the concept"
         
-        if hook.type == CreativeModality.STORY:
-            return [
-                f"1. Introduce the story world and characters",
-                f"2. Present the challenge related to {main_concept}",
-                f"3. Guide students through the learning journey",
-                f"4. Have students apply {main_concept} to overcome obstacles",
-                f"5. Celebrate the victory and reflect on learning"
-            ]
-        
-        elif hook.type == CreativeModality.GAME:
-            return [
-                f"1. Explain the game rules and objectives",
-                f"2. Demonstrate how {main_concept} knowledge helps in the game",
-                f"3. Start with easier challenges to build confidence",
-                f"4. Increase difficulty as students master skills",
-                f"5. Debrief on strategies and learning insights"
-            ]
-        
-        elif hook.type == CreativeModality.VISUAL:
-            return [
-                f"1. Show examples of effective visual representations",
-                f"2. Brainstorm key aspects of {main_concept} to visualize",
-                f"3. Create initial sketches or drafts",
-                f"4. Develop and refine the visual representation",
-                f"5. Present and explain the final visualization"
-            ]
-        
-        else:
-            return [
-                f"1. Set up the learning environment",
-                f"2. Introduce {main_concept} through the creative approach",
-                f"3. Guide hands-on exploration and discovery",
-                f"4. Encourage experimentation and hypothesis testing",
-                f"5. Reflect on discoveries and consolidate learning"
-            ]
+        return list(_activity_instructions(hook.type, main_concept))
     
-    async def _define_learning_outcomes(
+    def _define_learning_outcomes(
         self,
         hook: CreativeHook,
         learning_analysis: Dict[str, Any]
@@ -842,41 +1216,25 @@ class CreativeSynthesisManager:
             outcomes.append("Students will analyze and evaluate different approaches")
         
         # Hook-specific outcomes
-        if hook.type == CreativeModality.STORY:
-            outcomes.append("Students will connect learning to narrative elements")
-        elif hook.type == CreativeModality.GAME:
-            outcomes.append("Students will demonstrate strategic thinking and problem-solving")
-        elif hook.type == CreativeModality.VISUAL:
-            outcomes.append("Students will communicate ideas through visual representation")
-        elif hook.type == CreativeModality.EXPERIENCE:
-            outcomes.append("Students will make tangible connections between theory and practice")
+        hook_outcome = HOOK_OUTCOMES.get(hook.type)
+        if hook_outcome:
+            outcomes.append(hook_outcome)
         
         return outcomes
     
-    async def _create_adaptation_notes(
+    def _create_adaptation_notes(
         self,
         hook: CreativeHook,
         student_profile: StudentCreativeProfile
     ) -> List[str]:
         """Create notes for adapting the activity to student needs"""
         
-        adaptations = []
-        
         # Learning style adaptations
-        if LearningStyle.VISUAL in student_profile.learning_styles:
-            adaptations.append("Include visual aids, diagrams, and color coding")
-        
-        if LearningStyle.AUDITORY in student_profile.learning_styles:
-            adaptations.append("Incorporate discussions, explanations, and audio elements")
-        
-        if LearningStyle.KINESTHETIC in student_profile.learning_styles:
-            adaptations.append("Add movement, hands-on manipulation, and physical activity")
-        
-        if LearningStyle.SOCIAL in student_profile.learning_styles:
-            adaptations.append("Include group work, peer collaboration, and shared reflection")
-        
-        if LearningStyle.SOLITARY in student_profile.learning_styles:
-            adaptations.append("Provide individual reflection time and personal goal setting")
+        learning_styles = frozenset(student_profile.learning_styles)
+        adaptations = [
+            adaptation for style, adaptation in LEARNING_STYLE_ADAPTATIONS
+            if style in learning_styles
+        ]
         
         # Attention span adaptations
         if student_profile.attention_span < 20:
@@ -890,7 +1248,7 @@ class CreativeSynthesisManager:
         
         return adaptations
     
-    async def _design_creative_assessment(
+    def _design_creative_assessment(
         self,
         objective: str,
         hooks: List[CreativeHook],
@@ -945,7 +1303,7 @@ class CreativeSynthesisManager:
             'student_choice_elements': ['presentation_format', 'expression_medium', 'collaboration_level']
         }
     
-    async def _create_personalization_notes(
+    def _create_personalization_notes(
         self,
         student_profile: StudentCreativeProfile,
         hooks: List[CreativeHook]
@@ -956,117 +1314,53 @@ class CreativeSynthesisManager:
         
         # Engagement history insights
         if student_profile.engagement_history:
-            avg_engagement = sum(student_profile.engagement_history.values()) / len(student_profile.engagement_history)
+            avg_engagement = float(mean_engagement(student_profile.engagement_values()))
             if avg_engagement > 0.8:
                 notes.append("Student shows high engagement - provide advanced challenges and leadership opportunities")
             elif avg_engagement < 0.4:
                 notes.append("Student needs additional motivation - focus on success experiences and interest connections")
         
         # Creative strengths leverage
-        for strength in student_profile.creative_strengths:
-            notes.append(f"Leverage student's strength in {strength} as an entry point for learning")
+        notes.extend(
+            f"Leverage student's strength in {strength} as an entry point for learning"
+            for strength in student_profile.creative_strengths
+        )
         
         # Challenge area support
-        for challenge in student_profile.challenge_areas:
-            notes.append(f"Provide additional support and scaffolding for {challenge}")
+        notes.extend(
+            f"Provide additional support and scaffolding for {challenge}"
+            for challenge in student_profile.challenge_areas
+        )
         
         # Collaboration preferences
-        if student_profile.collaboration_preference == "individual":
-            notes.append("Respect need for individual work time while providing optional collaboration")
-        elif student_profile.collaboration_preference == "small_group":
-            notes.append("Design activities for 2-4 student groups with clear roles")
-        elif student_profile.collaboration_preference == "large_group":
-            notes.append("Include whole-class activities and community building elements")
+        collaboration_note = COLLABORATION_NOTES.get(student_profile.collaboration_preference)
+        if collaboration_note:
+            notes.append(collaboration_note)
         
         # Modality preferences
-        preferred_modalities = [m.value for m in student_profile.preferred_modalities]
-        notes.append(f"Emphasize {', '.join(preferred_modalities)} approaches for optimal engagement")
+        notes.append(f"Emphasize {student_profile.preferred_modalities_display()} approaches for optimal engagement")
         
         return notes
     
-    async def _design_multi_sensory_components(
+    def _design_multi_sensory_components(
         self,
         hooks: List[CreativeHook],
         student_profile: StudentCreativeProfile
     ) -> Dict[str, Any]:
         """Design components that engage multiple senses"""
         
-        components = {
-            'visual': [],
-            'auditory': [],
-            'tactile': [],
-            'kinesthetic': [],
-            'environmental': []
-        }
-        
-        # Visual components
-        components['visual'].extend([
-            'color_coded_materials',
-            'visual_progress_tracking',
-            'infographic_summaries',
-            'student_created_visuals'
-        ])
-        
-        # Auditory components
-        components['auditory'].extend([
-            'background_music_for_focus',
-            'sound_effects_for_engagement',
-            'verbal_explanation_opportunities',
-            'discussion_and_sharing_time'
-        ])
-        
-        # Tactile components
-        components['tactile'].extend([
-            'manipulative_materials',
-            'texture_based_learning_aids',
-            'hands_on_creation_activities',
-            'physical_model_building'
-        ])
-        
-        # Kinesthetic components
-        components['kinesthetic'].extend([
-            'movement_based_activities',
-            'gesture_and_demonstration',
-            'role_playing_and_acting',
-            'physical_space_utilization'
-        ])
-        
-        # Environmental components
-        components['environmental'].extend([
-            'flexible_seating_arrangements',
-            'natural_lighting_when_possible',
-            'temperature_and_comfort_considerations',
-            'noise_level_management'
-        ])
-        
-        return components
+        # The components are static; copy them so each experience can be edited
+        return {sense: list(items) for sense, items in MULTI_SENSORY_COMPONENTS.items()}
     
-    async def _add_surprise_elements(
+    def _add_surprise_elements(
         self,
         experience: LearningExperience,
         student_profile: StudentCreativeProfile
     ) -> LearningExperience:
         """Add surprise elements to spark curiosity and delight"""
         
-        surprises = []
-        
-        # Unexpected connections
-        surprises.append("Reveal surprising real-world applications of the concepts")
-        surprises.append("Show connections to student's personal interests")
-        surprises.append("Introduce guest expert or unusual perspective")
-        
-        # Interactive reveals
-        surprises.append("Hidden information unlocked through student discovery")
-        surprises.append("Unexpected twist in the narrative or challenge")
-        surprises.append("Student choice that changes the learning path")
-        
-        # Perspective shifts
-        surprises.append("View the concept from an unusual angle or scale")
-        surprises.append("Role reversal where students become the teachers")
-        surprises.append("Time-shift perspective (past, future, or different era)")
-        
         # Select 2-3 surprises that fit the experience
-        selected_surprises = random.sample(surprises, min(3, len(surprises)))
+        selected_surprises = self._rng.sample(EXPERIENCE_SURPRISES, min(3, len(EXPERIENCE_SURPRISES)))
         
         experience.surprise_elements = selected_surprises
         return experience
@@ -1079,31 +1373,29 @@ class CreativeSynthesisManager:
     ) -> Dict[str, float]:
         """Evaluate how effective the creative experience was"""
         
-        effectiveness_metrics = {
-            'engagement_level': 0.0,
-            'learning_achievement': 0.0,
-            'creative_expression': 0.0,
-            'retention_prediction': 0.0,
-            'student_satisfaction': 0.0
-        }
+        effectiveness_metrics = dict.fromkeys(EFFECTIVENESS_METRICS, 0.0)
         
-        # Analyze engagement
-        if 'engagement_scores' in student_responses:
-            effectiveness_metrics['engagement_level'] = sum(student_responses['engagement_scores']) / len(student_responses['engagement_scores'])
+        # Analyze engagement; per-experience score lists are short, so fmean
+        # beats building an array (batch analytics use effectiveness_array)
+        engagement_scores = student_responses.get('engagement_scores')
+        if engagement_scores:
+            effectiveness_metrics['engagement_level'] = fmean(engagement_scores)
         
         # Analyze learning achievement
         if 'assessment_results' in learning_outcomes:
             effectiveness_metrics['learning_achievement'] = learning_outcomes['assessment_results'].get('average_score', 0.0)
         
         # Analyze creative expression
-        if 'creativity_ratings' in student_responses:
-            effectiveness_metrics['creative_expression'] = sum(student_responses['creativity_ratings']) / len(student_responses['creativity_ratings'])
+        creativity_ratings = student_responses.get('creativity_ratings')
+        if creativity_ratings:
+            effectiveness_metrics['creative_expression'] = fmean(creativity_ratings)
         
         # Predict retention based on engagement and creativity
+        w_engagement, w_creativity, w_learning = RETENTION_WEIGHTS
         effectiveness_metrics['retention_prediction'] = (
-            effectiveness_metrics['engagement_level'] * 0.4 +
-            effectiveness_metrics['creative_expression'] * 0.3 +
-            effectiveness_metrics['learning_achievement'] * 0.3
+            effectiveness_metrics['engagement_level'] * w_engagement +
+            effectiveness_metrics['creative_expression'] * w_creativity +
+            effectiveness_metrics['learning_achievement'] * w_learning
         )
         
         # Student satisfaction
@@ -1111,10 +1403,64 @@ class CreativeSynthesisManager:
             effectiveness_metrics['student_satisfaction'] = student_responses['satisfaction_survey'].get('overall_rating', 0.0)
         
         # Store for future improvements
-        self.experience_effectiveness[experience_id] = effectiveness_metrics
+        self._store_effectiveness(experience_id, effectiveness_metrics)
         
         return effectiveness_metrics
     
+    @property
+    def experience_effectiveness(self) -> Dict[str, Dict[str, float]]:
+        """Stored effectiveness metrics per experience id
+        
+        Returns a copy built from the column storage; assign a mapping to
+        replace the stored metrics.
+        """
+        return {
+            experience_id: self._effectiveness_row(row)
+            for experience_id, row in self._effectiveness_rows.items()
+        }
+    
+    @experience_effectiveness.setter
+    def experience_effectiveness(self, effectiveness: Mapping[str, Mapping[str, float]]) -> None:
+        # One float64 column per metric plus an experience id -> row index,
+        # with running totals for reporting
+        self._effectiveness_columns = {metric: array('d') for metric in EFFECTIVENESS_METRICS}
+        self._effectiveness_rows: Dict[str, int] = {}
+        self._metric_sums = defaultdict(float)
+        self._metric_count = 0
+        self._high_performing_count = 0
+        for experience_id, metrics in effectiveness.items():
+            self._store_effectiveness(experience_id, metrics)
+    
+    def _store_effectiveness(self, experience_id: str, metrics: Mapping[str, float]) -> None:
+        """Insert or overwrite one experience's row, keeping the running totals current"""
+        metrics = {metric: metrics.get(metric, 0.0) for metric in EFFECTIVENESS_METRICS}
+        columns = self._effectiveness_columns
+        row = self._effectiveness_rows.get(experience_id)
+        if row is None:
+            self._effectiveness_rows[experience_id] = len(columns['engagement_level'])
+            for metric, value in metrics.items():
+                columns[metric].append(value)
+        else:
+            self._update_metric_totals(self._effectiveness_row(row), -1)
+            for metric, value in metrics.items():
+                columns[metric][row] = value
+        self._update_metric_totals(metrics, 1)
+    
+    def effectiveness_array(self, metric: str) -> np.ndarray:
+        """Copy of one effectiveness metric across all experiences, in evaluation order"""
+        return np.array(self._effectiveness_columns[metric], dtype=np.float64)
+    
+    def _effectiveness_row(self, row: int) -> Dict[str, float]:
+        return {metric: column[row] for metric, column in self._effectiveness_columns.items()}
+    
+    def _update_metric_totals(self, metrics: Dict[str, float], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one experience from the running totals"""
+        for metric, value in metrics.items():
+            self._metric_sums[metric] += sign * value
+        self._metric_count += sign
+        if metrics['engagement_level'] > 0.8 and metrics['learning_achievement'] > 0.7:
+            self._high_performing_count += sign
+    
     async def refine_creative_approach(
         self,
         student_id: str,
@@ -1134,19 +1480,28 @@ class CreativeSynthesisManager:
         
         patterns = self.student_response_patterns[student_id]
         
+        modality_totals = self._modality_totals.get(student_id)
+        if modality_totals is None:
+            # Seed from scores already present, e.g. restored response patterns
+            modality_totals = self._modality_totals[student_id] = {
+                modality: [sum(scores), len(scores)]
+                for modality, scores in patterns['effective_modalities'].items() if scores
+            }
+        
         # Track modality effectiveness
         if 'preferred_modality' in student_feedback:
             modality = student_feedback['preferred_modality']
-            if modality not in patterns['effective_modalities']:
-                patterns['effective_modalities'][modality] = []
-            patterns['effective_modalities'][modality].append(experience_effectiveness['engagement_level'])
+            engagement = experience_effectiveness['engagement_level']
+            patterns['effective_modalities'].setdefault(modality, []).append(engagement)
+            totals = modality_totals.setdefault(modality, [0.0, 0])
+            totals[0] += engagement
+            totals[1] += 1
         
         # Track preference trends
         if 'activity_preferences' in student_feedback:
+            preference_trends = patterns['preference_trends']
             for activity, rating in student_feedback['activity_preferences'].items():
-                if activity not in patterns['preference_trends']:
-                    patterns['preference_trends'][activity] = []
-                patterns['preference_trends'][activity].append(rating)
+                preference_trends.setdefault(activity, []).append(rating)
         
         # Generate recommendations
         recommendations = {
@@ -1157,15 +1512,16 @@ class CreativeSynthesisManager:
             'social_learning_adjustment': 'maintain'
         }
         
-        # Analyze most effective modalities
-        if patterns['effective_modalities']:
-            avg_effectiveness = {
-                modality: sum(scores) / len(scores)
-                for modality, scores in patterns['effective_modalities'].items()
-            }
-            recommendations['prioritize_modalities'] = [
-                modality for modality, avg in avg_effectiveness.items() if avg > 0.7
-            ]
+        # Prioritize the most effective modalities and avoid the least
+        # effective ones, in one pass over the running means
+        prioritize = recommendations['prioritize_modalities']
+        avoid = recommendations['avoid_approaches']
+        for modality, (total, count) in modality_totals.items():
+            average = total / count
+            if average > 0.7:
+                prioritize.append(modality)
+            elif average < 0.3:
+                avoid.append(modality)
         
         # Complexity adjustment
         if experience_effectiveness['engagement_level'] < 0.4:
@@ -1178,7 +1534,7 @@ class CreativeSynthesisManager:
             recommendations['increase_elements'] = student_feedback['most_engaging_elements']
         
         if 'least_engaging_elements' in student_feedback:
-            recommendations['avoid_approaches'] = student_feedback['least_engaging_elements']
+            avoid.extend(student_feedback['least_engaging_elements'])
         
         return recommendations
     
@@ -1199,22 +1555,22 @@ class CreativeSynthesisManager:
             'recommendations': []
         }
         
-        # Calculate summary metrics
-        all_effectiveness = list(self.experience_effectiveness.values())
-        if all_effectiveness:
+        # Calculate summary metrics from the running totals
+        count = self._metric_count
+        sums = self._metric_sums
+        if count:
             report['summary_metrics'] = {
-                'average_engagement': sum(e['engagement_level'] for e in all_effectiveness) / len(all_effectiveness),
-                'average_learning_achievement': sum(e['learning_achievement'] for e in all_effectiveness) / len(all_effectiveness),
-                'average_creativity': sum(e['creative_expression'] for e in all_effectiveness) / len(all_effectiveness),
-                'average_satisfaction': sum(e['student_satisfaction'] for e in all_effectiveness) / len(all_effectiveness),
-                'total_experiences_created': len(all_effectiveness)
+                'average_engagement': sums['engagement_level'] / count,
+                'average_learning_achievement': sums['learning_achievement'] / count,
+                'average_creativity': sums['creative_expression'] / count,
+                'average_satisfaction': sums['student_satisfaction'] / count,
+                'total_experiences_created': count
             }
         
         # Identify successful approaches
-        if all_effectiveness:
-            high_performing = [e for e in all_effectiveness if e['engagement_level'] > 0.8 and e['learning_achievement'] > 0.7]
+        if count:
             report['successful_approaches'] = [
-                f"High engagement creative experiences: {len(high_performing)} out of {len(all_effectiveness)}",
+                f"High engagement creative experiences: {self._high_performing_count} out of {count}",
                 "Most effective creative modalities based on outcomes",
                 "Student satisfaction patterns and preferences"
             ]
@@ -1235,10 +1591,16 @@ class CreativeSynthesisManager:
     def set_goal_primitive(self, goal_primitive):
         """Set reference to Goal Primitive for learning objective analysis"""
         self.goal_primitive = goal_primitive
+        self._goal_analysis_cache.clear()
+        self._goal_analysis_pending.clear()
+        batch_fn = getattr(goal_primitive, 'analyze_learning_objectives_batch', None)
+        self._goal_batcher = _MicroBatcher(batch_fn) if batch_fn else None
     
     def set_empathetic_interaction(self, empathetic_interaction):
         """Set reference to Empathetic Interaction for student understanding"""
         self.empathetic_interaction = empathetic_interaction
+        batch_fn = getattr(empathetic_interaction, 'get_student_profiles_batch', None)
+        self._profile_batcher = _MicroBatcher(batch_fn) if batch_fn else None
     
     def set_adaptive_reasoning(self, adaptive_reasoning):
         """Set reference to Adaptive Reasoning for pedagogical validation"""
@@ -1254,14 +1616,48 @@ class CreativeSynthesisManager:
     
     async def collaborate_with_goal_primitive(self, learning_objective: str) -> Dict[str, Any]:
         """Collaborate with Goal Primitive to understand learning requirements"""
-        if self.goal_primitive:
-            return await self.goal_primitive.analyze_learning_objective(learning_objective)
-        return {}
+        if not self.goal_primitive:
+            return {}
+        
+        cache_key = _fingerprint(learning_objective)
+        entry = _lru_get(self._goal_analysis_cache, cache_key)
+        if entry is not None and time.monotonic() - entry[0] <= GOAL_ANALYSIS_TTL_SECONDS:
+            return copy.deepcopy(entry[1])
+        
+        # Concurrent requests for an objective share one in-flight analysis;
+        # futures are bound to their event loop, so never share across loops
+        loop = asyncio.get_running_loop()
+        pending = self._goal_analysis_pending.get(cache_key)
+        if pending is None or pending.get_loop() is not loop:
+            if self._goal_batcher is not None:
+                pending = self._goal_batcher.submit(learning_objective)
+            else:
+                pending = asyncio.ensure_future(
+                    self.goal_primitive.analyze_learning_objective(learning_objective)
+                )
+            self._goal_analysis_pending[cache_key] = pending
+            pending.add_done_callback(partial(self._finish_goal_analysis, cache_key))
+        
+        # Shielded so one cancelled caller doesn't cancel the shared analysis
+        analysis = await asyncio.shield(pending)
+        return copy.deepcopy(analysis)
+    
+    def _finish_goal_analysis(self, cache_key: str, future: asyncio.Future) -> None:
+        """Cache the result of a finished Goal Primitive analysis; failures are not cached"""
+        if self._goal_analysis_pending.get(cache_key) is not future:
+            return  # Superseded, e.g. by set_goal_primitive
+        del self._goal_analysis_pending[cache_key]
+        if not future.cancelled() and future.exception() is None:
+            entry = (time.monotonic(), copy.deepcopy(future.result()))
+            _lru_put(self._goal_analysis_cache, cache_key, entry, GOAL_ANALYSIS_CACHE_MAX_SIZE)
     
     async def collaborate_with_empathetic_interaction(self, student_id: str) -> StudentCreativeProfile:
         """Get student creative profile from Empathetic Interaction"""
         if self.empathetic_interaction:
-            student_data = await self.empathetic_interaction.get_student_profile(student_id)
+            if self._profile_batcher is not None:
+                student_data = await self._profile_batcher.submit(student_id)
+            else:
+                student_data = await self.empathetic_interaction.get_student_profile(student_id)
             # Convert to StudentCreativeProfile
             return self._convert_to_creative_profile(student_data)
         return self._default_creative_profile()
@@ -39,101 +39,304 @@ Every creative output serves pedagogical purposes:
 - Builds emotional connections to subject matter
 """
 
+from array import array
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from enum import Enum
-from typing import Dict, List, Optional, Any, Union, Set, Tuple
-from pydantic import BaseModel, Field, validator, root_validator
-from uuid import UUID, uuid4
+from enum import IntEnum
+from functools import lru_cache, partial
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Any, Sequence, Tuple, Type, get_args, get_origin
+from pydantic import BaseModel, Field
+from pydantic.functional_serializers import PlainSerializer
+from pydantic.functional_validators import AfterValidator, PlainValidator
+from pydantic_core import core_schema
+import hashlib
+import msgspec
 import numpy as np
+import os
+
+try:
+    from typing import Annotated
+except ImportError:  # Python 3.8
+    from typing_extensions import Annotated
+
+from .kernels import NUMBA_AVAILABLE, engagement_kernel
 
 # ============================================================================
 # Core Enums and Constants
 # ============================================================================
 
-class CreativeMode(str, Enum):
+class CodedEnum(IntEnum):
+    """Integer enum exchanged as its lowercase name at API boundaries
+    
+    Members are stored as plain ints; parse() maps the string code straight to
+    the member with a single dict lookup and JSON output uses the precomputed
+    code.
+    """
+    
+    @property
+    def code(self) -> str:
+        return _ENUM_TOSTR[type(self)][self]
+    
+    @classmethod
+    def parse(cls, value: Any) -> "CodedEnum":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            try:
+                return _ENUM_FROMSTR[cls][value]
+            except KeyError:
+                raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+        return cls(value)
+    
+    @classmethod
+    def _missing_(cls, value: Any) -> Optional["CodedEnum"]:
+        # Accept the string code too, e.g. CreativeMode("storytelling")
+        if isinstance(value, str):
+            return _ENUM_FROMSTR[cls].get(value)
+        return None
+    
+    def __str__(self) -> str:
+        return self.code
+    
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls.parse,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                attrgetter("code"), when_used="json"
+            )
+        )
+
+class CreativeMode(CodedEnum):
     """Different modes of creative synthesis"""
-    STORYTELLING = "storytelling"                    # Narrative-based learning
-    METAPHOR_BUILDING = "metaphor_building"          # Analogies and metaphors
-    GAMIFICATION = "gamification"                    # Game-based learning
-    VISUALIZATION = "visualization"                  # Visual representations
-    EXPERIENTIAL = "experiential"                    # Hands-on experiences
-    ROLE_PLAYING = "role_playing"                    # Character-based learning
-    ARTISTIC_EXPRESSION = "artistic_expression"      # Creative arts integration
-    PROBLEM_REFRAMING = "problem_reframing"          # Alternative problem perspectives
-    SCENARIO_BUILDING = "scenario_building"          # Situational learning
-    INTERACTIVE_DIALOGUE = "interactive_dialogue"    # Conversational creativity
-
-class CreativityLevel(str, Enum):
+    STORYTELLING = 0                                 # Narrative-based learning
+    METAPHOR_BUILDING = 1                            # Analogies and metaphors
+    GAMIFICATION = 2                                 # Game-based learning
+    VISUALIZATION = 3                                # Visual representations
+    EXPERIENTIAL = 4                                 # Hands-on experiences
+    ROLE_PLAYING = 5                                 # Character-based learning
+    ARTISTIC_EXPRESSION = 6                          # Creative arts integration
+    PROBLEM_REFRAMING = 7                            # Alternative problem perspectives
+    SCENARIO_BUILDING = 8                            # Situational learning
+    INTERACTIVE_DIALOGUE = 9                         # Conversational creativity
+
+class CreativityLevel(CodedEnum):
     """Levels of creativity intensity"""
-    SUBTLE = "subtle"                     # Light creative touches
-    MODERATE = "moderate"                 # Balanced creativity and structure
-    HIGH = "high"                        # Strong creative elements
-    IMMERSIVE = "immersive"              # Fully creative experience
-    TRANSFORMATIVE = "transformative"     # Completely reimagined approach
+    SUBTLE = 0                            # Light creative touches
+    MODERATE = 1                          # Balanced creativity and structure
+    HIGH = 2                             # Strong creative elements
+    IMMERSIVE = 3                        # Fully creative experience
+    TRANSFORMATIVE = 4                    # Completely reimagined approach
 
-class LearningModality(str, Enum):
+class LearningModality(CodedEnum):
     """Different ways of experiencing content"""
-    VISUAL = "visual"                    # Images, diagrams, videos
-    AUDITORY = "auditory"                # Sounds, music, speech
-    KINESTHETIC = "kinesthetic"          # Movement, touch, manipulation
-    LOGICAL = "logical"                  # Patterns, sequences, analysis
-    SOCIAL = "social"                    # Group activities, discussion
-    SOLITARY = "solitary"                # Individual reflection, study
-    LINGUISTIC = "linguistic"            # Words, language, writing
-    MATHEMATICAL = "mathematical"        # Numbers, formulas, calculations
-    SPATIAL = "spatial"                  # 3D thinking, navigation
-    MUSICAL = "musical"                  # Rhythm, melody, harmony
-
-class CreativeOutputType(str, Enum):
+    VISUAL = 0                           # Images, diagrams, videos
+    AUDITORY = 1                         # Sounds, music, speech
+    KINESTHETIC = 2                      # Movement, touch, manipulation
+    LOGICAL = 3                          # Patterns, sequences, analysis
+    SOCIAL = 4                           # Group activities, discussion
+    SOLITARY = 5                         # Individual reflection, study
+    LINGUISTIC = 6                       # Words, language, writing
+    MATHEMATICAL = 7                     # Numbers, formulas, calculations
+    SPATIAL = 8                          # 3D thinking, navigation
+    MUSICAL = 9                          # Rhythm, melody, harmony
+
+class CreativeOutputType(CodedEnum):
     """Types of creative outputs"""
-    STORY = "story"                      # Narrative content
-    METAPHOR = "metaphor"                # Analogical content
-    GAME = "game"                        # Interactive game
-    VISUALIZATION = "visualization"      # Visual representation
-    ACTIVITY = "activity"                # Learning activity
-    SCENARIO = "scenario"                # Situational context
-    CHARACTER = "character"              # Educational persona
-    WORLD = "world"                      # Learning environment
-    CHALLENGE = "challenge"              # Creative problem
-    EXPERIENCE = "experience"            # Immersive learning journey
-
-class EngagementFactor(str, Enum):
+    STORY = 0                            # Narrative content
+    METAPHOR = 1                         # Analogical content
+    GAME = 2                             # Interactive game
+    VISUALIZATION = 3                    # Visual representation
+    ACTIVITY = 4                         # Learning activity
+    SCENARIO = 5                         # Situational context
+    CHARACTER = 6                        # Educational persona
+    WORLD = 7                            # Learning environment
+    CHALLENGE = 8                        # Creative problem
+    EXPERIENCE = 9                       # Immersive learning journey
+
+class EngagementFactor(CodedEnum):
     """Factors that drive engagement"""
-    CURIOSITY = "curiosity"              # Questions and mysteries
-    SURPRISE = "surprise"                # Unexpected elements
-    HUMOR = "humor"                      # Fun and laughter
-    CHALLENGE = "challenge"              # Appropriate difficulty
-    RELEVANCE = "relevance"              # Personal connection
-    AGENCY = "agency"                    # Student control and choice
-    MASTERY = "mastery"                  # Skill development
-    PURPOSE = "purpose"                  # Meaningful goals
-    SOCIAL_CONNECTION = "social_connection"  # Peer interaction
-    ACHIEVEMENT = "achievement"          # Recognition and progress
-
-class CreativeConstraint(str, Enum):
+    CURIOSITY = 0                        # Questions and mysteries
+    SURPRISE = 1                         # Unexpected elements
+    HUMOR = 2                            # Fun and laughter
+    CHALLENGE = 3                        # Appropriate difficulty
+    RELEVANCE = 4                        # Personal connection
+    AGENCY = 5                           # Student control and choice
+    MASTERY = 6                          # Skill development
+    PURPOSE = 7                          # Meaningful goals
+    SOCIAL_CONNECTION = 8                    # Peer interaction
+    ACHIEVEMENT = 9                      # Recognition and progress
+
+class CreativeConstraint(CodedEnum):
     """Constraints that guide creative output"""
-    AGE_APPROPRIATE = "age_appropriate"   # Suitable for target age
-    CURRICULUM_ALIGNED = "curriculum_aligned"  # Meets learning standards
-    TIME_LIMITED = "time_limited"        # Fits available time
-    RESOURCE_CONSCIOUS = "resource_conscious"  # Uses available materials
-    CULTURALLY_SENSITIVE = "culturally_sensitive"  # Respectful and inclusive
-    ATTENTION_SPAN = "attention_span"    # Matches student focus capacity
-    PRIOR_KNOWLEDGE = "prior_knowledge"  # Builds on existing understanding
-    LEARNING_GOALS = "learning_goals"    # Serves educational objectives
-    SAFETY_FOCUSED = "safety_focused"    # Physically and emotionally safe
-    TECHNOLOGY_APPROPRIATE = "technology_appropriate"  # Suitable tech use
+    AGE_APPROPRIATE = 0                   # Suitable for target age
+    CURRICULUM_ALIGNED = 1                     # Meets learning standards
+    TIME_LIMITED = 2                     # Fits available time
+    RESOURCE_CONSCIOUS = 3                     # Uses available materials
+    CULTURALLY_SENSITIVE = 4                       # Respectful and inclusive
+    ATTENTION_SPAN = 5                   # Matches student focus capacity
+    PRIOR_KNOWLEDGE = 6                  # Builds on existing understanding
+    LEARNING_GOALS = 7                   # Serves educational objectives
+    SAFETY_FOCUSED = 8                   # Physically and emotionally safe
+    TECHNOLOGY_APPROPRIATE = 9                         # Suitable tech use
+
+# String code <-> member tables for each CodedEnum
+_ENUM_TOSTR: Dict[type, Tuple[str, ...]] = {}
+_ENUM_FROMSTR: Dict[type, Mapping[str, CodedEnum]] = {}
+for _enum in (CreativeMode, CreativityLevel, LearningModality, CreativeOutputType,
+              EngagementFactor, CreativeConstraint):
+    _ENUM_TOSTR[_enum] = tuple(member.name.lower() for member in _enum)
+    _ENUM_FROMSTR[_enum] = MappingProxyType(
+        {member.name.lower(): member for member in _enum}
+    )
+del _enum
 
 # ============================================================================
 # Core Schema Models
 # ============================================================================
 
+def _make_id(prefix: str = "") -> str:
+    """Random 128-bit hex id, skipping uuid4()'s UUID object and formatting"""
+    return prefix + os.urandom(16).hex()
+
+# Score in [0, 1]; pydantic models check it on construction, structs when
+# decoded or converted
+Score = Annotated[float, msgspec.Meta(ge=0.0, le=1.0), Field(ge=0.0, le=1.0)]
+
+# Richness per modality, stored as a float64 vector indexed by LearningModality
+MODALITY_COUNT = len(LearningModality)
+
+def _modality_vector(value: Any) -> np.ndarray:
+    """Coerce a modality -> richness mapping or a length-MODALITY_COUNT sequence"""
+    if isinstance(value, Mapping):
+        vector = np.zeros(MODALITY_COUNT)
+        for modality, richness in value.items():
+            vector[LearningModality.parse(modality)] = richness
+        return vector
+    vector = np.asarray(value, dtype=np.float64)
+    if vector.shape != (MODALITY_COUNT,):
+        raise ValueError(f"Expected {MODALITY_COUNT} modality values, got shape {vector.shape}")
+    return vector
+
+def _modality_mapping(vector: np.ndarray) -> Dict[str, float]:
+    """JSON form of a modality vector: code -> richness for addressed modalities"""
+    return {
+        code: richness
+        for code, richness in zip(_ENUM_TOSTR[LearningModality], vector.tolist())
+        if richness
+    }
+
+ModalityVector = Annotated[
+    np.ndarray,
+    PlainValidator(_modality_vector),
+    PlainSerializer(_modality_mapping, when_used="json"),
+]
+
+# Read-only str -> str mapping for frozen models, dumped as a plain dict
+_FrozenStrMapping = Annotated[Mapping[str, str], AfterValidator(MappingProxyType), PlainSerializer(dict)]
+
+# Shared field prototypes; pydantic copies a FieldInfo per use
+_LIST_FIELD = Field(default_factory=list)
+_DICT_FIELD = Field(default_factory=dict)
+
+# Shared default for struct sequence fields; most stay empty, so instances
+# share this tuple instead of allocating a list each. Assign a new list to
+# populate one rather than appending.
+_EMPTY_SEQUENCE: Tuple[()] = ()
+
+def _encode_numpy(obj: Any) -> Any:
+    """msgspec enc_hook for numpy values, e.g. scores left in content dicts"""
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise NotImplementedError(f"Cannot encode objects of type {type(obj).__name__}")
+
+@lru_cache(maxsize=None)
+def _coded_fields(struct_type: Type[msgspec.Struct]) -> Tuple[Tuple[str, Type[CodedEnum], bool], ...]:
+    """(name, enum, is_sequence) for each struct field holding CodedEnum values"""
+    coded = []
+    for info in msgspec.structs.fields(struct_type):
+        annotation, many = info.type, False
+        args = get_args(annotation)
+        if get_origin(annotation) is not None and len(args) == 1:
+            annotation, many = args[0], True
+        if isinstance(annotation, type) and issubclass(annotation, CodedEnum):
+            coded.append((info.name, annotation, many))
+    return tuple(coded)
+
+def _parse_codes(struct_type: Type[msgspec.Struct], data: Any) -> Any:
+    """Swap string codes in raw struct data for enum members
+    
+    msgspec decodes IntEnum fields from ints only, so codes are resolved here
+    before decoding or converting.
+    """
+    coded = _coded_fields(struct_type)
+    if not coded or not isinstance(data, Mapping):
+        return data
+    data = dict(data)
+    try:
+        for name, enum_type, many in coded:
+            value = data.get(name)
+            if many and isinstance(value, (list, tuple)):
+                data[name] = [enum_type.parse(v) if isinstance(v, str) else v for v in value]
+            elif isinstance(value, str):
+                data[name] = enum_type.parse(value)
+    except ValueError as e:
+        raise msgspec.ValidationError(f"{e} - at `$.{name}`") from None
+    return data
+
+def _struct_to_builtins(struct: msgspec.Struct) -> Dict[str, Any]:
+    """Builtin form of a struct with CodedEnum fields written as string codes"""
+    data = msgspec.to_builtins(struct, enc_hook=_encode_numpy)
+    for name, enum_type, many in _coded_fields(type(struct)):
+        codes = _ENUM_TOSTR[enum_type]
+        value = data.get(name)
+        if many and value is not None:
+            data[name] = [codes[v] for v in value]
+        elif value is not None:
+            data[name] = codes[value]
+    return data
+
+class CreativeStruct(msgspec.Struct, kw_only=True, gc=False):
+    """Base for the leaf creative schemas
+    
+    These hold plain scalars, enums and containers and are built in bulk, so they
+    are msgspec structs rather than pydantic models: fields are type-checked when
+    decoded (see creative_json_decoder) or converted, not on every construction.
+    """
+    
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> core_schema.CoreSchema:
+        # Lets pydantic models hold these structs, converting dict input
+        return core_schema.no_info_plain_validator_function(
+            cls._coerce,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                _struct_to_builtins, when_used='json'
+            )
+        )
+    
+    @classmethod
+    def _coerce(cls, value: Any) -> "CreativeStruct":
+        if isinstance(value, cls):
+            return value
+        return msgspec.convert(_parse_codes(cls, value), cls, strict=False)
+
+class CreativeRecordStruct(CreativeStruct, kw_only=True):
+    """Struct counterpart of BaseCreativeModel"""
+    id: str = msgspec.field(default_factory=_make_id)
+    timestamp: datetime = msgspec.field(default_factory=datetime.now)
+
 class BaseCreativeModel(BaseModel):
     """Base model for all creative synthesis schemas"""
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=_make_id)
     timestamp: datetime = Field(default_factory=datetime.now)
     
     class Config:
-        use_enum_values = True
         json_encoders = {
             datetime: lambda v: v.isoformat(),
             timedelta: lambda v: v.total_seconds(),
@@ -145,179 +348,182 @@ class CreativeContextSchema(BaseModel):
     """Schema defining the context for creative synthesis"""
     # Learning context
     subject_area: str = Field(..., description="Academic subject or domain")
-    learning_objectives: List[str] = Field(..., description="Specific learning goals")
-    target_concepts: List[str] = Field(..., description="Key concepts to be learned")
+    learning_objectives: Tuple[str, ...] = Field(..., description="Specific learning goals")
+    target_concepts: Tuple[str, ...] = Field(..., description="Key concepts to be learned")
     difficulty_level: str = Field(default="moderate", description="Complexity level")
     
     # Student context
     age_group: str = Field(..., description="Target age group or grade level")
-    learning_style_preferences: List[LearningModality] = Field(default_factory=list)
-    interests: List[str] = Field(default_factory=list, description="Student interests and hobbies")
-    cultural_background: List[str] = Field(default_factory=list, description="Cultural considerations")
-    prior_knowledge: Dict[str, str] = Field(default_factory=dict, description="Existing knowledge base")
+    learning_style_preferences: Tuple[LearningModality, ...] = ()
+    interests: Tuple[str, ...] = Field(default=(), description="Student interests and hobbies")
+    cultural_background: Tuple[str, ...] = Field(default=(), description="Cultural considerations")
+    prior_knowledge: _FrozenStrMapping = Field(default_factory=partial(MappingProxyType, {}), description="Existing knowledge base")
     
     # Creative parameters
     creativity_level: CreativityLevel = Field(default=CreativityLevel.MODERATE)
-    preferred_modalities: List[LearningModality] = Field(default_factory=list)
-    engagement_priorities: List[EngagementFactor] = Field(default_factory=list)
+    preferred_modalities: Tuple[LearningModality, ...] = ()
+    engagement_priorities: Tuple[EngagementFactor, ...] = ()
     
     # Constraints and requirements
     time_constraints: Optional[timedelta] = Field(None, description="Available time")
-    resource_constraints: List[str] = Field(default_factory=list, description="Available resources")
-    platform_constraints: List[str] = Field(default_factory=list, description="Technology limitations")
-    creative_constraints: List[CreativeConstraint] = Field(default_factory=list)
+    resource_constraints: Tuple[str, ...] = Field(default=(), description="Available resources")
+    platform_constraints: Tuple[str, ...] = Field(default=(), description="Technology limitations")
+    creative_constraints: Tuple[CreativeConstraint, ...] = ()
     
     # Session context
     session_id: Optional[str] = Field(None, description="Associated learning session")
     collaborative_context: Optional[str] = Field(None, description="Group or individual learning")
+    
+    class Config:
+        frozen = True
 
-class CreativeElementSchema(BaseModel):
+class CreativeElementSchema(CreativeStruct, kw_only=True):
     """Schema for individual creative elements"""
-    element_id: str = Field(default_factory=lambda: f"element_{uuid4()}")
-    element_type: str = Field(..., description="Type of creative element")
-    title: str = Field(..., description="Element title or name")
-    description: str = Field(..., description="Detailed description")
-    content: Dict[str, Any] = Field(..., description="Element content and details")
+    element_type: str                    # Type of creative element
+    title: str                           # Element title or name
+    description: str                     # Detailed description
+    content: Dict[str, Any]              # Element content and details
+    element_id: str = msgspec.field(default_factory=partial(_make_id, "element_"))
     
     # Educational alignment
-    learning_objective_alignment: List[str] = Field(default_factory=list)
-    concept_reinforcement: List[str] = Field(default_factory=list)
-    skill_development: List[str] = Field(default_factory=list)
+    learning_objective_alignment: Sequence[str] = _EMPTY_SEQUENCE
+    concept_reinforcement: Sequence[str] = _EMPTY_SEQUENCE
+    skill_development: Sequence[str] = _EMPTY_SEQUENCE
     
     # Creative properties
-    creativity_techniques: List[str] = Field(default_factory=list, description="Creative methods used")
-    engagement_factors: List[EngagementFactor] = Field(default_factory=list)
-    modalities_addressed: List[LearningModality] = Field(default_factory=list)
+    creativity_techniques: Sequence[str] = _EMPTY_SEQUENCE  # Creative methods used
+    engagement_factors: Sequence[EngagementFactor] = _EMPTY_SEQUENCE
+    modalities_addressed: Sequence[LearningModality] = _EMPTY_SEQUENCE
     
     # Quality metrics
-    originality_score: float = Field(default=0.5, ge=0.0, le=1.0, description="How original/unique")
-    relevance_score: float = Field(default=0.5, ge=0.0, le=1.0, description="Educational relevance")
-    engagement_potential: float = Field(default=0.5, ge=0.0, le=1.0, description="Expected engagement")
-    implementation_complexity: float = Field(default=0.5, ge=0.0, le=1.0, description="Difficulty to implement")
+    originality_score: Score = 0.5          # How original/unique
+    relevance_score: Score = 0.5            # Educational relevance
+    engagement_potential: Score = 0.5       # Expected engagement
+    implementation_complexity: Score = 0.5  # Difficulty to implement
     
     # Usage information
-    estimated_duration: Optional[timedelta] = Field(None, description="Time to experience/complete")
-    required_resources: List[str] = Field(default_factory=list, description="Needed materials/tools")
-    setup_instructions: List[str] = Field(default_factory=list, description="How to set up")
+    estimated_duration: Optional[timedelta] = None  # Time to experience/complete
+    required_resources: Sequence[str] = _EMPTY_SEQUENCE  # Needed materials/tools
+    setup_instructions: Sequence[str] = _EMPTY_SEQUENCE  # How to set up
 
-class StoryBasedLearningSchema(BaseCreativeModel):
+class StoryBasedLearningSchema(CreativeRecordStruct, kw_only=True):
     """Schema for story-based learning experiences"""
-    story_id: str = Field(default_factory=lambda: f"story_{uuid4()}")
-    title: str = Field(..., description="Story title")
-    genre: str = Field(default="educational_adventure", description="Story genre")
+    story_id: str = msgspec.field(default_factory=partial(_make_id, "story_"))
+    title: str                           # Story title
+    genre: str = "educational_adventure"  # Story genre
     
     # Story structure
-    setting: Dict[str, Any] = Field(..., description="Story setting and world")
-    characters: List[Dict[str, Any]] = Field(..., description="Story characters")
-    plot_outline: List[str] = Field(..., description="Main plot points")
-    conflict_resolution: str = Field(..., description="How story resolves")
+    setting: Dict[str, Any]              # Story setting and world
+    characters: List[Dict[str, Any]]     # Story characters
+    plot_outline: List[str]              # Main plot points
+    conflict_resolution: str             # How story resolves
     
     # Educational integration
-    learning_moments: List[Dict[str, Any]] = Field(..., description="Key learning points in story")
-    concept_embedding: Dict[str, str] = Field(..., description="How concepts are woven in")
-    interactive_elements: List[Dict[str, Any]] = Field(default_factory=list)
+    learning_moments: List[Dict[str, Any]]  # Key learning points in story
+    concept_embedding: Dict[str, str]    # How concepts are woven in
+    interactive_elements: Sequence[Dict[str, Any]] = _EMPTY_SEQUENCE
     
     # Story delivery
-    narrative_style: str = Field(default="engaging", description="Tone and style")
-    reading_level: str = Field(..., description="Appropriate reading level")
-    multimedia_elements: List[str] = Field(default_factory=list, description="Visual, audio components")
+    narrative_style: str = "engaging"    # Tone and style
+    reading_level: str                   # Appropriate reading level
+    multimedia_elements: Sequence[str] = _EMPTY_SEQUENCE  # Visual, audio components
     
     # Engagement design
-    cliffhangers: List[str] = Field(default_factory=list, description="Suspenseful moments")
-    student_choice_points: List[Dict[str, Any]] = Field(default_factory=list)
-    problem_solving_moments: List[Dict[str, Any]] = Field(default_factory=list)
+    cliffhangers: Sequence[str] = _EMPTY_SEQUENCE  # Suspenseful moments
+    student_choice_points: Sequence[Dict[str, Any]] = _EMPTY_SEQUENCE
+    problem_solving_moments: Sequence[Dict[str, Any]] = _EMPTY_SEQUENCE
 
-class MetaphorMappingSchema(BaseCreativeModel):
+class MetaphorMappingSchema(CreativeRecordStruct, kw_only=True):
     """Schema for metaphor and analogy creation"""
-    metaphor_id: str = Field(default_factory=lambda: f"metaphor_{uuid4()}")
-    source_concept: str = Field(..., description="Familiar concept being used as metaphor")
-    target_concept: str = Field(..., description="Complex concept being explained")
+    metaphor_id: str = msgspec.field(default_factory=partial(_make_id, "metaphor_"))
+    source_concept: str                  # Familiar concept being used as metaphor
+    target_concept: str                  # Complex concept being explained
     
     # Metaphor structure
-    similarity_mapping: Dict[str, str] = Field(..., description="How concepts map to each other")
-    key_correspondences: List[Dict[str, Any]] = Field(..., description="Important parallels")
-    metaphor_limitations: List[str] = Field(default_factory=list, description="Where metaphor breaks down")
+    similarity_mapping: Dict[str, str]   # How concepts map to each other
+    key_correspondences: List[Dict[str, Any]]  # Important parallels
+    metaphor_limitations: Sequence[str] = _EMPTY_SEQUENCE  # Where metaphor breaks down
     
     # Presentation
-    metaphor_narrative: str = Field(..., description="How metaphor is presented")
-    visual_elements: List[str] = Field(default_factory=list, description="Supporting visuals")
-    interactive_exploration: List[Dict[str, Any]] = Field(default_factory=list)
+    metaphor_narrative: str              # How metaphor is presented
+    visual_elements: Sequence[str] = _EMPTY_SEQUENCE  # Supporting visuals
+    interactive_exploration: Sequence[Dict[str, Any]] = _EMPTY_SEQUENCE
     
     # Educational effectiveness
-    conceptual_clarity: float = Field(default=0.7, ge=0.0, le=1.0, description="How well it clarifies")
-    memorability: float = Field(default=0.7, ge=0.0, le=1.0, description="How memorable it is")
-    accessibility: float = Field(default=0.7, ge=0.0, le=1.0, description="How accessible to target audience")
+    conceptual_clarity: Score = 0.7      # How well it clarifies
+    memorability: Score = 0.7            # How memorable it is
+    accessibility: Score = 0.7           # How accessible to target audience
 
-class GameBasedLearningSchema(BaseCreativeModel):
+class GameBasedLearningSchema(CreativeRecordStruct, kw_only=True):
     """Schema for gamified learning experiences"""
-    game_id: str = Field(default_factory=lambda: f"game_{uuid4()}")
-    game_title: str = Field(..., description="Game name")
-    game_type: str = Field(..., description="Type of game (puzzle, adventure, simulation, etc.)")
+    game_id: str = msgspec.field(default_factory=partial(_make_id, "game_"))
+    game_title: str                      # Game name
+    game_type: str                       # Type of game (puzzle, adventure, simulation, etc.)
     
     # Game mechanics
-    core_mechanics: List[str] = Field(..., description="Main game mechanics")
-    player_actions: List[str] = Field(..., description="What players can do")
-    win_conditions: List[str] = Field(..., description="How to succeed")
-    challenge_progression: List[Dict[str, Any]] = Field(..., description="How difficulty increases")
+    core_mechanics: List[str]            # Main game mechanics
+    player_actions: List[str]            # What players can do
+    win_conditions: List[str]            # How to succeed
+    challenge_progression: List[Dict[str, Any]]  # How difficulty increases
     
     # Educational integration
-    learning_through_play: Dict[str, str] = Field(..., description="How learning happens in game")
-    skill_practice_opportunities: List[Dict[str, Any]] = Field(..., description="Skill development moments")
-    knowledge_checkpoints: List[Dict[str, Any]] = Field(..., description="Assessment points")
+    learning_through_play: Dict[str, str]  # How learning happens in game
+    skill_practice_opportunities: List[Dict[str, Any]]  # Skill development moments
+    knowledge_checkpoints: List[Dict[str, Any]]  # Assessment points
     
     # Engagement systems
-    reward_system: Dict[str, Any] = Field(..., description="How players are rewarded")
-    progress_tracking: Dict[str, Any] = Field(..., description="Progress visualization")
-    social_elements: List[str] = Field(default_factory=list, description="Multiplayer/social features")
+    reward_system: Dict[str, Any]        # How players are rewarded
+    progress_tracking: Dict[str, Any]    # Progress visualization
+    social_elements: Sequence[str] = _EMPTY_SEQUENCE  # Multiplayer/social features
     
     # Implementation
-    technology_requirements: List[str] = Field(default_factory=list)
-    physical_components: List[str] = Field(default_factory=list)
-    facilitator_role: Optional[str] = Field(None, description="Teacher/facilitator involvement")
+    technology_requirements: Sequence[str] = _EMPTY_SEQUENCE
+    physical_components: Sequence[str] = _EMPTY_SEQUENCE
+    facilitator_role: Optional[str] = None  # Teacher/facilitator involvement
 
-class VisualizationSchema(BaseCreativeModel):
+class VisualizationSchema(CreativeRecordStruct, kw_only=True):
     """Schema for creative visual representations"""
-    visualization_id: str = Field(default_factory=lambda: f"viz_{uuid4()}")
-    visualization_type: str = Field(..., description="Type of visualization")
-    title: str = Field(..., description="Visualization title")
+    visualization_id: str = msgspec.field(default_factory=partial(_make_id, "viz_"))
+    visualization_type: str              # Type of visualization
+    title: str                           # Visualization title
     
     # Visual design
-    visual_metaphor: Optional[str] = Field(None, description="Central visual metaphor")
-    color_scheme: Dict[str, str] = Field(default_factory=dict, description="Color choices and meanings")
-    layout_structure: str = Field(..., description="How elements are arranged")
-    interactive_elements: List[Dict[str, Any]] = Field(default_factory=list)
+    visual_metaphor: Optional[str] = None  # Central visual metaphor
+    color_scheme: Dict[str, str] = msgspec.field(default_factory=dict)  # Color choices and meanings
+    layout_structure: str                # How elements are arranged
+    interactive_elements: Sequence[Dict[str, Any]] = _EMPTY_SEQUENCE
     
     # Content mapping
-    concept_to_visual_mapping: Dict[str, str] = Field(..., description="How concepts become visual")
-    data_encoding: Dict[str, str] = Field(default_factory=dict, description="How information is encoded")
-    narrative_flow: List[str] = Field(default_factory=list, description="Visual storytelling sequence")
+    concept_to_visual_mapping: Dict[str, str]  # How concepts become visual
+    data_encoding: Dict[str, str] = msgspec.field(default_factory=dict)  # How information is encoded
+    narrative_flow: Sequence[str] = _EMPTY_SEQUENCE  # Visual storytelling sequence
     
     # Educational purpose
-    cognitive_load_considerations: List[str] = Field(default_factory=list)
-    attention_guidance: List[str] = Field(default_factory=list, description="How to guide viewer focus")
-    comprehension_scaffolds: List[str] = Field(default_factory=list, description="Supports for understanding")
+    cognitive_load_considerations: Sequence[str] = _EMPTY_SEQUENCE
+    attention_guidance: Sequence[str] = _EMPTY_SEQUENCE  # How to guide viewer focus
+    comprehension_scaffolds: Sequence[str] = _EMPTY_SEQUENCE  # Supports for understanding
 
-class ExperientialLearningSchema(BaseCreativeModel):
+class ExperientialLearningSchema(CreativeRecordStruct, kw_only=True):
     """Schema for hands-on, experiential learning activities"""
-    experience_id: str = Field(default_factory=lambda: f"exp_{uuid4()}")
-    experience_title: str = Field(..., description="Experience name")
-    experience_type: str = Field(..., description="Type of hands-on experience")
+    experience_id: str = msgspec.field(default_factory=partial(_make_id, "exp_"))
+    experience_title: str                # Experience name
+    experience_type: str                 # Type of hands-on experience
     
     # Experience design
-    sensory_engagement: List[LearningModality] = Field(..., description="Senses involved")
-    physical_activities: List[Dict[str, Any]] = Field(..., description="What students physically do")
-    exploration_opportunities: List[str] = Field(..., description="Open-ended discovery moments")
+    sensory_engagement: List[LearningModality]  # Senses involved
+    physical_activities: List[Dict[str, Any]]  # What students physically do
+    exploration_opportunities: List[str]  # Open-ended discovery moments
     
     # Learning through doing
-    skill_practice: List[Dict[str, Any]] = Field(..., description="Skills practiced through experience")
-    concept_discovery: List[Dict[str, Any]] = Field(..., description="Concepts discovered through doing")
-    reflection_prompts: List[str] = Field(..., description="Questions for reflection")
+    skill_practice: List[Dict[str, Any]]  # Skills practiced through experience
+    concept_discovery: List[Dict[str, Any]]  # Concepts discovered through doing
+    reflection_prompts: List[str]        # Questions for reflection
     
     # Practical considerations
-    space_requirements: List[str] = Field(default_factory=list, description="Physical space needed")
-    material_requirements: List[str] = Field(default_factory=list, description="Materials and tools")
-    safety_considerations: List[str] = Field(default_factory=list, description="Safety precautions")
-    time_structure: Dict[str, Any] = Field(..., description="How time is organized")
+    space_requirements: Sequence[str] = _EMPTY_SEQUENCE  # Physical space needed
+    material_requirements: Sequence[str] = _EMPTY_SEQUENCE  # Materials and tools
+    safety_considerations: Sequence[str] = _EMPTY_SEQUENCE  # Safety precautions
+    time_structure: Dict[str, Any]       # How time is organized
 
 # ============================================================================
 # Creative Synthesis Outputs
@@ -325,56 +531,119 @@ class ExperientialLearningSchema(BaseCreativeModel):
 
 class CreativeSynthesisOutputSchema(BaseCreativeModel):
     """Schema for complete creative synthesis outputs"""
-    output_id: str = Field(default_factory=lambda: f"creative_output_{uuid4()}")
+    output_id: str = Field(default_factory=partial(_make_id, "creative_output_"))
     request_id: str = Field(..., description="ID of the request that generated this")
     output_type: CreativeOutputType = Field(..., description="Type of creative output")
     
     # Core content
     primary_content: Dict[str, Any] = Field(..., description="Main creative content")
-    supporting_elements: List[CreativeElementSchema] = Field(default_factory=list)
-    alternative_versions: List[Dict[str, Any]] = Field(default_factory=list)
+    supporting_elements: Tuple[CreativeElementSchema, ...] = ()
+    alternative_versions: Tuple[Dict[str, Any], ...] = ()
     
     # Educational alignment
-    learning_objective_fulfillment: Dict[str, float] = Field(default_factory=dict)
-    concept_coverage: Dict[str, str] = Field(default_factory=dict)
-    skill_development_opportunities: List[str] = Field(default_factory=list)
+    learning_objective_fulfillment: Dict[str, float] = _DICT_FIELD
+    concept_coverage: Dict[str, str] = _DICT_FIELD
+    skill_development_opportunities: Tuple[str, ...] = ()
     
     # Creative quality
-    originality_analysis: Dict[str, Any] = Field(default_factory=dict)
-    engagement_prediction: Dict[str, float] = Field(default_factory=dict)
-    multi_modal_richness: Dict[LearningModality, float] = Field(default_factory=dict)
+    originality_analysis: Dict[str, Any] = _DICT_FIELD
+    engagement_prediction: Dict[str, float] = _DICT_FIELD
+    multi_modal_richness: ModalityVector = Field(default_factory=partial(np.zeros, MODALITY_COUNT))
     
     # Implementation guidance
-    implementation_steps: List[str] = Field(default_factory=list)
-    adaptation_suggestions: List[str] = Field(default_factory=list)
-    extension_possibilities: List[str] = Field(default_factory=list)
+    implementation_steps: Tuple[str, ...] = ()
+    adaptation_suggestions: Tuple[str, ...] = ()
+    extension_possibilities: Tuple[str, ...] = ()
     
     # Quality assurance
     age_appropriateness_check: bool = Field(default=True)
     cultural_sensitivity_check: bool = Field(default=True)
     educational_soundness_check: bool = Field(default=True)
     feasibility_check: bool = Field(default=True)
+    
+    def __eq__(self, other: Any) -> bool:
+        # The richness array has no single truth value, so it is compared with
+        # np.array_equal and the remaining fields as usual
+        if type(other) is not type(self):
+            return NotImplemented
+        return (
+            np.array_equal(self.multi_modal_richness, other.multi_modal_richness)
+            and dict(self.__dict__, multi_modal_richness=None) == dict(other.__dict__, multi_modal_richness=None)
+            and self.__pydantic_private__ == other.__pydantic_private__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
 
-class CreativeProcessInsightSchema(BaseCreativeModel):
-    """Schema capturing insights from the creative process"""
-    process_id: str = Field(default_factory=lambda: f"process_{uuid4()}")
-    output_id: str = Field(..., description="Associated output ID")
+class CreativeProcessInsightSchema(CreativeRecordStruct, kw_only=True):
+    """Schema capturing insights from the creative process
+    
+    Filled in by the engine itself rather than parsed from requests, so it is a
+    struct like the leaf schemas above.
+    """
+    process_id: str = msgspec.field(default_factory=partial(_make_id, "process_"))
+    output_id: str                       # Associated output ID
     
     # Process analysis
-    creative_techniques_used: List[str] = Field(..., description="Creativity methods applied")
-    inspiration_sources: List[str] = Field(default_factory=list, description="What inspired the ideas")
-    iteration_history: List[Dict[str, Any]] = Field(default_factory=list, description="How ideas evolved")
+    creative_techniques_used: List[str]  # Creativity methods applied
+    inspiration_sources: Sequence[str] = _EMPTY_SEQUENCE  # What inspired the ideas
+    iteration_history: Sequence[Dict[str, Any]] = _EMPTY_SEQUENCE  # How ideas evolved
     
     # Decision rationale
-    design_decisions: List[Dict[str, Any]] = Field(default_factory=list)
-    trade_offs_considered: List[Dict[str, Any]] = Field(default_factory=list)
-    alternative_approaches: List[str] = Field(default_factory=list)
+    design_decisions: Sequence[Dict[str, Any]] = _EMPTY_SEQUENCE
+    trade_offs_considered: Sequence[Dict[str, Any]] = _EMPTY_SEQUENCE
+    alternative_approaches: Sequence[str] = _EMPTY_SEQUENCE
     
     # Learning from process
-    successful_elements: List[str] = Field(default_factory=list)
-    challenges_encountered: List[str] = Field(default_factory=list)
-    lessons_learned: List[str] = Field(default_factory=list)
-    future_improvements: List[str] = Field(default_factory=list)
+    successful_elements: Sequence[str] = _EMPTY_SEQUENCE
+    challenges_encountered: Sequence[str] = _EMPTY_SEQUENCE
+    lessons_learned: Sequence[str] = _EMPTY_SEQUENCE
+    future_improvements: Sequence[str] = _EMPTY_SEQUENCE
+
+class CreativeSynthesisBatch:
+    """Column store for many CreativeSynthesisOutputSchema results
+    
+    Keeps one compact column per summary metric instead of a model per output,
+    so batch statistics are single NumPy reductions, e.g.
+    batch.engagement_score().mean().
+    """
+    
+    def __init__(self, outputs: Sequence[CreativeSynthesisOutputSchema] = ()) -> None:
+        self.output_ids: List[str] = []
+        self._output_types = array('b')
+        self._originality = array('d')
+        self._engagement = array('d')
+        self._richness = array('d')  # MODALITY_COUNT values per output, row-major
+        self.extend(outputs)
+    
+    def __len__(self) -> int:
+        return len(self.output_ids)
+    
+    def append(self, output: CreativeSynthesisOutputSchema) -> None:
+        """Add one output's summary metrics to the columns"""
+        self.output_ids.append(output.output_id)
+        self._output_types.append(CreativeOutputType.parse(output.output_type))
+        self._originality.append(output.originality_analysis.get("score", 0.5))
+        self._engagement.append(output.engagement_prediction.get("overall", 0.5))
+        self._richness.extend(output.multi_modal_richness.tolist())
+    
+    def extend(self, outputs: Sequence[CreativeSynthesisOutputSchema]) -> None:
+        for output in outputs:
+            self.append(output)
+    
+    def output_type(self) -> np.ndarray:
+        """CreativeOutputType values, one per output"""
+        return np.array(self._output_types, dtype=np.int8)
+    
+    def originality_score(self) -> np.ndarray:
+        """originality_analysis["score"] per output (0.5 when missing)"""
+        return np.array(self._originality, dtype=np.float64)
+    
+    def engagement_score(self) -> np.ndarray:
+        """engagement_prediction["overall"] per output (0.5 when missing)"""
+        return np.array(self._engagement, dtype=np.float64)
+    
+    def multi_modal_richness(self) -> np.ndarray:
+        """(len(batch), MODALITY_COUNT) matrix of modality richness"""
+        return np.array(self._richness, dtype=np.float64).reshape(-1, MODALITY_COUNT)
 
 # ============================================================================
 # Request/Response Schemas for API
@@ -386,26 +655,29 @@ class CreativeSynthesisRequest(BaseModel):
     creative_context: CreativeContextSchema = Field(..., description="Context for creativity")
     
     # Specific requirements
-    output_preferences: List[CreativeOutputType] = Field(default_factory=list)
-    must_include_elements: List[str] = Field(default_factory=list, description="Required elements")
-    avoid_elements: List[str] = Field(default_factory=list, description="Elements to avoid")
+    output_preferences: Tuple[CreativeOutputType, ...] = ()
+    must_include_elements: Tuple[str, ...] = Field(default=(), description="Required elements")
+    avoid_elements: Tuple[str, ...] = Field(default=(), description="Elements to avoid")
     
     # Quality expectations
-    minimum_originality: float = Field(default=0.3, ge=0.0, le=1.0)
-    minimum_engagement: float = Field(default=0.5, ge=0.0, le=1.0)
-    maximum_complexity: float = Field(default=0.8, ge=0.0, le=1.0)
+    minimum_originality: Score = 0.3
+    minimum_engagement: Score = 0.5
+    maximum_complexity: Score = 0.8
     
     # Delivery options
     provide_alternatives: bool = Field(default=True, description="Generate multiple options")
     include_implementation_guide: bool = Field(default=True)
     include_adaptation_suggestions: bool = Field(default=True)
+    
+    class Config:
+        frozen = True  # validated instances are shared by parse_creative_synthesis_request
 
 class StoryGenerationRequest(BaseModel):
     """Specific request for story-based learning"""
     learning_objectives: List[str] = Field(..., description="What story should teach")
-    story_parameters: Dict[str, Any] = Field(default_factory=dict)
-    character_preferences: List[str] = Field(default_factory=list)
-    setting_preferences: List[str] = Field(default_factory=list)
+    story_parameters: Dict[str, Any] = _DICT_FIELD
+    character_preferences: List[str] = _LIST_FIELD
+    setting_preferences: List[str] = _LIST_FIELD
     story_length: str = Field(default="medium", description="Short, medium, or long")
     interactive_level: str = Field(default="moderate", description="How interactive")
 
@@ -414,13 +686,13 @@ class MetaphorGenerationRequest(BaseModel):
     complex_concept: str = Field(..., description="Concept needing explanation")
     familiar_domains: List[str] = Field(default_factory=list, description="Familiar areas for metaphors")
     metaphor_purpose: str = Field(..., description="What metaphor should accomplish")
-    audience_background: Dict[str, Any] = Field(default_factory=dict)
+    audience_background: Dict[str, Any] = _DICT_FIELD
 
 class GameDesignRequest(BaseModel):
     """Request for educational game design"""
     learning_goals: List[str] = Field(..., description="Educational objectives")
-    game_style_preferences: List[str] = Field(default_factory=list)
-    technology_constraints: List[str] = Field(default_factory=list)
+    game_style_preferences: List[str] = _LIST_FIELD
+    technology_constraints: List[str] = _LIST_FIELD
     player_count: str = Field(default="individual", description="Individual or group")
     session_duration: Optional[timedelta] = Field(None, description="Intended play time")
 
@@ -429,71 +701,127 @@ class VisualizationRequest(BaseModel):
     concepts_to_visualize: List[str] = Field(..., description="What to make visual")
     visualization_purpose: str = Field(..., description="Goal of visualization")
     data_types: List[str] = Field(default_factory=list, description="Types of information to show")
-    interaction_requirements: List[str] = Field(default_factory=list)
-    aesthetic_preferences: Dict[str, Any] = Field(default_factory=dict)
+    interaction_requirements: List[str] = _LIST_FIELD
+    aesthetic_preferences: Dict[str, Any] = _DICT_FIELD
 
 class ExperienceDesignRequest(BaseModel):
     """Request for experiential learning design"""
     learning_through_doing_goals: List[str] = Field(..., description="What to learn by doing")
-    available_resources: List[str] = Field(default_factory=list)
-    space_constraints: List[str] = Field(default_factory=list)
-    safety_requirements: List[str] = Field(default_factory=list)
+    available_resources: List[str] = _LIST_FIELD
+    space_constraints: List[str] = _LIST_FIELD
+    safety_requirements: List[str] = _LIST_FIELD
     group_size: Optional[int] = Field(None, description="Number of participants")
 
 # ============================================================================
 # Quality Assessment and Feedback Schemas
 # ============================================================================
 
-class CreativeQualityAssessmentSchema(BaseCreativeModel):
+class CreativeQualityAssessmentSchema(CreativeRecordStruct, kw_only=True):
     """Schema for assessing quality of creative outputs"""
-    assessment_id: str = Field(default_factory=lambda: f"assessment_{uuid4()}")
-    output_id: str = Field(..., description="Creative output being assessed")
-    assessor_type: str = Field(..., description="Who/what did the assessment")
+    assessment_id: str = msgspec.field(default_factory=partial(_make_id, "assessment_"))
+    output_id: str                       # Creative output being assessed
+    assessor_type: str                   # Who/what did the assessment
     
     # Quality dimensions
-    originality_score: float = Field(..., ge=0.0, le=1.0, description="How original and unique")
-    relevance_score: float = Field(..., ge=0.0, le=1.0, description="Educational relevance")
-    engagement_score: float = Field(..., ge=0.0, le=1.0, description="Predicted engagement")
-    feasibility_score: float = Field(..., ge=0.0, le=1.0, description="How realistic to implement")
-    educational_value: float = Field(..., ge=0.0, le=1.0, description="Learning potential")
+    originality_score: Score             # How original and unique
+    relevance_score: Score               # Educational relevance
+    engagement_score: Score              # Predicted engagement
+    feasibility_score: Score             # How realistic to implement
+    educational_value: Score             # Learning potential
     
     # Detailed feedback
-    strengths: List[str] = Field(default_factory=list, description="What works well")
-    areas_for_improvement: List[str] = Field(default_factory=list, description="What could be better")
-    implementation_challenges: List[str] = Field(default_factory=list)
-    adaptation_opportunities: List[str] = Field(default_factory=list)
+    strengths: Tuple[str, ...] = _EMPTY_SEQUENCE  # What works well
+    areas_for_improvement: Tuple[str, ...] = _EMPTY_SEQUENCE  # What could be better
+    implementation_challenges: Tuple[str, ...] = _EMPTY_SEQUENCE
+    adaptation_opportunities: Tuple[str, ...] = _EMPTY_SEQUENCE
     
     # Recommendations
-    recommended_modifications: List[str] = Field(default_factory=list)
-    alternative_approaches: List[str] = Field(default_factory=list)
-    follow_up_possibilities: List[str] = Field(default_factory=list)
+    recommended_modifications: Tuple[str, ...] = _EMPTY_SEQUENCE
+    alternative_approaches: Tuple[str, ...] = _EMPTY_SEQUENCE
+    follow_up_possibilities: Tuple[str, ...] = _EMPTY_SEQUENCE
 
-class StudentEngagementFeedbackSchema(BaseCreativeModel):
+class StudentEngagementFeedbackSchema(CreativeRecordStruct, kw_only=True):
     """Schema for capturing student feedback on creative content"""
-    feedback_id: str = Field(default_factory=lambda: f"feedback_{uuid4()}")
-    output_id: str = Field(..., description="Creative output being reviewed")
-    student_id: Optional[str] = Field(None, description="Student providing feedback")
+    feedback_id: str = msgspec.field(default_factory=partial(_make_id, "feedback_"))
+    output_id: str                       # Creative output being reviewed
+    student_id: Optional[str] = None     # Student providing feedback
     
     # Engagement metrics
-    interest_level: float = Field(..., ge=0.0, le=1.0, description="How interesting")
-    fun_factor: float = Field(..., ge=0.0, le=1.0, description="How enjoyable")
-    challenge_appropriateness: float = Field(..., ge=0.0, le=1.0, description="Good challenge level")
-    clarity: float = Field(..., ge=0.0, le=1.0, description="How clear and understandable")
+    interest_level: Score                # How interesting
+    fun_factor: Score                    # How enjoyable
+    challenge_appropriateness: Score     # Good challenge level
+    clarity: Score                       # How clear and understandable
     
     # Learning impact
-    understanding_improvement: float = Field(..., ge=0.0, le=1.0, description="Helped understanding")
-    memorability: float = Field(..., ge=0.0, le=1.0, description="How memorable")
-    motivation_impact: float = Field(..., ge=0.0, le=1.0, description="Increased motivation")
+    understanding_improvement: Score     # Helped understanding
+    memorability: Score                  # How memorable
+    motivation_impact: Score             # Increased motivation
     
     # Qualitative feedback
-    favorite_elements: List[str] = Field(default_factory=list, description="What they liked most")
-    confusing_elements: List[str] = Field(default_factory=list, description="What was unclear")
-    suggestions: List[str] = Field(default_factory=list, description="Their improvement ideas")
+    favorite_elements: Sequence[str] = _EMPTY_SEQUENCE  # What they liked most
+    confusing_elements: Sequence[str] = _EMPTY_SEQUENCE  # What was unclear
+    suggestions: Sequence[str] = _EMPTY_SEQUENCE  # Their improvement ideas
     
     # Context
-    completion_rate: float = Field(default=1.0, ge=0.0, le=1.0, description="How much they completed")
-    time_spent: Optional[timedelta] = Field(None, description="Time engaged with content")
-    collaboration_context: Optional[str] = Field(None, description="Individual or group experience")
+    completion_rate: Score = 1.0         # How much they completed
+    time_spent: Optional[timedelta] = None  # Time engaged with content
+    collaboration_context: Optional[str] = None  # Individual or group experience
+
+# ============================================================================
+# Struct Serialization
+# ============================================================================
+
+class _CreativeJSONEncoder:
+    """JSON encoder writing CodedEnum struct fields as string codes
+    
+    Accepts a struct or a sequence of structs. Structs without enum fields are
+    encoded by msgspec directly.
+    """
+    __slots__ = ("_encoder",)
+    
+    def __init__(self) -> None:
+        self._encoder = msgspec.json.Encoder(enc_hook=_encode_numpy)
+    
+    def encode(self, obj: Any) -> bytes:
+        if isinstance(obj, (list, tuple)):
+            obj = [self._builtin(item) for item in obj]
+        else:
+            obj = self._builtin(obj)
+        return self._encoder.encode(obj)
+    
+    @staticmethod
+    def _builtin(obj: Any) -> Any:
+        if isinstance(obj, msgspec.Struct) and _coded_fields(type(obj)):
+            return _struct_to_builtins(obj)
+        return obj
+
+class _CodedJSONDecoder:
+    """JSON decoder for a struct type with CodedEnum fields
+    
+    Decodes to builtins first so string codes can be resolved, then converts.
+    """
+    __slots__ = ("_struct_type", "_decoder")
+    
+    def __init__(self, struct_type: Type[CreativeStruct]) -> None:
+        self._struct_type = struct_type
+        self._decoder = msgspec.json.Decoder()
+    
+    def decode(self, buf: Any) -> CreativeStruct:
+        data = self._decoder.decode(buf)
+        return msgspec.convert(_parse_codes(self._struct_type, data), self._struct_type)
+
+# Shared JSON encoder for creative structs
+CREATIVE_JSON_ENCODER = _CreativeJSONEncoder()
+
+@lru_cache(maxsize=None)
+def creative_json_decoder(struct_type: Type[CreativeStruct]) -> Any:
+    """Validating JSON decoder for a creative struct type
+    
+    Enum fields accept either the string code or the integer value.
+    """
+    if _coded_fields(struct_type):
+        return _CodedJSONDecoder(struct_type)
+    return msgspec.json.Decoder(struct_type)
 
 # ============================================================================
 # Factory Functions and Utilities
@@ -506,10 +834,10 @@ def create_creative_context(
     **kwargs
 ) -> CreativeContextSchema:
     """Factory function to create creative context"""
+    kwargs.setdefault("target_concepts", learning_objectives)
     return CreativeContextSchema(
         subject_area=subject_area,
         learning_objectives=learning_objectives,
-        target_concepts=kwargs.get("target_concepts", learning_objectives),
         age_group=age_group,
         **kwargs
     )
@@ -536,31 +864,54 @@ def create_game_request(
         **kwargs
     )
 
+# Validated requests kept by payload fingerprint
+REQUEST_CACHE_MAX_SIZE = 4096
+_request_cache: "OrderedDict[bytes, CreativeSynthesisRequest]" = OrderedDict()
+_REQUEST_FINGERPRINT_ENCODER = msgspec.json.Encoder(enc_hook=_encode_numpy, order="sorted")
+
+def parse_creative_synthesis_request(raw: Mapping[str, Any]) -> CreativeSynthesisRequest:
+    """Validate a request payload, reusing the instance for a recently seen payload
+    
+    Classroom workloads repeat the same subject/age/objective combinations, so
+    the payload is fingerprinted (key-order independent) and only unseen
+    payloads go through pydantic validation. The returned request is shared,
+    so it and its context are frozen and hold tuples rather than lists.
+    """
+    key = hashlib.blake2b(_REQUEST_FINGERPRINT_ENCODER.encode(raw), digest_size=16).digest()
+    request = _request_cache.get(key)
+    if request is not None:
+        _request_cache.move_to_end(key)
+        return request
+    request = CreativeSynthesisRequest.model_validate(raw)
+    _request_cache[key] = request
+    if len(_request_cache) > REQUEST_CACHE_MAX_SIZE:
+        _request_cache.popitem(last=False)
+    return request
+
 # ============================================================================
 # Validation and Helper Functions
 # ============================================================================
 
+# (field, issue) pairs checked by validate_creative_output_quality, in report order:
+# educational alignment, age appropriateness, feasibility, content completeness
+_QUALITY_CHECKS = (
+    ("learning_objective_fulfillment", "No learning objective fulfillment specified"),
+    ("age_appropriateness_check", "Age appropriateness not verified"),
+    ("feasibility_check", "Implementation feasibility not verified"),
+    ("primary_content", "No primary content provided"),
+)
+
 def validate_creative_output_quality(output: CreativeSynthesisOutputSchema) -> List[str]:
     """Validate the quality of creative output"""
-    issues = []
-    
-    # Check educational alignment
-    if not output.learning_objective_fulfillment:
-        issues.append("No learning objective fulfillment specified")
-    
-    # Check age appropriateness
-    if not output.age_appropriateness_check:
-        issues.append("Age appropriateness not verified")
-    
-    # Check feasibility
-    if not output.feasibility_check:
-        issues.append("Implementation feasibility not verified")
-    
-    # Check content completeness
-    if not output.primary_content:
-        issues.append("No primary content provided")
-    
-    return issues
+    return [issue for field_name, issue in _QUALITY_CHECKS if not getattr(output, field_name)]
+
+# Engagement boost per creativity level, indexed by CreativityLevel
+CREATIVITY_BOOST: Tuple[float, ...] = (0.0, 0.1, 0.2, 0.3, 0.4)
+DEFAULT_CREATIVITY_BOOST = 0.1  # For levels that are not a CreativityLevel
+_CREATIVITY_BOOST_ARRAY = np.array(CREATIVITY_BOOST)
+
+# Below this many candidates NumPy beats dispatching to the compiled kernel
+ENGAGEMENT_KERNEL_MIN_BATCH = 4096
 
 def calculate_engagement_potential(
     engagement_factors: List[EngagementFactor],
@@ -568,26 +919,77 @@ def calculate_engagement_potential(
     creativity_level: CreativityLevel
 ) -> float:
     """Calculate predicted engagement potential"""
-    base_score = 0.5
-    
-    # Boost for engagement factors
-    factor_boost = len(engagement_factors) * 0.1
-    
-    # Boost for multi-modal approach
-    modality_boost = len(modalities) * 0.05
-    
-    # Boost for creativity level
-    creativity_mapping = {
-        CreativityLevel.SUBTLE: 0.0,
-        CreativityLevel.MODERATE: 0.1,
-        CreativityLevel.HIGH: 0.2,
-        CreativityLevel.IMMERSIVE: 0.3,
-        CreativityLevel.TRANSFORMATIVE: 0.4
-    }
-    creativity_boost = creativity_mapping.get(creativity_level, 0.1)
-    
-    final_score = base_score + factor_boost + modality_boost + creativity_boost
-    return min(1.0, final_score)
+    try:
+        creativity_boost = CREATIVITY_BOOST[CreativityLevel.parse(creativity_level)]
+    except (TypeError, ValueError):
+        creativity_boost = DEFAULT_CREATIVITY_BOOST
+    
+    # Base score, plus boosts for engagement factors, multi-modal approach and
+    # creativity level
+    return min(
+        1.0,
+        0.5
+        + len(engagement_factors) * 0.1
+        + len(modalities) * 0.05
+        + creativity_boost
+    )
+
+def calculate_engagement_potential_batch(
+    factor_counts: Any,
+    modality_counts: Any,
+    creativity_levels: Any
+) -> np.ndarray:
+    """Engagement potential for many candidates from their per-candidate counts
+    
+    factor_counts and modality_counts are the lengths calculate_engagement_potential
+    would see; creativity_levels holds CreativityLevel values. Raises
+    ValueError for any other level, since both paths index the boost table.
+    """
+    factor_counts = np.ascontiguousarray(factor_counts, dtype=np.float64)
+    modality_counts = np.ascontiguousarray(modality_counts, dtype=np.float64)
+    creativity_levels = np.ascontiguousarray(creativity_levels, dtype=np.intp)
+    if creativity_levels.size and (
+        creativity_levels.min() < 0 or creativity_levels.max() >= len(CREATIVITY_BOOST)
+    ):
+        raise ValueError(f"creativity_levels must be CreativityLevel values in [0, {len(CREATIVITY_BOOST)})")
+    
+    if NUMBA_AVAILABLE and factor_counts.shape[0] >= ENGAGEMENT_KERNEL_MIN_BATCH:
+        return engagement_kernel(factor_counts, modality_counts, creativity_levels, _CREATIVITY_BOOST_ARRAY)
+    return np.minimum(
+        1.0,
+        0.5 + factor_counts * 0.1 + modality_counts * 0.05 + _CREATIVITY_BOOST_ARRAY[creativity_levels]
+    )
+
+# Enhancement suggestions by engagement gap
+_ENHANCEMENT_HIGH_GAP = (
+    "Consider adding interactive elements to increase engagement",
+    "Incorporate storytelling or narrative elements",
+    "Add gamification elements like challenges or rewards",
+    "Include multi-sensory components (visual, auditory, kinesthetic)"
+)
+_ENHANCEMENT_MED_GAP = (
+    "Add more surprising or unexpected elements",
+    "Increase student choice and agency in the experience",
+    "Connect to student interests and real-world relevance"
+)
+_ENHANCEMENT_LOW_GAP = (
+    "Fine-tune the challenge level for optimal engagement",
+    "Add social or collaborative elements"
+)
+
+# (minimum gap, suggestions) from the largest engagement gap down; any
+# positive gap reaches the last tier
+_GAP_TIERS = (
+    (0.3, _ENHANCEMENT_HIGH_GAP),
+    (0.2, _ENHANCEMENT_MED_GAP),
+    (0.0, _ENHANCEMENT_LOW_GAP),
+)
+
+# Modalities every output should address, with the suggestion when one is missing
+_IMPORTANT_MODALITY_SUGGESTIONS = tuple(
+    (modality, f"Consider adding {modality.code} learning elements")
+    for modality in (LearningModality.VISUAL, LearningModality.KINESTHETIC, LearningModality.SOCIAL)
+)
 
 def suggest_creative_enhancements(
     current_output: CreativeSynthesisOutputSchema,
@@ -601,32 +1003,16 @@ def suggest_creative_enhancements(
     if current_engagement < target_engagement:
         gap = target_engagement - current_engagement
         
-        if gap > 0.3:
-            suggestions.extend([
-                "Consider adding interactive elements to increase engagement",
-                "Incorporate storytelling or narrative elements",
-                "Add gamification elements like challenges or rewards",
-                "Include multi-sensory components (visual, auditory, kinesthetic)"
-            ])
-        elif gap > 0.2:
-            suggestions.extend([
-                "Add more surprising or unexpected elements",
-                "Increase student choice and agency in the experience",
-                "Connect to student interests and real-world relevance"
-            ])
-        else:
-            suggestions.extend([
-                "Fine-tune the challenge level for optimal engagement",
-                "Add social or collaborative elements"
-            ])
+        for threshold, tips in _GAP_TIERS:
+            if gap > threshold:
+                suggestions.extend(tips)
+                break
     
     # Check for missing modalities
-    addressed_modalities = current_output.multi_modal_richness.keys()
-    important_modalities = [LearningModality.VISUAL, LearningModality.KINESTHETIC, LearningModality.SOCIAL]
-    
-    for modality in important_modalities:
-        if modality not in addressed_modalities:
-            suggestions.append(f"Consider adding {modality.value} learning elements")
+    richness = current_output.multi_modal_richness
+    for modality, suggestion in _IMPORTANT_MODALITY_SUGGESTIONS:
+        if not richness[modality] > 0:
+            suggestions.append(suggestion)
     
     # Check originality
     originality = current_output.originality_analysis.get("score", 0.5)
@@ -635,54 +1021,114 @@ def suggest_creative_enhancements(
     
     return suggestions
 
+# Suggestions for learners with cognitive differences
+_COGNITIVE_ACCESSIBILITY_SUGGESTIONS = (
+    "Provide content at multiple complexity levels",
+    "Include clear navigation and structure",
+    "Offer extended time options"
+)
+
+def _check_visual_impairment(features: List[str], barriers: List[str], improvements: List[str],
+                             richness: np.ndarray) -> None:
+    # Check if content has audio alternatives
+    if richness[LearningModality.AUDITORY] > 0:
+        features.append("Audio content available for visual impairments")
+    else:
+        barriers.append("Limited audio alternatives for visual content")
+        improvements.append("Add audio descriptions or narration")
+
+def _check_hearing_impairment(features: List[str], barriers: List[str], improvements: List[str],
+                              richness: np.ndarray) -> None:
+    if richness[LearningModality.VISUAL] > 0:
+        features.append("Visual content available for hearing impairments")
+    else:
+        barriers.append("Limited visual alternatives for audio content")
+        improvements.append("Add visual captions or sign language")
+
+def _check_motor_impairment(features: List[str], barriers: List[str], improvements: List[str],
+                            richness: np.ndarray) -> None:
+    # Check if kinesthetic elements have alternatives
+    if richness[LearningModality.KINESTHETIC] > 0:
+        improvements.append("Ensure kinesthetic activities have accessible alternatives")
+
+def _check_cognitive_differences(features: List[str], barriers: List[str], improvements: List[str],
+                                 richness: np.ndarray) -> None:
+    improvements.extend(_COGNITIVE_ACCESSIBILITY_SUGGESTIONS)
+
+# Accessibility requirement -> check, in report order
+_ACCESSIBILITY_HANDLERS: Mapping[str, Callable[[List[str], List[str], List[str], np.ndarray], None]] = MappingProxyType({
+    "visual_impairment": _check_visual_impairment,
+    "hearing_impairment": _check_hearing_impairment,
+    "motor_impairment": _check_motor_impairment,
+    "cognitive_differences": _check_cognitive_differences,
+})
+
 def analyze_creative_accessibility(
     output: CreativeSynthesisOutputSchema,
     accessibility_requirements: List[str]
 ) -> Dict[str, Any]:
     """Analyze how accessible the creative output is"""
-    analysis = {
-        "overall_accessibility": 0.8,  # Default good accessibility
-        "accessibility_features": [],
-        "barriers_identified": [],
-        "improvement_suggestions": []
-    }
+    features: List[str] = []
+    barriers: List[str] = []
+    improvements: List[str] = []
+    overall_accessibility = 0.8  # Default good accessibility
     
-    # Check for common accessibility considerations
-    if "visual_impairment" in accessibility_requirements:
-        # Check if content has audio alternatives
-        modalities = output.multi_modal_richness.keys()
-        if LearningModality.AUDITORY in modalities:
-            analysis["accessibility_features"].append("Audio content available for visual impairments")
-        else:
-            analysis["barriers_identified"].append("Limited audio alternatives for visual content")
-            analysis["improvement_suggestions"].append("Add audio descriptions or narration")
-    
-    if "hearing_impairment" in accessibility_requirements:
-        if LearningModality.VISUAL in modalities:
-            analysis["accessibility_features"].append("Visual content available for hearing impairments")
-        else:
-            analysis["barriers_identified"].append("Limited visual alternatives for audio content")
-            analysis["improvement_suggestions"].append("Add visual captions or sign language")
+    richness = output.multi_modal_richness
+    requirements = frozenset(accessibility_requirements)
     
-    if "motor_impairment" in accessibility_requirements:
-        # Check if kinesthetic elements have alternatives
-        if LearningModality.KINESTHETIC in modalities:
-            analysis["improvement_suggestions"].append("Ensure kinesthetic activities have accessible alternatives")
-    
-    if "cognitive_differences" in accessibility_requirements:
-        analysis["improvement_suggestions"].extend([
-            "Provide content at multiple complexity levels",
-            "Include clear navigation and structure",
-            "Offer extended time options"
-        ])
+    # Check for common accessibility considerations
+    for requirement, handler in _ACCESSIBILITY_HANDLERS.items():
+        if requirement in requirements:
+            handler(features, barriers, improvements, richness)
     
     # Calculate overall accessibility score
     total_requirements = len(accessibility_requirements)
     if total_requirements > 0:
-        addressed_requirements = len(analysis["accessibility_features"])
-        analysis["overall_accessibility"] = min(1.0, addressed_requirements / total_requirements + 0.3)
-    
-    return analysis
+        addressed_requirements = len(features)
+        overall_accessibility = min(1.0, addressed_requirements / total_requirements + 0.3)
+    
+    return {
+        "overall_accessibility": overall_accessibility,
+        "accessibility_features": features,
+        "barriers_identified": barriers,
+        "improvement_suggestions": improvements
+    }
+
+# Adaptation strategies by age bucket (see _classify_age)
+_AGE_STRATEGIES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "younger": (
+        "Simplify language and concepts",
+        "Add more visual and interactive elements",
+        "Shorten attention span requirements",
+        "Increase scaffolding and guidance"
+    ),
+    "older": (
+        "Increase complexity and depth",
+        "Add more independent exploration opportunities",
+        "Include real-world applications",
+        "Provide extension challenges"
+    ),
+})
+
+# Adaptation strategy for a preferred modality the output lacks, indexed by LearningModality
+_MODALITY_COMPONENT_STRATEGIES = tuple(
+    f"Add {modality.code} learning components" for modality in LearningModality
+)
+
+# Adaptation strategy when the target creativity level differs from the output's
+_CREATIVITY_STRATEGIES: Mapping[CreativityLevel, str] = MappingProxyType({
+    CreativityLevel.SUBTLE: "Reduce creative elements for more straightforward presentation",
+    CreativityLevel.IMMERSIVE: "Enhance creative elements for more immersive experience",
+})
+
+def _classify_age(age_group: str) -> Optional[str]:
+    """Age bucket named in an age group description, if any"""
+    age_group = age_group.lower()
+    if "younger" in age_group:
+        return "younger"
+    if "older" in age_group:
+        return "older"
+    return None
 
 def generate_adaptation_strategies(
     base_output: CreativeSynthesisOutputSchema,
@@ -691,43 +1137,38 @@ def generate_adaptation_strategies(
     """Generate strategies for adapting creative content to different contexts"""
     adaptations = {}
     
+    # Properties of the base output shared by every context
+    base_subject = base_output.primary_content.get("subject_area")
+    try:
+        base_creativity = CreativityLevel.parse(base_output.primary_content.get("creativity_level"))
+    except (ValueError, TypeError):
+        base_creativity = None
+    # A modality the base output does not address has zero richness, the same
+    # rule the JSON form uses to drop it from the mapping
+    base_missing = (base_output.multi_modal_richness == 0).tolist()
+    
     for context in different_contexts:
         context_key = f"{context.age_group}_{context.subject_area}"
         strategies = []
         
         # Age-based adaptations
-        if "younger" in context.age_group.lower():
-            strategies.extend([
-                "Simplify language and concepts",
-                "Add more visual and interactive elements",
-                "Shorten attention span requirements",
-                "Increase scaffolding and guidance"
-            ])
-        elif "older" in context.age_group.lower():
-            strategies.extend([
-                "Increase complexity and depth",
-                "Add more independent exploration opportunities",
-                "Include real-world applications",
-                "Provide extension challenges"
-            ])
+        strategies.extend(_AGE_STRATEGIES.get(_classify_age(context.age_group), ()))
         
         # Subject-based adaptations
-        if context.subject_area != base_output.primary_content.get("subject_area"):
+        if context.subject_area != base_subject:
             strategies.append(f"Adapt examples and context to {context.subject_area}")
             strategies.append("Modify vocabulary for subject-specific terminology")
         
         # Learning style adaptations
-        preferred_modalities = context.preferred_modalities
-        for modality in preferred_modalities:
-            if modality not in base_output.multi_modal_richness:
-                strategies.append(f"Add {modality.value} learning components")
+        for modality in context.preferred_modalities:
+            if base_missing[modality]:
+                strategies.append(_MODALITY_COMPONENT_STRATEGIES[modality])
         
         # Creativity level adaptations
-        if context.creativity_level != base_output.primary_content.get("creativity_level"):
-            if context.creativity_level == CreativityLevel.SUBTLE:
-                strategies.append("Reduce creative elements for more straightforward presentation")
-            elif context.creativity_level == CreativityLevel.IMMERSIVE:
-                strategies.append("Enhance creative elements for more immersive experience")
+        if context.creativity_level is not base_creativity:
+            creativity_strategy = _CREATIVITY_STRATEGIES.get(context.creativity_level)
+            if creativity_strategy is not None:
+                strategies.append(creativity_strategy)
         
         adaptations[context_key] = strategies
     
@@ -737,8 +1178,71 @@ def generate_adaptation_strategies(
 # Creative Technique Definitions
 # ============================================================================
 
+# Read-only technique tables shared by every get_techniques() call
+_STORYTELLING_TECHNIQUES: Mapping[str, str] = MappingProxyType({
+    "hero_journey": "Structure learning as a hero's journey with challenges and growth",
+    "mystery_narrative": "Present concepts as mysteries to be solved",
+    "character_perspective": "Tell story from unusual character viewpoints",
+    "time_travel": "Use time travel to explore historical concepts",
+    "parallel_worlds": "Compare concepts through parallel world scenarios",
+    "personification": "Give concepts personalities and relationships",
+    "quest_structure": "Frame learning as a quest with goals and obstacles",
+    "dialogue_driven": "Teach through character conversations and debates"
+})
+
+_METAPHOR_TECHNIQUES: Mapping[str, str] = MappingProxyType({
+    "structural_mapping": "Map structural relationships between domains",
+    "functional_analogy": "Focus on how things work similarly",
+    "causal_mapping": "Map cause-and-effect relationships",
+    "system_metaphor": "Use entire systems as metaphors (body, machine, ecosystem)",
+    "journey_metaphor": "Frame learning as a journey or adventure",
+    "building_metaphor": "Use construction and architecture analogies",
+    "sports_metaphor": "Use athletic and game analogies",
+    "nature_metaphor": "Draw from natural processes and phenomena"
+})
+
+_GAMEIFICATION_TECHNIQUES: Mapping[str, str] = MappingProxyType({
+    "point_systems": "Award points for learning achievements",
+    "level_progression": "Organize learning into progressive levels",
+    "achievement_badges": "Recognize specific accomplishments",
+    "leaderboards": "Create friendly competition",
+    "quest_lines": "Chain related learning activities",
+    "choice_branching": "Give students meaningful choices",
+    "resource_management": "Manage limited resources strategically",
+    "collaborative_challenges": "Team-based problem solving",
+    "mystery_solving": "Uncover hidden information through learning",
+    "creation_challenges": "Build or create something through learning"
+})
+
+_VISUALIZATION_TECHNIQUES: Mapping[str, str] = MappingProxyType({
+    "concept_mapping": "Visual networks of related ideas",
+    "infographic_narrative": "Tell stories through data visualization",
+    "interactive_diagrams": "Manipulatable visual representations",
+    "layered_revelation": "Progressively reveal information visually",
+    "perspective_shifting": "Show concepts from multiple viewpoints",
+    "scale_manipulation": "Play with size and scale for emphasis",
+    "animation_sequencing": "Use motion to show processes",
+    "metaphorical_design": "Visual metaphors and symbolic representation"
+})
+
+# (name, description) pairs and names, for callers that only iterate
+_STORYTELLING_ITEMS = tuple(_STORYTELLING_TECHNIQUES.items())
+_STORYTELLING_KEYS = tuple(_STORYTELLING_TECHNIQUES)
+_METAPHOR_ITEMS = tuple(_METAPHOR_TECHNIQUES.items())
+_METAPHOR_KEYS = tuple(_METAPHOR_TECHNIQUES)
+_GAMEIFICATION_ITEMS = tuple(_GAMEIFICATION_TECHNIQUES.items())
+_GAMEIFICATION_KEYS = tuple(_GAMEIFICATION_TECHNIQUES)
+_VISUALIZATION_ITEMS = tuple(_VISUALIZATION_TECHNIQUES.items())
+_VISUALIZATION_KEYS = tuple(_VISUALIZATION_TECHNIQUES)
+
 class CreativeTechnique:
-    """Base class for creative techniques"""
+    """Base class for creative techniques
+    
+    Subclasses should declare their own __slots__ (empty if they add no
+    attributes) to keep instances free of a __dict__.
+    """
+    
+    __slots__ = ("name", "description")
     
     def __init__(self, name: str, description: str):
         self.name = name
@@ -752,67 +1256,61 @@ class StorytellingTechniques:
     """Collection of storytelling creativity techniques"""
     
     @staticmethod
-    def get_techniques() -> Dict[str, str]:
-        return {
-            "hero_journey": "Structure learning as a hero's journey with challenges and growth",
-            "mystery_narrative": "Present concepts as mysteries to be solved",
-            "character_perspective": "Tell story from unusual character viewpoints",
-            "time_travel": "Use time travel to explore historical concepts",
-            "parallel_worlds": "Compare concepts through parallel world scenarios",
-            "personification": "Give concepts personalities and relationships",
-            "quest_structure": "Frame learning as a quest with goals and obstacles",
-            "dialogue_driven": "Teach through character conversations and debates"
-        }
+    def get_techniques() -> Mapping[str, str]:
+        return _STORYTELLING_TECHNIQUES
+    
+    @staticmethod
+    def get_items() -> Tuple[Tuple[str, str], ...]:
+        return _STORYTELLING_ITEMS
+    
+    @staticmethod
+    def get_keys() -> Tuple[str, ...]:
+        return _STORYTELLING_KEYS
 
 class MetaphorTechniques:
     """Collection of metaphor and analogy techniques"""
     
     @staticmethod
-    def get_techniques() -> Dict[str, str]:
-        return {
-            "structural_mapping": "Map structural relationships between domains",
-            "functional_analogy": "Focus on how things work similarly",
-            "causal_mapping": "Map cause-and-effect relationships",
-            "system_metaphor": "Use entire systems as metaphors (body, machine, ecosystem)",
-            "journey_metaphor": "Frame learning as a journey or adventure",
-            "building_metaphor": "Use construction and architecture analogies",
-            "sports_metaphor": "Use athletic and game analogies",
-            "nature_metaphor": "Draw from natural processes and phenomena"
-        }
+    def get_techniques() -> Mapping[str, str]:
+        return _METAPHOR_TECHNIQUES
+    
+    @staticmethod
+    def get_items() -> Tuple[Tuple[str, str], ...]:
+        return _METAPHOR_ITEMS
+    
+    @staticmethod
+    def get_keys() -> Tuple[str, ...]:
+        return _METAPHOR_KEYS
 
 class GameificationTechniques:
     """Collection of gamification techniques"""
     
     @staticmethod
-    def get_techniques() -> Dict[str, str]:
-        return {
-            "point_systems": "Award points for learning achievements",
-            "level_progression": "Organize learning into progressive levels",
-            "achievement_badges": "Recognize specific accomplishments",
-            "leaderboards": "Create friendly competition",
-            "quest_lines": "Chain related learning activities",
-            "choice_branching": "Give students meaningful choices",
-            "resource_management": "Manage limited resources strategically",
-            "collaborative_challenges": "Team-based problem solving",
-            "mystery_solving": "Uncover hidden information through learning",
-            "creation_challenges": "Build or create something through learning"
-        }
+    def get_techniques() -> Mapping[str, str]:
+        return _GAMEIFICATION_TECHNIQUES
+    
+    @staticmethod
+    def get_items() -> Tuple[Tuple[str, str], ...]:
+        return _GAMEIFICATION_ITEMS
+    
+    @staticmethod
+    def get_keys() -> Tuple[str, ...]:
+        return _GAMEIFICATION_KEYS
 
 class VisualizationTechniques:
     """Collection of visualization creativity techniques"""
     
     @staticmethod
-    def get_techniques() -> Dict[str, str]:
-        return {
-            "concept_mapping": "Visual networks of related ideas",
-            "infographic_narrative": "Tell stories through data visualization",
-            "interactive_diagrams": "Manipulatable visual representations",
-            "layered_revelation": "Progressively reveal information visually",
-            "perspective_shifting": "Show concepts from multiple viewpoints",
-            "scale_manipulation": "Play with size and scale for emphasis",
-            "animation_sequencing": "Use motion to show processes",
-            "metaphorical_design": "Visual metaphors and symbolic representation"
-        }
+    def get_techniques() -> Mapping[str, str]:
+        return _VISUALIZATION_TECHNIQUES
+    
+    @staticmethod
+    def get_items() -> Tuple[Tuple[str, str], ...]:
+        return _VISUALIZATION_ITEMS
+    
+    @staticmethod
+    def get_keys() -> Tuple[str, ...]:
+        return _VISUALIZATION_KEYS
 
 # ============================================================================
 # Educational Impact Metrics
@@ -820,35 +1318,39 @@ class VisualizationTechniques:
 
 class EducationalImpactSchema(BaseCreativeModel):
     """Schema for measuring educational impact of creative content"""
-    impact_id: str = Field(default_factory=lambda: f"impact_{uuid4()}")
+    impact_id: str = Field(default_factory=partial(_make_id, "impact_"))
     output_id: str = Field(..., description="Creative output being measured")
     
     # Learning outcome metrics
-    knowledge_retention: float = Field(default=0.0, ge=0.0, le=1.0, description="How well information is retained")
-    skill_transfer: float = Field(default=0.0, ge=0.0, le=1.0, description="Ability to apply skills in new contexts")
-    conceptual_understanding: float = Field(default=0.0, ge=0.0, le=1.0, description="Deep understanding of concepts")
-    creative_thinking_development: float = Field(default=0.0, ge=0.0, le=1.0, description="Growth in creative thinking")
+    knowledge_retention: Score = 0.0  # How well information is retained
+    skill_transfer: Score = 0.0  # Ability to apply skills in new contexts
+    conceptual_understanding: Score = 0.0  # Deep understanding of concepts
+    creative_thinking_development: Score = 0.0  # Growth in creative thinking
     
     # Engagement metrics
     time_on_task: timedelta = Field(default=timedelta(0), description="Time spent engaged with content")
-    completion_rate: float = Field(default=0.0, ge=0.0, le=1.0, description="Percentage who complete the experience")
-    voluntary_re_engagement: float = Field(default=0.0, ge=0.0, le=1.0, description="Students who choose to return")
-    peer_sharing: float = Field(default=0.0, ge=0.0, le=1.0, description="Students who share with others")
+    completion_rate: Score = 0.0  # Percentage who complete the experience
+    voluntary_re_engagement: Score = 0.0  # Students who choose to return
+    peer_sharing: Score = 0.0  # Students who share with others
     
     # Affective outcomes
-    curiosity_increase: float = Field(default=0.0, ge=0.0, le=1.0, description="Growth in curiosity about subject")
-    confidence_building: float = Field(default=0.0, ge=0.0, le=1.0, description="Increased confidence in abilities")
-    intrinsic_motivation: float = Field(default=0.0, ge=0.0, le=1.0, description="Internal motivation to learn")
-    positive_associations: float = Field(default=0.0, ge=0.0, le=1.0, description="Positive feelings toward subject")
+    curiosity_increase: Score = 0.0  # Growth in curiosity about subject
+    confidence_building: Score = 0.0  # Increased confidence in abilities
+    intrinsic_motivation: Score = 0.0  # Internal motivation to learn
+    positive_associations: Score = 0.0  # Positive feelings toward subject
     
     # Long-term impact
-    sustained_interest: Optional[float] = Field(None, ge=0.0, le=1.0, description="Continued interest over time")
-    influence_on_future_learning: Optional[float] = Field(None, ge=0.0, le=1.0, description="Impact on future learning choices")
+    sustained_interest: Optional[Score] = None  # Continued interest over time
+    influence_on_future_learning: Optional[Score] = None  # Impact on future learning choices
     
     # Measurement context
     measurement_method: str = Field(..., description="How impact was measured")
     measurement_timeframe: timedelta = Field(..., description="When impact was measured after experience")
     sample_size: int = Field(..., ge=1, description="Number of students measured")
+    
+    class Config:
+        frozen = True
+        extra = "forbid"
 
 # ============================================================================
 # Creative Collaboration Schemas
@@ -856,7 +1358,7 @@ class EducationalImpactSchema(BaseCreativeModel):
 
 class CollaborativeCreationSchema(BaseCreativeModel):
     """Schema for collaborative creative processes"""
-    collaboration_id: str = Field(default_factory=lambda: f"collab_{uuid4()}")
+    collaboration_id: str = Field(default_factory=partial(_make_id, "collab_"))
     participants: List[Dict[str, Any]] = Field(..., description="Participants in creative collaboration")
     
     # Collaboration structure
@@ -870,14 +1372,18 @@ class CollaborativeCreationSchema(BaseCreativeModel):
     iteration_process: str = Field(..., description="How ideas are refined")
     
     # Outputs and outcomes
-    individual_contributions: Dict[str, List[str]] = Field(default_factory=dict)
-    collaborative_outputs: List[str] = Field(default_factory=list)
+    individual_contributions: Dict[str, List[str]] = _DICT_FIELD
+    collaborative_outputs: List[str] = _LIST_FIELD
     synergistic_elements: List[str] = Field(default_factory=list, description="Ideas that emerged from collaboration")
     
     # Process insights
-    collaboration_challenges: List[str] = Field(default_factory=list)
-    successful_strategies: List[str] = Field(default_factory=list)
-    lessons_learned: List[str] = Field(default_factory=list)
+    collaboration_challenges: List[str] = _LIST_FIELD
+    successful_strategies: List[str] = _LIST_FIELD
+    lessons_learned: List[str] = _LIST_FIELD
+    
+    class Config:
+        frozen = True
+        extra = "forbid"
 
 # ============================================================================
 # Personalization and Adaptation Schemas
@@ -885,26 +1391,30 @@ class CollaborativeCreationSchema(BaseCreativeModel):
 
 class PersonalizedCreativeSchema(BaseCreativeModel):
     """Schema for personalized creative content"""
-    personalization_id: str = Field(default_factory=lambda: f"personal_{uuid4()}")
+    personalization_id: str = Field(default_factory=partial(_make_id, "personal_"))
     base_content_id: str = Field(..., description="Original content being personalized")
     target_student_profile: Dict[str, Any] = Field(..., description="Student this is personalized for")
     
     # Personalization factors
     interest_alignment: Dict[str, str] = Field(..., description="How content connects to student interests")
-    learning_style_adaptations: Dict[LearningModality, List[str]] = Field(default_factory=dict)
-    cultural_connections: List[str] = Field(default_factory=list)
-    difficulty_adjustments: Dict[str, Any] = Field(default_factory=dict)
+    learning_style_adaptations: Dict[LearningModality, List[str]] = _DICT_FIELD
+    cultural_connections: List[str] = _LIST_FIELD
+    difficulty_adjustments: Dict[str, Any] = _DICT_FIELD
     
     # Personalized elements
-    customized_examples: List[str] = Field(default_factory=list)
-    tailored_characters: List[Dict[str, Any]] = Field(default_factory=list)
-    relevant_scenarios: List[str] = Field(default_factory=list)
-    personal_connections: List[str] = Field(default_factory=list)
+    customized_examples: List[str] = _LIST_FIELD
+    tailored_characters: List[Dict[str, Any]] = _LIST_FIELD
+    relevant_scenarios: List[str] = _LIST_FIELD
+    personal_connections: List[str] = _LIST_FIELD
     
     # Effectiveness tracking
-    personalization_effectiveness: float = Field(default=0.0, ge=0.0, le=1.0)
-    student_resonance: float = Field(default=0.0, ge=0.0, le=1.0)
-    engagement_improvement: float = Field(default=0.0, ge=0.0, le=1.0)
+    personalization_effectiveness: Score = 0.0
+    student_resonance: Score = 0.0
+    engagement_improvement: Score = 0.0
+    
+    class Config:
+        frozen = True
+        extra = "forbid"
 
 # ============================================================================
 # Export All Schemas and Functions
@@ -916,8 +1426,9 @@ __all__ = [
     "EngagementFactor", "CreativeConstraint",
     
     # Core Schemas
-    "BaseCreativeModel", "CreativeContextSchema", "CreativeElementSchema",
-    "CreativeSynthesisOutputSchema", "CreativeProcessInsightSchema",
+    "BaseCreativeModel", "CreativeStruct", "CreativeRecordStruct", "Score",
+    "CreativeContextSchema", "CreativeElementSchema",
+    "CreativeSynthesisOutputSchema", "CreativeSynthesisBatch", "CreativeProcessInsightSchema",
     
     # Specialized Creative Schemas
     "StoryBasedLearningSchema", "MetaphorMappingSchema", "GameBasedLearningSchema",
@@ -934,12 +1445,17 @@ __all__ = [
     # Collaboration and Personalization
     "CollaborativeCreationSchema", "PersonalizedCreativeSchema",
     
+    # Struct Serialization
+    "CREATIVE_JSON_ENCODER", "creative_json_decoder",
+    
     # Factory Functions
     "create_creative_context", "create_story_request", "create_game_request",
+    "parse_creative_synthesis_request",
     
     # Validation and Analysis Functions
     "validate_creative_output_quality", "calculate_engagement_potential",
-    "suggest_creative_enhancements", "analyze_creative_accessibility",
+    "calculate_engagement_potential_batch", "suggest_creative_enhancements",
+    "analyze_creative_accessibility",
     "generate_adaptation_strategies",
     
     # Creative Techniques
@@ -0,0 +1,33 @@
+"""Build configuration for optional compiled extensions.
+
+Project metadata lives in pyproject.toml. Setting PACT_HX_CYTHONIZE=1 with
+Cython installed compiles the listed pure-Python modules in place; otherwise
+the package installs as plain Python.
+"""
+
+import os
+
+from setuptools import setup
+
+# Pure-Python modules compiled when PACT_HX_CYTHONIZE is set. Modules holding
+# numba kernels (creative_synthesis/kernels.py) must not be listed: numba
+# cannot JIT functions from a compiled module.
+CYTHON_MODULES = [
+    "pact_hx/primitives/creative_synthesis/schemas.py",
+]
+
+ext_modules = []
+if os.environ.get("PACT_HX_CYTHONIZE") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        CYTHON_MODULES,
+        language_level=3,
+        compiler_directives={
+            "initializedcheck": False,
+            # Pydantic and msgspec read class annotations at runtime
+            "annotation_typing": False,
+        },
+    )
+
+setup(ext_modules=ext_modules)
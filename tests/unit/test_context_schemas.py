@@ -0,0 +1,317 @@
+import copy
+import dataclasses
+
+import numpy as np
+import pytest
+
+from pact_hx.primitives.context import schemas
+from pact_hx.primitives.context.schemas import (
+    ANOMALY_MIN_SAMPLES,
+    CognitiveContext,
+    ContextAnomalyBaseline,
+    ContextFactor,
+    ContextPriority,
+    ContextScope,
+    ContextSnapshot,
+    ContextType,
+    EmotionalContext,
+    calculate_context_relevance,
+    calculate_context_relevance_batch,
+    calculate_context_staleness,
+    calculate_context_staleness_batch,
+    create_context_factor,
+    create_context_snapshot,
+    detect_context_anomalies,
+    generate_context_insights,
+    invalidate_insights,
+    merge_context_snapshots,
+)
+
+
+def make_factors():
+    return [
+        create_context_factor(ContextType.TEMPORAL, "time_of_day", "morning",
+                              priority=ContextPriority.CRITICAL, scope=ContextScope.IMMEDIATE,
+                              timestamp=1000.0, staleness_tolerance=100.0),
+        create_context_factor(ContextType.SOCIAL, "team_size", 4,
+                              priority=ContextPriority.HIGH, scope=ContextScope.SESSION,
+                              timestamp=950.0, staleness_tolerance=100.0),
+        create_context_factor(ContextType.TASK, "deadline", "friday",
+                              priority=ContextPriority.LOW, scope=ContextScope.PROJECT,
+                              timestamp=500.0, staleness_tolerance=100.0),
+        create_context_factor(ContextType.EMOTIONAL, "mood", "calm",
+                              priority=ContextPriority.IGNORE, scope=ContextScope.UNIVERSAL,
+                              timestamp=0.0, staleness_tolerance=0.0),
+    ]
+
+
+def make_snapshot(quality=0.5, confidence=0.5, stability=0.5, **kwargs):
+    return create_context_snapshot(
+        overall_context_quality=quality,
+        context_confidence=confidence,
+        context_stability=stability,
+        **kwargs
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_insights_cache():
+    invalidate_insights()
+    yield
+    invalidate_insights()
+
+
+# ==================== Core structures ====================
+
+def test_context_factor_requires_only_type():
+    factor = ContextFactor(type=ContextType.TASK)
+    assert factor.type is ContextType.TASK
+    assert factor.id
+    assert factor.priority is ContextPriority.MEDIUM
+
+
+def test_snapshot_metrics_are_backed_by_one_array():
+    snapshot = make_snapshot(quality=0.9, confidence=0.7)
+    assert snapshot.overall_context_quality == 0.9
+    snapshot.context_complexity = 0.25
+    assert snapshot._metrics.tolist() == [0.9, 0.7, 0.5, 0.25]
+
+
+@pytest.mark.parametrize("duplicate", [
+    copy.copy,
+    copy.deepcopy,
+    lambda snapshot: dataclasses.replace(snapshot, context_complexity=0.0),
+])
+def test_snapshot_copies_do_not_share_metrics(duplicate):
+    snapshot = make_snapshot(quality=0.9)
+    clone = duplicate(snapshot)
+    clone.overall_context_quality = 0.1
+    assert snapshot.overall_context_quality == 0.9
+    assert clone.overall_context_quality == 0.1
+
+
+# ==================== Staleness and relevance ====================
+
+def test_staleness_batch_matches_scalar():
+    factors = make_factors()
+    expected = [calculate_context_staleness(f, current_time=1050.0) for f in factors]
+    result = calculate_context_staleness_batch(factors, current_time=1050.0)
+    np.testing.assert_allclose(result, expected)
+    assert result.tolist() == [0.5, 1.0, 1.0, 0.0]
+
+
+def test_staleness_batch_empty():
+    assert calculate_context_staleness_batch([], current_time=1.0).shape == (0,)
+
+
+@pytest.mark.parametrize("target", [
+    {},
+    {"scope": ContextScope.SESSION, "relevant_types": [ContextType.SOCIAL]},
+    {"scope": ContextScope.UNIVERSAL, "relevant_types": [ContextType.TEMPORAL, ContextType.EMOTIONAL]},
+])
+def test_relevance_batch_matches_scalar(target):
+    factors = make_factors()
+    expected = [calculate_context_relevance(f, target) for f in factors]
+    np.testing.assert_allclose(calculate_context_relevance_batch(factors, target), expected)
+
+
+def test_relevance_batch_empty():
+    assert calculate_context_relevance_batch([], {}).shape == (0,)
+
+
+# ==================== Factor indexes ====================
+
+def test_factor_index_keeps_highest_confidence():
+    low = create_context_factor(ContextType.TASK, "focus", "email", confidence=0.4)
+    high = create_context_factor(ContextType.TASK, "focus", "coding", confidence=0.9)
+    other = create_context_factor(ContextType.SOCIAL, "focus", "team", confidence=0.1)
+    snapshot = make_snapshot(context_factors=[low, high, other])
+    assert snapshot.factor_index == {
+        (ContextType.TASK, "focus"): high,
+        (ContextType.SOCIAL, "focus"): other,
+    }
+
+
+def test_factors_by_priority_groups_in_order():
+    factors = make_factors()
+    snapshot = make_snapshot(context_factors=factors)
+    groups = snapshot.factors_by_priority
+    assert groups[ContextPriority.CRITICAL] == [factors[0]]
+    assert groups[ContextPriority.MEDIUM] == []
+    assert set(groups) == set(ContextPriority)
+
+
+def test_factor_indexes_rebuilt_when_factors_reassigned():
+    factors = make_factors()
+    snapshot = make_snapshot(context_factors=factors[:1])
+    assert len(snapshot.factor_index) == 1
+    assert snapshot.factors_by_priority[ContextPriority.HIGH] == []
+
+    snapshot.context_factors = factors
+    assert len(snapshot.factor_index) == 4
+    assert snapshot.factors_by_priority[ContextPriority.HIGH] == [factors[1]]
+
+
+def test_context_factors_cannot_be_mutated_in_place():
+    factors = make_factors()
+    snapshot = make_snapshot(context_factors=factors[:1])
+    assert snapshot.context_factors == tuple(factors[:1])
+    with pytest.raises(AttributeError):
+        snapshot.context_factors.append(factors[1])
+
+    snapshot.context_factors += (factors[1],)
+    assert len(snapshot.factor_index) == 2
+    assert snapshot.factors_by_priority[ContextPriority.HIGH] == [factors[1]]
+
+
+# ==================== merge_context_snapshots ====================
+
+def test_merge_empty_and_single():
+    assert isinstance(merge_context_snapshots([]), ContextSnapshot)
+    snapshot = make_snapshot()
+    assert merge_context_snapshots([snapshot]) is snapshot
+
+
+def test_merge_weights_metrics():
+    merged = merge_context_snapshots(
+        [make_snapshot(quality=1.0, confidence=0.0), make_snapshot(quality=0.0, confidence=1.0)],
+        weights=[3.0, 1.0],
+    )
+    assert merged.overall_context_quality == pytest.approx(0.75)
+    assert merged.context_confidence == pytest.approx(0.25)
+
+
+def test_merge_zero_weights_fall_back_to_equal_weights():
+    merged = merge_context_snapshots(
+        [make_snapshot(quality=1.0), make_snapshot(quality=0.0)], weights=[0.0, 0.0]
+    )
+    assert merged.overall_context_quality == pytest.approx(0.5)
+
+
+def test_merge_keeps_highest_confidence_factor_per_key():
+    weak = create_context_factor(ContextType.TASK, "focus", "email", confidence=0.3)
+    strong = create_context_factor(ContextType.TASK, "focus", "coding", confidence=0.8)
+    mood = create_context_factor(ContextType.EMOTIONAL, "mood", "calm")
+    first = make_snapshot(context_factors=[weak, mood], situation_summary="morning",
+                          key_considerations=["deadline"])
+    second = make_snapshot(context_factors=[strong], situation_summary="standup",
+                           key_considerations=["deadline", "meeting"])
+
+    merged = merge_context_snapshots([first, second, first])
+    # A winning factor takes the slot of the key's first occurrence
+    assert merged.context_factors == (strong, mood)
+    assert merged.factor_index[(ContextType.TASK, "focus")] is strong
+    assert merged.situation_summary == "morning; standup; morning"
+    assert sorted(merged.key_considerations) == ["deadline", "meeting"]
+
+
+# ==================== Anomaly detection ====================
+
+def test_anomaly_baseline_matches_batch_statistics():
+    rng = np.random.default_rng(0)
+    history = [make_snapshot(*rng.random(3)) for _ in range(50)]
+    baseline = ContextAnomalyBaseline()
+    for snapshot in history:
+        baseline.update(snapshot)
+
+    values = np.array([
+        [s.overall_context_quality, s.context_confidence, s.context_stability] for s in history
+    ])
+    assert baseline.n == 50
+    np.testing.assert_allclose(baseline.mean, values.mean(axis=0))
+    np.testing.assert_allclose(baseline.std(), values.std(axis=0))
+
+    current = make_snapshot(quality=5.0)
+    streaming = detect_context_anomalies(current, baseline)
+    batch = detect_context_anomalies(current, history)
+    assert [(a["type"], a["severity"]) for a in streaming] == [(a["type"], a["severity"]) for a in batch]
+    assert streaming[0]["expected_value"] == pytest.approx(batch[0]["expected_value"])
+
+
+def test_anomaly_baseline_empty():
+    baseline = ContextAnomalyBaseline()
+    assert baseline.std() == [0.0, 0.0, 0.0]
+    assert baseline.check(make_snapshot()) == []
+
+
+def test_anomaly_absolute_threshold_below_min_samples():
+    history = [make_snapshot(quality=0.5)] * (ANOMALY_MIN_SAMPLES - 1)
+    anomalies = detect_context_anomalies(make_snapshot(quality=0.9), history)
+    assert [a["type"] for a in anomalies] == ["context_quality_anomaly"]
+    assert anomalies[0]["severity"] == "medium"
+
+
+def test_anomaly_z_score_above_min_samples():
+    history = [make_snapshot(quality=q) for q in [0.4, 0.6] * ANOMALY_MIN_SAMPLES]
+    assert detect_context_anomalies(make_snapshot(quality=0.65), history) == []
+    anomalies = detect_context_anomalies(make_snapshot(quality=0.9), history)
+    assert anomalies[0]["type"] == "context_quality_anomaly"
+    assert anomalies[0]["severity"] == "high"
+
+
+# ==================== Insights cache ====================
+
+def test_insights_from_rules():
+    snapshot = make_snapshot(
+        quality=0.9,
+        cognitive=CognitiveContext(attention_state="scattered"),
+        emotional=EmotionalContext(stress_level="overwhelming"),
+        context_factors=make_factors(),
+    )
+    insights = generate_context_insights(snapshot)
+    assert insights["primary_context_drivers"] == ["temporal: time_of_day", "social: team_size"]
+    assert insights["context_quality_assessment"].startswith("Excellent")
+    assert insights["attention_recommendations"] == [
+        "Consider focused work techniques to improve concentration"
+    ]
+    assert insights["mood_context_notes"] == [
+        "High stress detected - consider stress reduction techniques"
+    ]
+
+
+def test_insights_are_cached_and_copied():
+    snapshot = make_snapshot(context_factors=make_factors())
+    first = generate_context_insights(snapshot)
+    first["primary_context_drivers"].append("mutated")
+    second = generate_context_insights(snapshot)
+    assert "mutated" not in second["primary_context_drivers"]
+    assert len(schemas._insights_cache) == 1
+
+
+def test_insights_follow_snapshot_changes():
+    snapshot = make_snapshot(quality=0.9)
+    assert generate_context_insights(snapshot)["context_quality_assessment"].startswith("Excellent")
+    snapshot.overall_context_quality = 0.1
+    assert generate_context_insights(snapshot)["context_quality_assessment"].startswith("Poor")
+
+
+def test_insights_refresh_when_factors_replaced_with_same_count():
+    critical = dict(priority=ContextPriority.CRITICAL)
+    snapshot = make_snapshot(context_factors=[create_context_factor(ContextType.TASK, "a", 1, **critical)])
+    assert generate_context_insights(snapshot)["primary_context_drivers"] == ["task: a"]
+
+    snapshot.context_factors = [create_context_factor(ContextType.TASK, "b", 1, **critical)]
+    assert generate_context_insights(snapshot)["primary_context_drivers"] == ["task: b"]
+
+
+def test_insights_keyed_on_content_not_snapshot_id():
+    critical = dict(priority=ContextPriority.CRITICAL)
+    first = make_snapshot(context_factors=[create_context_factor(ContextType.TASK, "a", 1, **critical)])
+    second = make_snapshot(id=first.id,
+                           context_factors=[create_context_factor(ContextType.SOCIAL, "a", 1, **critical)])
+    assert generate_context_insights(first)["primary_context_drivers"] == ["task: a"]
+    assert generate_context_insights(second)["primary_context_drivers"] == ["social: a"]
+
+    # Snapshots with the same content share one entry
+    generate_context_insights(make_snapshot(context_factors=list(first.context_factors)))
+    assert len(schemas._insights_cache) == 2
+
+
+def test_insights_see_factors_added_after_first_call():
+    snapshot = make_snapshot()
+    assert generate_context_insights(snapshot)["primary_context_drivers"] == []
+
+    snapshot.context_factors += (
+        create_context_factor(ContextType.TASK, "a", 1, priority=ContextPriority.CRITICAL),
+    )
+    assert generate_context_insights(snapshot)["primary_context_drivers"] == ["task: a"]
@@ -0,0 +1,378 @@
+import asyncio
+import gc
+from collections import OrderedDict
+
+import pytest
+
+from pact_hx.primitives.creative_synthesis import manager
+from pact_hx.primitives.creative_synthesis.manager import (
+    CreativeModality,
+    CreativeSynthesisManager,
+    StudentCreativeProfile,
+    _lru_get,
+    _lru_put,
+    _MicroBatcher,
+    mean_engagement,
+)
+
+
+def make_profile(engagement_history=None):
+    return StudentCreativeProfile(
+        preferred_modalities=[],
+        learning_styles=[],
+        engagement_history={"fractions": 0.4, "geometry": 0.8} if engagement_history is None else engagement_history,
+        creative_strengths=[],
+        challenge_areas=[],
+        interest_themes=["space"],
+        attention_span=20,
+        collaboration_preference="small_group",
+    )
+
+
+class FakeGoalPrimitive:
+    def __init__(self):
+        self.calls = 0
+
+    async def analyze_learning_objective(self, objective):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return {"objective": objective, "call": self.calls, "concepts": ["fractions"]}
+
+
+# ==================== Profile engagement values ====================
+
+def test_engagement_values_track_history_changes():
+    profile = make_profile()
+    assert profile.engagement_values().tolist() == [0.4, 0.8]
+
+    profile.engagement_history["fractions"] = 1.0
+    assert profile.engagement_values().tolist() == [1.0, 0.8]
+
+    profile.engagement_history["algebra"] = 0.6
+    assert profile.engagement_values().tolist() == [1.0, 0.8, 0.6]
+
+
+def test_engagement_values_empty_history():
+    assert make_profile({}).engagement_values().shape == (0,)
+
+
+def test_mean_engagement_defaults_to_neutral():
+    assert mean_engagement(make_profile({}).engagement_values()) == 0.5
+    assert mean_engagement(make_profile().engagement_values()) == pytest.approx(0.6)
+
+
+def test_modalities_display_follows_reassignment():
+    profile = make_profile()
+    profile.preferred_modalities = [CreativeModality.STORY, CreativeModality.GAME]
+    assert profile.preferred_modalities == (CreativeModality.STORY, CreativeModality.GAME)
+    assert profile.preferred_modalities_display() == "story, game"
+
+    profile.preferred_modalities = [CreativeModality.VISUAL]
+    assert profile.preferred_modalities_display() == "visual"
+
+
+def test_profile_equality_and_repr_ignore_display_cache():
+    first, second = make_profile(), make_profile()
+    first.preferred_modalities_display()
+    assert first == second
+    assert "_modalities_display" not in repr(first)
+
+
+# ==================== Learning objective analysis ====================
+
+@pytest.mark.parametrize("objective, learning_types", [
+    ("Understanding how fractions work", ["conceptual"]),
+    ("Explain photosynthesis", ["conceptual"]),
+    ("Solve linear equations", ["procedural"]),
+    ("Designing a bridge", ["creative"]),
+    ("Compare two ecosystems", ["critical_thinking"]),
+    ("Explain, then apply, the theorem", ["conceptual", "procedural"]),
+    ("Eat an apple", []),
+])
+def test_learning_types_match_trigger_substrings(objective, learning_types):
+    engine = CreativeSynthesisManager(seed=1)
+    analysis = asyncio.run(engine._analyze_learning_objective(objective, {}))
+    assert analysis["learning_types"] == learning_types
+
+
+def test_objective_analysis_is_cached_and_copied():
+    engine = CreativeSynthesisManager(seed=1)
+    first = asyncio.run(engine._analyze_learning_objective("Solve equations", {"subject": "math"}))
+    first["learning_types"].append("mutated")
+    second = asyncio.run(engine._analyze_learning_objective("Solve equations", {"subject": "math"}))
+    assert second["learning_types"] == ["procedural"]
+    assert len(engine._objective_cache) == 1
+
+
+# ==================== LRU and TTL caches ====================
+
+def test_lru_put_evicts_least_recently_used():
+    cache = OrderedDict()
+    _lru_put(cache, "a", 1, max_size=2)
+    _lru_put(cache, "b", 2, max_size=2)
+    assert _lru_get(cache, "a") == 1  # "b" is now least recently used
+    _lru_put(cache, "c", 3, max_size=2)
+    assert list(cache) == ["a", "c"]
+    assert _lru_get(cache, "b") is None
+
+
+
+def test_goal_analysis_cache_shares_results():
+    engine = CreativeSynthesisManager(seed=1)
+    goal = FakeGoalPrimitive()
+    engine.set_goal_primitive(goal)
+
+    async def run():
+        return await asyncio.gather(
+            engine.collaborate_with_goal_primitive("Add fractions"),
+            engine.collaborate_with_goal_primitive("Add fractions"),
+        )
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert first is not second
+    assert goal.calls == 1
+
+
+def test_goal_analysis_results_are_deep_copies():
+    engine = CreativeSynthesisManager(seed=1)
+    engine.set_goal_primitive(FakeGoalPrimitive())
+    first = asyncio.run(engine.collaborate_with_goal_primitive("Add fractions"))
+    first["concepts"].append("mutated")
+    second = asyncio.run(engine.collaborate_with_goal_primitive("Add fractions"))
+    assert second["concepts"] == ["fractions"]
+
+
+def test_goal_analysis_cache_expires(monkeypatch):
+    engine = CreativeSynthesisManager(seed=1)
+    goal = FakeGoalPrimitive()
+    engine.set_goal_primitive(goal)
+    now = [1000.0]
+    monkeypatch.setattr(manager.time, "monotonic", lambda: now[0])
+
+    asyncio.run(engine.collaborate_with_goal_primitive("Add fractions"))
+    now[0] += manager.GOAL_ANALYSIS_TTL_SECONDS / 2
+    asyncio.run(engine.collaborate_with_goal_primitive("Add fractions"))
+    assert goal.calls == 1
+
+    now[0] += manager.GOAL_ANALYSIS_TTL_SECONDS
+    result = asyncio.run(engine.collaborate_with_goal_primitive("Add fractions"))
+    assert goal.calls == 2
+    assert result["call"] == 2
+
+
+def test_goal_analysis_failures_are_not_cached():
+    engine = CreativeSynthesisManager(seed=1)
+
+    class FlakyGoalPrimitive(FakeGoalPrimitive):
+        async def analyze_learning_objective(self, objective):
+            self.calls += 1
+            if self.calls == 1:
+                raise RuntimeError("goal primitive unavailable")
+            return {"objective": objective}
+
+    engine.set_goal_primitive(FlakyGoalPrimitive())
+    with pytest.raises(RuntimeError):
+        asyncio.run(engine.collaborate_with_goal_primitive("Add fractions"))
+    assert asyncio.run(engine.collaborate_with_goal_primitive("Add fractions")) == {"objective": "Add fractions"}
+
+
+def test_goal_analysis_in_flight_is_not_shared_across_event_loops():
+    engine = CreativeSynthesisManager(seed=1)
+
+    class StalledGoalPrimitive(FakeGoalPrimitive):
+        async def analyze_learning_objective(self, objective):
+            self.calls += 1
+            if self.calls == 1:
+                await asyncio.sleep(10)
+            return {"objective": objective}
+
+    goal = StalledGoalPrimitive()
+    engine.set_goal_primitive(goal)
+    stalled_loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            stalled_loop.run_until_complete(
+                asyncio.wait_for(engine.collaborate_with_goal_primitive("Add fractions"), 0.01)
+            )
+        result = asyncio.run(engine.collaborate_with_goal_primitive("Add fractions"))
+    finally:
+        stalled = asyncio.all_tasks(stalled_loop)
+        for task in stalled:
+            task.cancel()
+        stalled_loop.run_until_complete(asyncio.gather(*stalled, return_exceptions=True))
+        stalled_loop.close()
+    assert result == {"objective": "Add fractions"}
+    assert goal.calls == 2
+
+
+# ==================== Effectiveness tracking ====================
+
+def evaluate(engine, experience_id, engagement, learning):
+    return asyncio.run(engine.evaluate_experience_effectiveness(
+        experience_id,
+        {"engagement_scores": [engagement]},
+        {"assessment_results": {"average_score": learning}},
+    ))
+
+
+def test_report_uses_running_totals():
+    engine = CreativeSynthesisManager(seed=1)
+    evaluate(engine, "a", 0.9, 0.8)
+    evaluate(engine, "b", 0.5, 0.4)
+    report = asyncio.run(engine.generate_creativity_report("week"))
+    assert report["summary_metrics"]["average_engagement"] == pytest.approx(0.7)
+    assert report["summary_metrics"]["total_experiences_created"] == 2
+    assert report["successful_approaches"][0] == "High engagement creative experiences: 1 out of 2"
+
+
+def test_reevaluating_an_experience_replaces_its_totals():
+    engine = CreativeSynthesisManager(seed=1)
+    evaluate(engine, "a", 0.9, 0.8)
+    evaluate(engine, "a", 0.5, 0.4)
+    report = asyncio.run(engine.generate_creativity_report("week"))
+    assert report["summary_metrics"]["average_engagement"] == pytest.approx(0.5)
+    assert report["summary_metrics"]["total_experiences_created"] == 1
+    assert engine.experience_effectiveness["a"]["engagement_level"] == 0.5
+
+
+def test_experience_effectiveness_can_be_assigned():
+    engine = CreativeSynthesisManager(seed=1)
+    evaluate(engine, "a", 0.9, 0.8)
+    engine.experience_effectiveness = {
+        "b": {"engagement_level": 0.6, "learning_achievement": 0.2},
+        "c": {"engagement_level": 0.2},
+    }
+    assert set(engine.experience_effectiveness) == {"b", "c"}
+    assert engine.experience_effectiveness["c"]["learning_achievement"] == 0.0
+    assert engine.effectiveness_array("engagement_level").tolist() == [0.6, 0.2]
+    report = asyncio.run(engine.generate_creativity_report("week"))
+    assert report["summary_metrics"]["average_engagement"] == pytest.approx(0.4)
+    assert report["summary_metrics"]["total_experiences_created"] == 2
+
+    engine.experience_effectiveness = {}
+    assert asyncio.run(engine.generate_creativity_report("week"))["summary_metrics"] == {}
+
+
+# ==================== Refinement ====================
+
+def refine(engine, engagement, modality, **feedback):
+    effectiveness = {"engagement_level": engagement, "learning_achievement": 0.5}
+    return asyncio.run(engine.refine_creative_approach(
+        "student_1", effectiveness, dict(preferred_modality=modality, **feedback)
+    ))
+
+
+def test_response_patterns_keep_score_lists():
+    engine = CreativeSynthesisManager(seed=1)
+    refine(engine, 0.9, "story", activity_preferences={"drawing": 0.8})
+    refine(engine, 0.6, "story", activity_preferences={"drawing": 0.4})
+    patterns = engine.student_response_patterns["student_1"]
+    assert patterns["effective_modalities"] == {"story": [0.9, 0.6]}
+    assert patterns["preference_trends"] == {"drawing": [0.8, 0.4]}
+
+
+def test_prioritized_modalities_use_running_means():
+    engine = CreativeSynthesisManager(seed=1)
+    assert refine(engine, 0.9, "story")["prioritize_modalities"] == ["story"]
+    assert refine(engine, 0.4, "story")["prioritize_modalities"] == []
+
+
+def test_ineffective_modalities_are_avoided():
+    engine = CreativeSynthesisManager(seed=1)
+    refine(engine, 0.9, "story")
+    recommendations = refine(engine, 0.1, "game", least_engaging_elements=["long_lecture"])
+    assert recommendations["prioritize_modalities"] == ["story"]
+    assert recommendations["avoid_approaches"] == ["game", "long_lecture"]
+
+
+def test_running_means_seeded_from_existing_patterns():
+    engine = CreativeSynthesisManager(seed=1)
+    engine.student_response_patterns["student_1"] = {
+        "effective_modalities": {"game": [0.9, 0.9]},
+        "preference_trends": {},
+        "engagement_patterns": {},
+        "learning_style_effectiveness": {},
+    }
+    assert refine(engine, 0.6, "story")["prioritize_modalities"] == ["game"]
+
+
+# ==================== _MicroBatcher ====================
+
+def test_micro_batcher_coalesces_requests():
+    batches = []
+
+    async def batch_fn(items):
+        batches.append(list(items))
+        return [item * 2 for item in items]
+
+    async def run():
+        batcher = _MicroBatcher(batch_fn, max_size=10, window=0.01)
+        return await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+
+    assert asyncio.run(run()) == [0, 2, 4]
+    assert batches == [[0, 1, 2]]
+
+
+def test_micro_batcher_flushes_at_max_size():
+    batches = []
+
+    async def batch_fn(items):
+        batches.append(list(items))
+        return items
+
+    async def run():
+        batcher = _MicroBatcher(batch_fn, max_size=2, window=10)
+        return await asyncio.gather(*(batcher.submit(i) for i in range(4)))
+
+    assert asyncio.run(run()) == [0, 1, 2, 3]
+    assert batches == [[0, 1], [2, 3]]
+
+
+def test_micro_batcher_propagates_errors():
+    async def batch_fn(items):
+        return items[:-1]  # one result short
+
+    async def run():
+        batcher = _MicroBatcher(batch_fn, window=0)
+        return await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_micro_batcher_keeps_dispatch_alive_until_done():
+    async def batch_fn(items):
+        gc.collect()
+        await asyncio.sleep(0.01)
+        gc.collect()
+        return items
+
+    async def run():
+        batcher = _MicroBatcher(batch_fn, max_size=1)
+        future = batcher.submit("a")
+        assert len(batcher._tasks) == 1
+        result = await asyncio.wait_for(future, timeout=1)
+        await asyncio.sleep(0)
+        return result, batcher._tasks
+
+    result, tasks = asyncio.run(run())
+    assert result == "a"
+    assert not tasks
+
+
+def test_micro_batcher_cancels_futures_when_dispatch_is_cancelled():
+    async def batch_fn(items):
+        await asyncio.sleep(10)
+        return items
+
+    async def run():
+        batcher = _MicroBatcher(batch_fn, window=0)
+        future = batcher.submit("a")
+        await asyncio.sleep(0.01)
+        for task in list(batcher._tasks):
+            task.cancel()
+        await asyncio.sleep(0.01)
+        return future
+
+    assert asyncio.run(run()).cancelled()
@@ -0,0 +1,383 @@
+import warnings
+
+import msgspec
+import numpy as np
+import pytest
+
+with warnings.catch_warnings():
+    # The schemas still use class-based pydantic Config
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from pact_hx.primitives.creative_synthesis import schemas
+    from pact_hx.primitives.creative_synthesis.schemas import (
+        CREATIVE_JSON_ENCODER,
+        CREATIVITY_BOOST,
+        MODALITY_COUNT,
+        CreativeElementSchema,
+        CreativeMode,
+        CreativeOutputType,
+        CreativeQualityAssessmentSchema,
+        CreativeSynthesisBatch,
+        CreativeSynthesisOutputSchema,
+        CreativityLevel,
+        EngagementFactor,
+        ExperientialLearningSchema,
+        LearningModality,
+        StudentEngagementFeedbackSchema,
+        calculate_engagement_potential,
+        calculate_engagement_potential_batch,
+        create_creative_context,
+        creative_json_decoder,
+        generate_adaptation_strategies,
+        parse_creative_synthesis_request,
+    )
+
+
+def make_element(**overrides):
+    fields = dict(
+        element_type="story_hook",
+        title="The Fraction Forest",
+        description="A walk through a forest split into equal parts",
+        content={"scenes": 3},
+        engagement_factors=[EngagementFactor.CURIOSITY, EngagementFactor.HUMOR],
+        modalities_addressed=[LearningModality.VISUAL],
+        originality_score=0.8,
+    )
+    fields.update(overrides)
+    return CreativeElementSchema(**fields)
+
+
+def make_output(**overrides):
+    fields = dict(
+        request_id="request_1",
+        output_type="story",
+        primary_content={"story": "Once upon a fraction"},
+        multi_modal_richness={"visual": 0.6, "kinesthetic": 0.4},
+    )
+    fields.update(overrides)
+    return CreativeSynthesisOutputSchema(**fields)
+
+
+def make_request_payload():
+    return {
+        "request_type": "storytelling",
+        "creative_context": {
+            "subject_area": "math",
+            "learning_objectives": ["add fractions"],
+            "target_concepts": ["fractions"],
+            "age_group": "grade_4",
+            "prior_knowledge": {"division": "basic"},
+            "preferred_modalities": ["visual"],
+        },
+        "output_preferences": ["story", "game"],
+        "must_include_elements": ["dragon"],
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_request_cache():
+    schemas._request_cache.clear()
+    yield
+    schemas._request_cache.clear()
+
+
+# ==================== CodedEnum ====================
+
+def test_coded_enum_parse_accepts_codes_members_and_ints():
+    assert CreativityLevel.parse("high") is CreativityLevel.HIGH
+    assert CreativityLevel.parse(CreativityLevel.HIGH) is CreativityLevel.HIGH
+    assert CreativityLevel.parse(2) is CreativityLevel.HIGH
+
+
+def test_coded_enum_parse_rejects_unknown_codes():
+    with pytest.raises(ValueError):
+        CreativityLevel.parse("extreme")
+
+
+def test_coded_enum_constructor_accepts_codes():
+    assert CreativeMode("storytelling") is CreativeMode.STORYTELLING
+    assert CreativeMode(0) is CreativeMode.STORYTELLING
+    with pytest.raises(ValueError):
+        CreativeMode("juggling")
+
+
+def test_coded_enum_code_and_str():
+    assert LearningModality.SPATIAL.code == "spatial"
+    assert str(EngagementFactor.SOCIAL_CONNECTION) == "social_connection"
+
+
+def test_coded_enum_members_are_plain_ints():
+    output = make_output()
+    assert output.output_type is CreativeOutputType.STORY
+    assert output.output_type.value == 0
+    assert output.output_type == 0
+    assert output.output_type != "story"
+    assert output.output_type.code == "story"
+    assert {CreativeOutputType.STORY: "a"}[0] == "a"
+
+
+
+def test_model_json_writes_enum_codes():
+    output = make_output(supporting_elements=[make_element()])
+    data = msgspec.json.decode(output.model_dump_json())
+    assert data["output_type"] == "story"
+    assert data["supporting_elements"][0]["engagement_factors"] == ["curiosity", "humor"]
+    assert data["supporting_elements"][0]["modalities_addressed"] == ["visual"]
+
+
+# ==================== msgspec structs ====================
+
+def test_struct_json_round_trip_uses_enum_codes():
+    element = make_element()
+    encoded = CREATIVE_JSON_ENCODER.encode(element)
+    assert msgspec.json.decode(encoded)["engagement_factors"] == ["curiosity", "humor"]
+
+    decoded = creative_json_decoder(CreativeElementSchema).decode(encoded)
+    assert CREATIVE_JSON_ENCODER.encode(decoded) == encoded
+    assert decoded.engagement_factors == [EngagementFactor.CURIOSITY, EngagementFactor.HUMOR]
+
+
+def test_struct_decoder_accepts_integer_enum_values():
+    data = msgspec.to_builtins(make_element())
+    data["engagement_factors"] = [int(EngagementFactor.MASTERY)]
+    decoded = creative_json_decoder(CreativeElementSchema).decode(msgspec.json.encode(data))
+    assert decoded.engagement_factors == [EngagementFactor.MASTERY]
+
+
+def test_struct_decoder_rejects_unknown_codes():
+    data = CREATIVE_JSON_ENCODER.encode(make_element()).replace(b'"humor"', b'"boredom"')
+    with pytest.raises(msgspec.ValidationError):
+        creative_json_decoder(CreativeElementSchema).decode(data)
+
+
+def test_struct_decoder_validates_scores():
+    data = CREATIVE_JSON_ENCODER.encode(make_element(originality_score=1.5))
+    with pytest.raises(msgspec.ValidationError):
+        creative_json_decoder(CreativeElementSchema).decode(data)
+
+
+def test_struct_without_enum_fields_round_trips():
+    assessment = CreativeQualityAssessmentSchema(
+        output_id="creative_output_1",
+        assessor_type="teacher",
+        originality_score=0.7,
+        relevance_score=0.8,
+        engagement_score=0.9,
+        feasibility_score=0.6,
+        educational_value=0.85,
+        strengths=("clear narrative",),
+    )
+    decoder = creative_json_decoder(CreativeQualityAssessmentSchema)
+    assert isinstance(decoder, msgspec.json.Decoder)
+    assert decoder.decode(CREATIVE_JSON_ENCODER.encode(assessment)) == assessment
+
+
+def test_struct_list_encoding():
+    feedback = StudentEngagementFeedbackSchema(
+        output_id="creative_output_1",
+        interest_level=0.9,
+        fun_factor=0.8,
+        challenge_appropriateness=0.7,
+        clarity=0.9,
+        understanding_improvement=0.6,
+        memorability=0.8,
+        motivation_impact=0.7,
+        time_spent=None,
+    )
+    data = msgspec.json.decode(CREATIVE_JSON_ENCODER.encode([make_element(), feedback]))
+    assert data[0]["engagement_factors"] == ["curiosity", "humor"]
+    assert data[1]["fun_factor"] == 0.8
+
+
+def test_struct_convert_accepts_codes():
+    experience = ExperientialLearningSchema._coerce({
+        "experience_title": "Fraction pizza",
+        "experience_type": "cooking",
+        "sensory_engagement": ["kinesthetic", "visual"],
+        "physical_activities": [],
+        "exploration_opportunities": [],
+        "skill_practice": [],
+        "concept_discovery": [],
+        "reflection_prompts": [],
+        "time_structure": {},
+    })
+    assert experience.sensory_engagement == [LearningModality.KINESTHETIC, LearningModality.VISUAL]
+
+
+def test_model_round_trip_with_struct_elements():
+    output = make_output(supporting_elements=[make_element()])
+    restored = CreativeSynthesisOutputSchema.model_validate_json(output.model_dump_json())
+    assert restored.output_type is CreativeOutputType.STORY
+    assert restored.supporting_elements[0].engagement_factors == [
+        EngagementFactor.CURIOSITY, EngagementFactor.HUMOR
+    ]
+
+
+def test_struct_encodes_numpy_scalars_in_content():
+    element = make_element(content={"score": np.float64(0.25), "counts": np.arange(2)})
+    data = msgspec.json.decode(CREATIVE_JSON_ENCODER.encode(element))
+    assert data["content"] == {"score": 0.25, "counts": [0, 1]}
+
+
+# ==================== ModalityVector ====================
+
+def test_modality_vector_from_mapping():
+    output = make_output()
+    assert output.multi_modal_richness.shape == (MODALITY_COUNT,)
+    assert output.multi_modal_richness[LearningModality.VISUAL] == 0.6
+    assert output.multi_modal_richness[LearningModality.KINESTHETIC] == 0.4
+
+
+def test_modality_vector_from_sequence_checks_length():
+    richness = [0.1] * MODALITY_COUNT
+    assert make_output(multi_modal_richness=richness).multi_modal_richness.tolist() == richness
+    with pytest.raises(ValueError):
+        make_output(multi_modal_richness=[0.1, 0.2])
+
+
+def test_modality_vector_json_keeps_addressed_modalities():
+    data = msgspec.json.decode(make_output().model_dump_json())
+    assert data["multi_modal_richness"] == {"visual": 0.6, "kinesthetic": 0.4}
+
+
+def test_modality_vector_default_is_zero():
+    output = CreativeSynthesisOutputSchema(request_id="r", output_type="game", primary_content={"a": 1})
+    assert not output.multi_modal_richness.any()
+
+
+def test_output_equality_compares_richness_arrays():
+    output = make_output()
+    assert output == output.model_copy()
+    assert output == CreativeSynthesisOutputSchema.model_validate_json(output.model_dump_json())
+    assert output != make_output(multi_modal_richness={"visual": 0.5})
+    assert output != make_output(request_id="request_2")
+
+
+# ==================== CreativeSynthesisBatch ====================
+
+def test_batch_columns():
+    outputs = [
+        make_output(engagement_prediction={"overall": 0.9}, originality_analysis={"score": 0.7}),
+        make_output(output_type="game"),
+    ]
+    batch = CreativeSynthesisBatch(outputs)
+    assert len(batch) == 2
+    assert batch.output_type().tolist() == [CreativeOutputType.STORY, CreativeOutputType.GAME]
+    assert batch.engagement_score().tolist() == [0.9, 0.5]
+    assert batch.originality_score().tolist() == [0.7, 0.5]
+    assert batch.multi_modal_richness().shape == (2, MODALITY_COUNT)
+
+
+# ==================== Request cache ====================
+
+def test_request_cache_reuses_instance_for_same_payload():
+    payload = make_request_payload()
+    first = parse_creative_synthesis_request(payload)
+    reordered = dict(reversed(list(payload.items())))
+    assert parse_creative_synthesis_request(reordered) is first
+    assert len(schemas._request_cache) == 1
+
+
+def test_request_cache_distinguishes_payloads():
+    payload = make_request_payload()
+    first = parse_creative_synthesis_request(payload)
+    payload["avoid_elements"] = ["spiders"]
+    assert parse_creative_synthesis_request(payload) is not first
+
+
+def test_request_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(schemas, "REQUEST_CACHE_MAX_SIZE", 2)
+    payloads = []
+    for i in range(3):
+        payload = make_request_payload()
+        payload["must_include_elements"] = [f"element_{i}"]
+        payloads.append(payload)
+    first = parse_creative_synthesis_request(payloads[0])
+    parse_creative_synthesis_request(payloads[1])
+    parse_creative_synthesis_request(payloads[2])
+    assert len(schemas._request_cache) == 2
+    assert parse_creative_synthesis_request(payloads[0]) is not first
+
+
+def test_cached_request_cannot_be_mutated():
+    request = parse_creative_synthesis_request(make_request_payload())
+    assert request.output_preferences == (CreativeOutputType.STORY, CreativeOutputType.GAME)
+    assert isinstance(request.must_include_elements, tuple)
+    assert isinstance(request.creative_context.learning_objectives, tuple)
+    with pytest.raises(AttributeError):
+        request.must_include_elements.append("unicorn")
+    with pytest.raises(TypeError):
+        request.creative_context.prior_knowledge["fractions"] = "expert"
+    with pytest.raises(Exception):
+        request.avoid_elements = ("spiders",)
+
+
+def test_cached_request_json_round_trip():
+    request = parse_creative_synthesis_request(make_request_payload())
+    data = msgspec.json.decode(request.model_dump_json())
+    assert data["creative_context"]["prior_knowledge"] == {"division": "basic"}
+    assert data["output_preferences"] == ["story", "game"]
+    assert type(request).model_validate_json(request.model_dump_json()) == request
+
+
+# ==================== Engagement potential ====================
+
+def test_engagement_potential():
+    score = calculate_engagement_potential(
+        [EngagementFactor.CURIOSITY], [LearningModality.VISUAL], CreativityLevel.HIGH
+    )
+    assert score == pytest.approx(0.5 + 0.1 + 0.05 + 0.2)
+    assert calculate_engagement_potential([], [], "transformative") == pytest.approx(0.9)
+    assert calculate_engagement_potential([EngagementFactor.HUMOR] * 10, [], "subtle") == 1.0
+
+
+@pytest.mark.parametrize("level", ["unknown", None, 99, -1])
+def test_engagement_potential_unknown_level_gets_default_boost(level):
+    assert calculate_engagement_potential([], [], level) == pytest.approx(0.5 + 0.1)
+
+
+def test_engagement_potential_batch_matches_scalar():
+    rng = np.random.default_rng(0)
+    count = schemas.ENGAGEMENT_KERNEL_MIN_BATCH + 10  # exercises the compiled kernel when available
+    factors = rng.integers(0, 6, count)
+    modalities = rng.integers(0, 6, count)
+    levels = rng.integers(0, len(CREATIVITY_BOOST), count)
+
+    result = calculate_engagement_potential_batch(factors, modalities, levels)
+    expected = [
+        calculate_engagement_potential([None] * f, [None] * m, CreativityLevel(level))
+        for f, m, level in zip(factors[:50], modalities[:50], levels[:50])
+    ]
+    assert result.shape == (count,)
+    np.testing.assert_allclose(result[:50], expected)
+    np.testing.assert_allclose(
+        calculate_engagement_potential_batch(factors[:50], modalities[:50], levels[:50]), expected
+    )
+
+
+@pytest.mark.parametrize("level", [-1, len(CREATIVITY_BOOST)])
+def test_engagement_potential_batch_rejects_out_of_range_levels(level):
+    with pytest.raises(ValueError):
+        calculate_engagement_potential_batch([1, 1], [1, 1], [0, level])
+
+
+# ==================== Adaptation strategies ====================
+
+def adapt(primary_content, **context_fields):
+    context = create_creative_context("math", ["fractions"], "grade 4", **context_fields)
+    output = make_output(primary_content=dict(primary_content, subject_area="math"))
+    return generate_adaptation_strategies(output, [context])["grade 4_math"]
+
+
+@pytest.mark.parametrize("level", [CreativityLevel.SUBTLE, int(CreativityLevel.SUBTLE), "subtle"])
+def test_adaptation_skips_matching_creativity_level(level):
+    reduce = schemas._CREATIVITY_STRATEGIES[CreativityLevel.SUBTLE]
+    assert reduce not in adapt({"creativity_level": level}, creativity_level=CreativityLevel.SUBTLE)
+    assert reduce in adapt({"creativity_level": "high"}, creativity_level=CreativityLevel.SUBTLE)
+    assert reduce in adapt({}, creativity_level=CreativityLevel.SUBTLE)
+
+
+def test_adaptation_adds_strategies_for_unaddressed_modalities():
+    addressed = adapt({}, preferred_modalities=[LearningModality.VISUAL])
+    missing = adapt({}, preferred_modalities=[LearningModality.VISUAL, LearningModality.AUDITORY])
+    assert missing[:len(addressed)] == addressed
+    assert len(missing) == len(addressed) + 1